@@ -1,9 +1,40 @@
-from fastapi import FastAPI
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
 from ..config import settings
+from .services import engine_pool
+from ..models.data.data_registry import data_registry
+from ..utils.timing import start_timings
 from .routes import router
 
+timing_logger = logging.getLogger("backend.api.timing")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # dane referencyjne wczytane (i tablice stóp zbudowane) przed pierwszym żądaniem
+    await run_in_threadpool(
+        data_registry.configure,
+        settings.macro_data_path or None,
+        settings.regression_data_path or None,
+        settings.life_expectancy_table_path or None,
+    )
+    data_registry.watch(settings.data_watch_interval_seconds)
+    # procesy puli startują i rozgrzewają się przed pierwszym żądaniem
+    await run_in_threadpool(engine_pool.start)
+    app.state.ready = True
+    yield
+    app.state.ready = False
+    engine_pool.shutdown()
+    data_registry.stop()
+
+
 app: FastAPI = FastAPI(
     title=settings.title,
     version=settings.version,
@@ -12,11 +43,35 @@ app: FastAPI = FastAPI(
         "email": settings.contact_email,
     },
     openapi_url=None if not settings.environment.docs_available() else "/openapi.json",
+    lifespan=lifespan,
 )
 
 app.include_router(router)
 
 
+async def server_timing(request: Request, call_next):
+    """Czasy faz żądania w nagłówku Server-Timing i w linii logu JSON (przy timing_enabled)."""
+    timings = start_timings()
+    start = time.perf_counter()
+    response = await call_next(request)
+    total_ms = (time.perf_counter() - start) * 1000.0
+
+    response.headers["Server-Timing"] = timings.server_timing_header(total_ms)
+    timing_logger.info(json.dumps({
+        "event": "request_timing",
+        "method": request.method,
+        "path": request.url.path,
+        "status": response.status_code,
+        "total_ms": round(total_ms, 3),
+        "phases_ms": {name: round(ms, 3) for name, ms in timings.phases.items()},
+    }))
+    return response
+
+
+if settings.timing_enabled:
+    app.middleware("http")(server_timing)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_allow_origins,
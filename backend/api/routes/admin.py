@@ -0,0 +1,39 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+
+from backend.config import settings
+from backend.models.data.data_registry import data_registry
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Admin endpoints exist only when `admin_token` is configured (404 otherwise) and
+    require it in the X-Admin-Token header (403 when missing or wrong).
+    """
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token.encode(), settings.admin_token.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Invalid or missing admin token")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+@router.post("/data/reload", summary="Reload reference data files")
+async def reload_data(
+    force: bool = Query(False, description="Re-read the files even if their mtime / size did not change"),
+) -> dict:
+    """
+    Loads the macro table and the salary regressions again and swaps the new version in
+    when the content changed. A malformed file leaves the current version serving (422).
+    """
+    try:
+        swapped = await run_in_threadpool(data_registry.reload, force)
+    except (ValueError, OSError) as exc:
+        raise HTTPException(status_code=422, detail=f"Reference data not reloaded: {exc}")
+    return {"swapped": swapped, **data_registry.stats()}
@@ -1,5 +1,10 @@
 from fastapi import APIRouter, Request, Response, status
 
+from backend.api.services import engine_pool, preview_cache, whatif_sessions
+from backend.models.calculate_salary.experience_curve import experience_curve_stats
+from backend.models.data.data_registry import data_registry
+from backend.models.pension_models.rate_tables_registry import rate_tables_registry
+
 router = APIRouter(prefix="/health", tags=["health"])
 
 
@@ -17,3 +22,21 @@ async def readiness(request: Request) -> Response:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         )
     return Response(content='{"status":"ok"}', media_type="application/json")
+
+
+@router.get("/cache")
+async def cache_stats() -> dict:
+    """Liczniki trafień / chybień współdzielonych cache'y obliczeń oraz obciążenie puli procesów."""
+    return {
+        "rate_tables": rate_tables_registry.stats(),
+        "experience_curves": experience_curve_stats(),
+        "pension_preview": preview_cache.stats(),
+        "engine_pool": engine_pool.stats(),
+        "whatif_sessions": whatif_sessions.stats(),
+    }
+
+
+@router.get("/data")
+async def data_version() -> dict:
+    """Wersja załadowanych danych referencyjnych (tabela makro, regresje płac) i liczniki przeładowań."""
+    return data_registry.stats()
@@ -1,71 +1,152 @@
+import dataclasses
+import json
+import logging
+from datetime import date
 from decimal import Decimal
-from fastapi import APIRouter
+from typing import Literal, Mapping, Optional, Sequence
+
+import numpy as np
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from starlette.concurrency import run_in_threadpool
 
+from backend.api.services import (
+    EnginePoolSaturated,
+    WhatIfSession,
+    engine_pool,
+    preview_cache,
+    round_salary,
+    whatif_sessions,
+)
+from backend.config import settings
+
 from backend.models.PensionModel import PensionModel
 from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
-from backend.api.schemas import PensionPreviewRequest, PensionPreviewResponse, TimelinePoint, SimulationEventDTO
+from backend.models.calculate_pension.batch_engine import batch_evaluate
+from backend.models.calculate_pension.cohort import simulate_cohort
+from backend.models.calculate_pension.goal_seek import goal_seek
+from backend.models.calculate_pension.incremental import IncrementalProjection
+from backend.models.calculate_pension.monte_carlo import simulate_pension_paths
+from backend.models.calculate_pension.retirement_sweep import model_retirement_age_sweep
+from backend.models.data.data_registry import DataSnapshot, data_registry
+from backend.models.pension_models.CohortConfig import CohortConfig
+from backend.models.pension_models.MonteCarloConfig import MonteCarloConfig
+from backend.models.pension_models.PensionEvaluation import PensionEvaluation
+from backend.models.pension_models.PensionKernel import PensionKernel
+from backend.models.pension_models.rate_tables_registry import get_rate_tables, macro_factors_key
+from backend.api.schemas import (
+    PensionPreviewRequest,
+    PensionPreviewResponse,
+    PensionPreviewColumnarResponse,
+    PensionPreviewBatchItem,
+    PensionPreviewBatchRequestItem,
+    PensionPreviewBatchResponse,
+    PensionMonteCarloRequest,
+    PensionMonteCarloResponse,
+    MonteCarloTimelinePoint,
+    RetirementSweepRequest,
+    GoalSeekRequest,
+    GoalSeekResponse,
+    PensionCohortRequest,
+    PensionSummary,
+    RetirementSweepPoint,
+    RetirementSweepResponse,
+    TimelineColumns,
+    TimelinePoint,
+    TimelineSplice,
+    SimulationEventDTO,
+    WhatIfDelta,
+    WhatIfDiffResponse,
+    WhatIfSessionResponse,
+)
 from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
 from backend.models.nonfunctional_periods.generate_periods import generate_periods
+from backend.utils.timing import phase
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/user-profile", tags=["user-profile"])
 
+MAX_BATCH_SIZE = 1000
 
-@router.post("/pension/preview", response_model=PensionPreviewResponse)
-async def pension_preview(payload: PensionPreviewRequest) -> PensionPreviewResponse:
-    current_salary = Decimal(str(payload.current_monthly_salary))
+_EVENTS_ADAPTER = TypeAdapter(list[NonFunctionalEvent])
+
+# Accept: oś czasu jako równoległe tablice (alternatywa dla ?timeline_format=columnar)
+COLUMNAR_MEDIA_TYPE = "application/vnd.pension.columnar+json"
 
-    model = PensionModel(
+TimelineFormat = Literal["points", "columnar"]
+
+
+def _build_model(
+    payload: PensionPreviewRequest,
+    macroeconomic_factors: MacroeconomicFactors,
+    data: Optional[DataSnapshot] = None,
+) -> PensionModel:
+    data = data or data_registry.current()
+    return PensionModel(
         current_age=payload.current_age,
         years_of_experience=payload.years_of_experience,
-        current_salary=current_salary,
+        current_salary=Decimal(str(payload.current_monthly_salary)),
         is_male=payload.is_male,
         alpha=float(payload.alpha),
         beta=float(payload.beta),
         retirement_age=payload.retirement_age,
-        macroeconomic_factors=MacroeconomicFactors(),
+        macroeconomic_factors=macroeconomic_factors,
+        engine=payload.engine,
+        resolution=payload.resolution,
+        timeline_granularity=payload.timeline_granularity,
+        life_expectancy_table=data.life_table,
     )
 
-    # --- SIMULATION MODE: generuj i podłącz zdarzenia ---
-    simulation_events: list[NonFunctionalEvent] = []
-    if payload.simulation_mode:
-        birth_year = model.current_year - model.current_age
-        simulation_events = await generate_periods(
-            birth_year=birth_year,
-            current_year=model.current_year,
-            min_events=2,
-            max_events=5,
-        )
-        model.non_functional_events = simulation_events
 
-    # obliczenia
-    breakdown = await run_in_threadpool(model.get_detailed_breakdown)
-    timeline  = await run_in_threadpool(model.get_timeline_for_visualization)
+def _preview_data_key(data: DataSnapshot, macroeconomic_factors: MacroeconomicFactors) -> str:
+    """Dane, od których zależy preview: tabela makro i (opcjonalnie) tablica trwania życia."""
+    key = macro_factors_key(macroeconomic_factors)
+    if data.life_table is not None:
+        key += f"|{data.life_table.version}-{data.life_table.digest}"
+    return key
 
-    def _to_2f(x: Decimal) -> float:
+
+def _to_2f(x: Decimal | float) -> float:
+    if isinstance(x, Decimal):
         return float(x.quantize(Decimal("0.01")))
+    return round(float(x), 2)
 
-    # mapowanie eventów do JSON (frontend-friendly)
-    def _event_to_dict(ev: NonFunctionalEvent) -> SimulationEventDTO:
-        basis_zero = bool(getattr(ev, "basis_zero", False))
-        m = getattr(ev, "contrib_multiplier", None)
-        if basis_zero:
-            cm = 0.0
-        elif m is None:
-            cm = 1.0
-        else:
-            cm = float(m)
-
-        return SimulationEventDTO(
-            reason=str(ev.reason),
-            start_age=int(ev.start_age),
-            end_age=int(ev.end_age),
-            basis_zero=basis_zero,
-            contrib_multiplier=cm,
-            kind=getattr(ev, "kind", None),
-        )
 
-    return PensionPreviewResponse(
+# mapowanie eventów do JSON (frontend-friendly)
+def _event_to_dict(ev: NonFunctionalEvent) -> SimulationEventDTO:
+    basis_zero = bool(getattr(ev, "basis_zero", False))
+    m = getattr(ev, "contrib_multiplier", None)
+    if basis_zero:
+        cm = 0.0
+    elif m is None:
+        cm = 1.0
+    else:
+        cm = float(m)
+
+    return SimulationEventDTO(
+        reason=str(ev.reason),
+        start_age=int(ev.start_age),
+        end_age=int(ev.end_age),
+        start_month=int(ev.start_month),
+        end_month=int(ev.end_month),
+        basis_zero=basis_zero,
+        contrib_multiplier=cm,
+        kind=getattr(ev, "kind", None),
+    )
+
+
+def _timeline_format(timeline_format: Optional[TimelineFormat], accept: Optional[str]) -> TimelineFormat:
+    if timeline_format is not None:
+        return timeline_format
+    if accept and COLUMNAR_MEDIA_TYPE in accept:
+        return "columnar"
+    return "points"
+
+
+def _breakdown_fields(breakdown: Mapping) -> dict:
+    return dict(
         retirement_age=int(breakdown["retirement_age"]),
         years_to_retirement=int(breakdown["years_to_retirement"]),
 
@@ -85,11 +166,22 @@ async def pension_preview(payload: PensionPreviewRequest) -> PensionPreviewRespo
         ii_pillar_capital_real=_to_2f(breakdown["ii_pillar_capital_real"]),
         total_capital_real=_to_2f(breakdown["total_capital_real"]),
         final_monthly_salary_real=_to_2f(breakdown["final_monthly_salary_real"]),
+    )
+
+
+def _build_response(
+    breakdown: Mapping,
+    timeline: Sequence[Mapping],
+    simulation_events: Sequence[NonFunctionalEvent] = (),
+) -> PensionPreviewResponse:
+    return PensionPreviewResponse(
+        **_breakdown_fields(breakdown),
 
         # --- TIMELINE: oba nurty ---
         timeline=[
             TimelinePoint(
                 year=int(point["year"]),
+                month=point.get("month"),
                 # nominal
                 i_pillar=_to_2f(point["i_pillar_nominal"]),
                 ii_pillar=_to_2f(point["ii_pillar_nominal"]),
@@ -106,4 +198,492 @@ async def pension_preview(payload: PensionPreviewRequest) -> PensionPreviewRespo
 
         # --- SIMULATION EVENTS dla frontu ---
         simulation_events=[_event_to_dict(e) for e in simulation_events],
-    )
\ No newline at end of file
+    )
+
+
+def _column_2f(column: np.ndarray) -> list[float]:
+    return np.round(np.asarray(column, dtype=np.float64), 2).tolist()
+
+
+def _build_columnar_response(
+    breakdown: Mapping,
+    columns: Mapping[str, np.ndarray],
+    simulation_events: Sequence[NonFunctionalEvent] = (),
+) -> PensionPreviewColumnarResponse:
+    """Oś czasu jako kolumny prosto z tablic silnika — bez obiektu na punkt."""
+    return PensionPreviewColumnarResponse(
+        **_breakdown_fields(breakdown),
+        timeline=_timeline_columns(columns),
+        simulation_events=[_event_to_dict(e) for e in simulation_events],
+    )
+
+
+def _timeline_columns(columns: Mapping[str, np.ndarray]) -> TimelineColumns:
+    months = columns.get("month")
+    return TimelineColumns(
+        years=columns["year"].tolist(),
+        months=months.tolist() if months is not None else None,
+        i_pillar=_column_2f(columns["i_pillar_nominal"]),
+        ii_pillar=_column_2f(columns["ii_pillar_nominal"]),
+        total=_column_2f(columns["total_nominal"]),
+        annual_salary=_column_2f(columns["annual_salary_nominal"]),
+        i_pillar_real=_column_2f(columns["i_pillar_real"]),
+        ii_pillar_real=_column_2f(columns["ii_pillar_real"]),
+        total_real=_column_2f(columns["total_real"]),
+        annual_salary_real=_column_2f(columns["annual_salary_real"]),
+    )
+
+
+def _build_preview(
+    evaluation: PensionEvaluation,
+    timeline_format: TimelineFormat,
+    simulation_events: Sequence[NonFunctionalEvent] = (),
+) -> PensionPreviewResponse:
+    if timeline_format == "columnar":
+        return _build_columnar_response(evaluation.breakdown, evaluation.timeline_columns(), simulation_events)
+    return _build_response(evaluation.breakdown, evaluation.timeline, simulation_events)
+
+
+async def _attach_simulation_events(model: PensionModel) -> list[NonFunctionalEvent]:
+    """SIMULATION MODE: generuj i podłącz zdarzenia."""
+    birth_year = model.current_year - model.current_age
+    with phase("llm_events"):
+        simulation_events = await generate_periods(
+            birth_year=birth_year,
+            current_year=model.current_year,
+            min_events=2,
+            max_events=5,
+        )
+    model.non_functional_events = simulation_events
+    return simulation_events
+
+
+def _batch_evaluate_isolated(kernels: Sequence[PensionKernel]) -> list[PensionEvaluation | str]:
+    """
+    batch_evaluate over the whole batch; if it fails, every profile is evaluated on its
+    own, so only the failing ones come back as an error message (not the whole request).
+    """
+    try:
+        return batch_evaluate(kernels)
+    except Exception:
+        logger.exception(f"Batch evaluation of {len(kernels)} profiles failed, evaluating one by one")
+    results: list[PensionEvaluation | str] = []
+    for kernel in kernels:
+        try:
+            results.append(batch_evaluate([kernel])[0])
+        except Exception as exc:
+            logger.exception("Batch item evaluation failed")
+            results.append(_item_error(exc))
+    return results
+
+
+def _item_error(exc: Exception) -> str:
+    # błędy walidacji opisują dane wejściowe — pozostałe bez szczegółów implementacji
+    if isinstance(exc, ValueError):
+        return str(exc)
+    return f"evaluation failed ({type(exc).__name__})"
+
+
+def _rebase_session(session: WhatIfSession, data: DataSnapshot) -> None:
+    """Sesja sprzed przeładowania danych: ten sam profil i eventy, liczone od nowa na `data`."""
+    kernel = dataclasses.replace(
+        session.projection.kernel,
+        rate_tables=get_rate_tables(MacroeconomicFactors(macro_data=data.macro)),
+        life_table=data.life_table,
+    )
+    kernel = dataclasses.replace(
+        kernel, life_expectancy_months=kernel.life_expectancy_months_for_age(kernel.effective_retirement_age)
+    )
+    session.projection.rebase(kernel)
+
+
+def _bands_2f(bands: Mapping[str, float]) -> dict[str, float]:
+    return {k: _to_2f(v) for k, v in bands.items()}
+
+
+@router.post("/pension/preview", response_model=PensionPreviewResponse)
+async def pension_preview(
+    payload: PensionPreviewRequest,
+    timeline_format: Optional[TimelineFormat] = Query(
+        None, description="'columnar' returns the timeline as parallel arrays (default: 'points')"
+    ),
+    accept: Optional[str] = Header(None),
+) -> PensionPreviewResponse | Response:
+    """
+    Pension preview. The timeline comes as a list of points, or — with
+    `?timeline_format=columnar` or `Accept: application/vnd.pension.columnar+json` —
+    as parallel arrays (`years`, `total`, `total_real`, …) built from the engine arrays.
+    """
+    # jedna wersja danych na całe żądanie (klucz cache, obliczenia, proces puli)
+    data = data_registry.current()
+    macroeconomic_factors = MacroeconomicFactors(macro_data=data.macro)
+    timeline_format = _timeline_format(timeline_format, accept)
+    media_type = COLUMNAR_MEDIA_TYPE if timeline_format == "columnar" else "application/json"
+
+    # bez simulation_mode wynik zależy tylko od payloadu, danych (makro, tablica trwania życia) i roku → cache
+    cache_key = None
+    if settings.preview_cache_enabled and not payload.simulation_mode:
+        payload = payload.model_copy(update={
+            "current_monthly_salary": round_salary(
+                payload.current_monthly_salary, settings.preview_cache_salary_rounding
+            ),
+        })
+        with phase("cache_lookup"):
+            cache_key = preview_cache.make_key(
+                {**payload.model_dump(mode="json"), "timeline_format": timeline_format},
+                _preview_data_key(data, macroeconomic_factors),
+                date.today().year,
+            )
+            body = preview_cache.get(cache_key)
+        if body is not None:
+            return Response(content=body, media_type=media_type, headers={"X-Cache": "HIT"})
+
+    model = _build_model(payload, macroeconomic_factors, data)
+
+    simulation_events: list[NonFunctionalEvent] = []
+    if payload.simulation_mode:
+        simulation_events = await _attach_simulation_events(model)
+
+    # obliczenia
+    if engine_pool.enabled:
+        events_json = _EVENTS_ADAPTER.dump_json(simulation_events) if simulation_events else b""
+        try:
+            with phase("engine_pool"):
+                body = await engine_pool.run(
+                    preview_json,
+                    payload.model_dump_json().encode(),
+                    events_json,
+                    timeline_format,
+                    data.version,
+                )
+        except EnginePoolSaturated as exc:
+            raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"})
+        if cache_key is None:
+            return Response(content=body, media_type=media_type)
+    else:
+        evaluation = await run_in_threadpool(model.evaluate)
+        with phase("response_build"):
+            response = _build_preview(evaluation, timeline_format, simulation_events)
+            if cache_key is None and timeline_format == "points":
+                return response
+            body = response.model_dump_json().encode()
+        if cache_key is None:
+            return Response(content=body, media_type=media_type)
+    preview_cache.put(cache_key, body)
+    return Response(content=body, media_type=media_type, headers={"X-Cache": "MISS"})
+
+
+def preview_json(
+    payload_json: bytes,
+    events_json: bytes,
+    timeline_format: TimelineFormat = "points",
+    data_version: Optional[str] = None,
+) -> bytes:
+    """
+    Preview computed in an engine pool process: JSON request (+ JSON events) in,
+    serialized PensionPreviewResponse out, so only small byte strings cross processes.
+    `data_version` is the caller's data registry version; a lagging worker reloads first.
+    """
+    if data_version is not None:
+        data_registry.ensure(data_version)
+    payload = PensionPreviewRequest.model_validate_json(payload_json)
+    model = _build_model(payload, MacroeconomicFactors())
+    simulation_events = _EVENTS_ADAPTER.validate_json(events_json) if events_json else []
+    if simulation_events:
+        model.non_functional_events = simulation_events
+    evaluation = model.evaluate()
+    return _build_preview(evaluation, timeline_format, simulation_events).model_dump_json().encode()
+
+
+@router.post("/pension/preview/batch", response_model=PensionPreviewBatchResponse)
+async def pension_preview_batch(
+    payload: list[PensionPreviewBatchRequestItem],
+    timeline_format: Optional[TimelineFormat] = Query(
+        None, description="'columnar' returns every timeline as parallel arrays (default: 'points')"
+    ),
+    accept: Optional[str] = Header(None),
+) -> PensionPreviewBatchResponse | Response:
+    """
+    Many previews in one call, evaluated together as a profiles × years matrix
+    (float64, yearly resolution — `engine` defaults to 'numpy'; items asking for another
+    engine or resolution='month' get an error). Items come back in input order; an item
+    that cannot be evaluated carries `error` instead of `result` — failures are isolated
+    per item, the rest of the batch is still returned. Timeline format as in the preview.
+    """
+    timeline_format = _timeline_format(timeline_format, accept)
+    if len(payload) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch too large (max {MAX_BATCH_SIZE} items)")
+
+    macroeconomic_factors = MacroeconomicFactors()
+    items = [PensionPreviewBatchItem(index=i) for i in range(len(payload))]
+    kernels: list[PensionKernel] = []
+    positions: list[int] = []
+    for i, item in enumerate(payload):
+        if item.simulation_mode:
+            items[i].error = "simulation_mode is not supported in batch previews"
+            continue
+        if item.resolution != "year":
+            items[i].error = "only resolution='year' is supported in batch previews"
+            continue
+        if item.engine != "numpy":
+            items[i].error = f"batch previews are computed in float64; engine='{item.engine}' is not supported"
+            continue
+        try:
+            kernels.append(_build_model(item, macroeconomic_factors).kernel)
+            positions.append(i)
+        except Exception as exc:
+            if not isinstance(exc, ValueError):
+                logger.exception("Batch item model setup failed")
+            items[i].error = _item_error(exc)
+
+    with phase("batch_evaluate"):
+        evaluations = await run_in_threadpool(_batch_evaluate_isolated, kernels)
+    for i, evaluation in zip(positions, evaluations):
+        if isinstance(evaluation, str):
+            items[i].error = evaluation
+            continue
+        try:
+            items[i].result = _build_preview(evaluation, timeline_format)
+        except Exception as exc:
+            logger.exception("Batch item response failed")
+            items[i].error = _item_error(exc)
+
+    if timeline_format == "columnar":
+        body = PensionPreviewBatchResponse(items=items).model_dump_json().encode()
+        return Response(content=body, media_type=COLUMNAR_MEDIA_TYPE)
+    return PensionPreviewBatchResponse(items=items)
+
+
+@router.post("/pension/sessions", response_model=WhatIfSessionResponse, status_code=201)
+async def create_whatif_session(payload: PensionPreviewRequest) -> WhatIfSessionResponse:
+    """
+    Opens a what-if session: the projection state (yearly, float64 like engine='numpy')
+    stays on the server and later edits (PATCH) return only the changed part of the
+    timeline. Returns the full columnar preview of the starting point.
+    """
+    if payload.resolution != "year":
+        raise HTTPException(status_code=422, detail="only resolution='year' is supported in what-if sessions")
+    data = data_registry.current()
+    model = _build_model(payload, MacroeconomicFactors(macro_data=data.macro), data)
+
+    simulation_events: list[NonFunctionalEvent] = []
+    if payload.simulation_mode:
+        simulation_events = await _attach_simulation_events(model)
+
+    projection = IncrementalProjection(model.kernel, model.non_functional_events)
+    session_id, session = whatif_sessions.create(projection, data.version)
+    return WhatIfSessionResponse(
+        session_id=session_id,
+        version=session.version,
+        preview=_build_columnar_response(projection.breakdown(), projection.timeline_columns(), simulation_events),
+        events=projection.events,
+    )
+
+
+@router.patch("/pension/sessions/{session_id}", response_model=WhatIfDiffResponse)
+async def update_whatif_session(session_id: str, delta: WhatIfDelta) -> WhatIfDiffResponse:
+    """
+    Applies one edit (added / removed events, salary, retirement age) and returns the new
+    summary with a timeline splice: replace points from `from_year` on with `columns`
+    and drop points after `last_year`. Only the affected years are recomputed — unless
+    the reference data were reloaded since the last edit: then the session is rebuilt on
+    the current data and the splice covers the whole timeline.
+    """
+    session = whatif_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired session")
+    if delta.base_version is not None and delta.base_version != session.version:
+        raise HTTPException(
+            status_code=409, detail=f"Session is at version {session.version}, not {delta.base_version}"
+        )
+
+    data = data_registry.current()
+    rebased = session.data_version != data.version
+    if rebased:
+        with phase("whatif_rebase"):
+            _rebase_session(session, data)
+
+    try:
+        with phase("whatif_apply"):
+            diff = session.projection.apply(
+                add_events=delta.add_events,
+                remove_events=delta.remove_events,
+                current_salary=(
+                    Decimal(str(delta.current_monthly_salary)) if delta.current_monthly_salary is not None else None
+                ),
+                retirement_age=delta.retirement_age,
+            )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    if rebased:
+        projection = session.projection
+        diff["from_year"] = int(projection.years[projection.c])
+        diff["columns"] = projection.timeline_columns()
+        # dopiero po udanej edycji — po błędzie kolejna edycja znów zwróci całą oś czasu
+        session.data_version = data.version
+    session.version += 1
+
+    return WhatIfDiffResponse(
+        session_id=session_id,
+        version=session.version,
+        summary=PensionSummary(**_breakdown_fields(diff["breakdown"])),
+        timeline=TimelineSplice(
+            from_year=diff["from_year"],
+            last_year=diff["last_year"],
+            columns=_timeline_columns(diff["columns"]),
+        ),
+        events=session.projection.events,
+    )
+
+
+@router.delete("/pension/sessions/{session_id}", status_code=204)
+async def delete_whatif_session(session_id: str) -> Response:
+    if not whatif_sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail="Unknown or expired session")
+    return Response(status_code=204)
+
+
+@router.post("/pension/monte-carlo", response_model=PensionMonteCarloResponse)
+async def pension_monte_carlo(payload: PensionMonteCarloRequest) -> PensionMonteCarloResponse:
+    """
+    Pension percentile bands (P10/P50/P90) over stochastic inflation / real wage paths
+    (AR(1) calibrated on the historical macro table). Paths are yearly float64, so
+    engine='decimal' / 'fixed' and resolution='month' are rejected (422).
+    """
+    model = _build_model(payload, MacroeconomicFactors())
+
+    simulation_events: list[NonFunctionalEvent] = []
+    if payload.simulation_mode:
+        simulation_events = await _attach_simulation_events(model)
+
+    config = MonteCarloConfig(n_paths=payload.n_paths, seed=payload.seed)
+    with phase("monte_carlo"):
+        result = await run_in_threadpool(simulate_pension_paths, model.kernel, config)
+
+    return PensionMonteCarloResponse(
+        n_paths=result["n_paths"],
+        retirement_age=int(result["retirement_age"]),
+        years_to_retirement=int(result["years_to_retirement"]),
+        monthly_pension_nominal=_bands_2f(result["monthly_pension_nominal"]),
+        monthly_pension_real=_bands_2f(result["monthly_pension_real"]),
+        replacement_rate_percent_nominal=_bands_2f(result["replacement_rate_percent_nominal"]),
+        replacement_rate_percent_real=_bands_2f(result["replacement_rate_percent_real"]),
+        timeline=[
+            MonteCarloTimelinePoint(
+                year=point["year"],
+                total=_bands_2f(point["total_nominal"]),
+                total_real=_bands_2f(point["total_real"]),
+            )
+            for point in result["timeline"]
+        ],
+        simulation_events=[_event_to_dict(e) for e in simulation_events],
+    )
+
+
+@router.post("/pension/retirement-sweep", response_model=RetirementSweepResponse)
+async def pension_retirement_sweep(payload: RetirementSweepRequest) -> RetirementSweepResponse:
+    """
+    Monthly pension, capital and replacement rate for every retirement age in
+    [retirement_age_from, retirement_age_to]. The default engine ('numpy', yearly)
+    computes them from one projection; engine='decimal' / 'fixed' or resolution='month'
+    evaluate each age with that engine.
+    """
+    model = _build_model(payload, MacroeconomicFactors())
+
+    simulation_events: list[NonFunctionalEvent] = []
+    if payload.simulation_mode:
+        simulation_events = await _attach_simulation_events(model)
+
+    ages = range(payload.retirement_age_from, payload.retirement_age_to + 1)
+    with phase("retirement_sweep"):
+        points = await run_in_threadpool(model_retirement_age_sweep, model, ages)
+
+    return RetirementSweepResponse(
+        points=[
+            RetirementSweepPoint(
+                retirement_age=point["retirement_age"],
+                years_to_retirement=point["years_to_retirement"],
+                monthly_pension_nominal=_to_2f(point["monthly_pension_nominal"]),
+                monthly_pension_real=_to_2f(point["monthly_pension_real"]),
+                total_capital_nominal=_to_2f(point["total_capital_nominal"]),
+                total_capital_real=_to_2f(point["total_capital_real"]),
+                replacement_rate_percent_nominal=_to_2f(point["replacement_rate_percent_nominal"]),
+                replacement_rate_percent_real=_to_2f(point["replacement_rate_percent_real"]),
+            )
+            for point in points
+        ],
+        simulation_events=[_event_to_dict(e) for e in simulation_events],
+    )
+
+
+@router.post("/pension/goal-seek", response_model=GoalSeekResponse)
+async def pension_goal_seek(payload: GoalSeekRequest) -> GoalSeekResponse:
+    """
+    Minimal current salary, retirement age or accumulated I filar capital that reaches
+    the target monthly pension (real or nominal); the other inputs stay as given.
+    """
+    model = _build_model(payload, MacroeconomicFactors())
+
+    simulation_events: list[NonFunctionalEvent] = []
+    if payload.simulation_mode:
+        simulation_events = await _attach_simulation_events(model)
+
+    with phase("goal_seek"):
+        solution = await run_in_threadpool(
+            goal_seek,
+            model,
+            payload.solve_for,
+            payload.target_monthly_pension,
+            f"monthly_pension_{payload.target_measure}",
+        )
+
+    result = None
+    if solution["reachable"]:
+        evaluation = await run_in_threadpool(solution["model"].evaluate)
+        result = _build_response(evaluation.breakdown, evaluation.timeline, simulation_events)
+
+    return GoalSeekResponse(
+        solve_for=payload.solve_for,
+        target_measure=payload.target_measure,
+        target_monthly_pension=payload.target_monthly_pension,
+        reachable=solution["reachable"],
+        value=float(solution["value"]) if solution["reachable"] else None,
+        iterations=solution["iterations"],
+        result=result,
+        simulation_events=[_event_to_dict(e) for e in simulation_events],
+    )
+
+
+@router.post("/pension/cohort")
+async def pension_cohort(payload: PensionCohortRequest) -> StreamingResponse:
+    """
+    Synthetic population over the job catalogue (category, sex, age, experience, salary
+    sampled per worker). Streams NDJSON: one progress line with the running overall
+    statistics per evaluated chunk, then a final line (`"done": true`) with statistics
+    per sex and per category and the replacement-rate / pension histograms.
+    """
+    data = data_registry.current()
+    unknown = [name for name in payload.categories or () if name not in data.regressions]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown job categories: {', '.join(unknown)}")
+
+    config = CohortConfig(
+        n_workers=payload.n_workers,
+        seed=payload.seed,
+        categories=payload.categories,
+        age_min=payload.age_min,
+        age_max=payload.age_max,
+        male_share=payload.male_share,
+        entry_salary_median=payload.entry_salary_median,
+        entry_salary_sigma=payload.entry_salary_sigma,
+    )
+    tables = get_rate_tables(MacroeconomicFactors(macro_data=data.macro))
+
+    def lines():
+        aggregates = None
+        for aggregates in simulate_cohort(config, tables, date.today().year, data=data):
+            if aggregates.workers < config.n_workers:
+                yield json.dumps({"workers_done": aggregates.workers, "overall": aggregates.overall()}) + "\n"
+        yield json.dumps({"workers_done": aggregates.workers, "done": True, **aggregates.summary()}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -1,9 +1,10 @@
 from enum import Enum
-from typing import Optional
-from typing import List
+from typing import ClassVar, Literal, Optional, Union
+from typing import Dict, List
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 from backend.llm.fun_facts.FunFact import FunFact
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
 
 
 class Sex(str, Enum):
@@ -87,12 +88,56 @@ class PensionPreviewRequest(BaseModel):
         description="Optional custom retirement age; if omitted, standard age is used",
     )
     simulation_mode: bool = False
+    engine: Optional[Literal["decimal", "numpy", "fixed"]] = Field(
+        None,
+        description=(
+            "Calculation engine: 'decimal' (exact, slower), 'numpy' (vectorized float64) "
+            "or 'fixed' (integer grosze, reproducible to the grosz). Default: 'decimal', "
+            "'numpy' with resolution='month'"
+        ),
+    )
+    resolution: Literal["year", "month"] = Field(
+        "year",
+        description=(
+            "'month' accrues contributions per month and honours event start/end months "
+            "(engine='numpy' only); with 'year' events with month bounds are rejected"
+        ),
+    )
+    timeline_granularity: Literal["year", "month"] = Field(
+        "year",
+        description="Timeline granularity; 'month' is only available with resolution='month'",
+    )
+
+    # silnik przy pominiętym `engine` w trybie rocznym
+    default_engine: ClassVar[str] = "decimal"
+
+    @model_validator(mode="after")
+    def resolve_engine(self):
+        # tryb miesięczny liczy tylko silnik float64 — inny jawny wybór to błąd, nie cichy fallback
+        if self.resolution == "month":
+            if self.engine not in (None, "numpy"):
+                raise ValueError(
+                    f"resolution='month' is computed in float64 only; engine='{self.engine}' is not supported "
+                    "(use engine='numpy' or omit it)"
+                )
+            self.engine = "numpy"
+        elif self.engine is None:
+            self.engine = self.default_engine
+        return self
+
+    @model_validator(mode="after")
+    def check_timeline_granularity(self):
+        if self.timeline_granularity == "month" and self.resolution != "month":
+            raise ValueError("timeline_granularity='month' requires resolution='month'")
+        return self
 
 
 class SimulationEventDTO(BaseModel):
     reason: str
     start_age: int
     end_age: int
+    start_month: int = 0
+    end_month: int = 0
     basis_zero: bool
     contrib_multiplier: float
     kind: str | None = None
@@ -101,6 +146,7 @@ class SimulationEventDTO(BaseModel):
 class TimelinePoint(BaseModel):
     # --- nominal ---
     year: int = Field(..., description="Rok")
+    month: Optional[int] = Field(None, description="Miesiąc (1–12) — tylko dla osi czasu w trybie miesięcznym")
     i_pillar: float = Field(..., description="Skumulowany kapitał I filara (nominalnie) do końca roku")
     ii_pillar: float = Field(..., description="Skumulowany kapitał II filara (nominalnie) do końca roku")
     total: float = Field(..., description="Suma kapitału I+II (nominalnie) do końca roku")
@@ -113,7 +159,7 @@ class TimelinePoint(BaseModel):
     annual_salary_real: float = Field(..., description="Roczna pensja w danym roku (realnie)")
 
 
-class PensionPreviewResponse(BaseModel):
+class PensionSummary(BaseModel):
     # metadane
     retirement_age: int = Field(..., description="Wiek przejścia na emeryturę")
     years_to_retirement: int = Field(..., description="Liczba lat do emerytury")
@@ -135,12 +181,191 @@ class PensionPreviewResponse(BaseModel):
     total_capital_real: float = Field(..., description="Kapitał łączny I+II (realnie)")
     final_monthly_salary_real: float = Field(..., description="Miesięczna pensja w roku emerytury (realnie)")
 
+
+class PensionPreviewResponse(PensionSummary):
     # oś czasu
     timeline: List[TimelinePoint] = Field(..., description="Punkty osi czasu do wizualizacji (nominal + real)")
 
     simulation_events: List[SimulationEventDTO] = []
 
 
+class TimelineColumns(BaseModel):
+    """Oś czasu jako równoległe tablice — element k każdej tablicy to jeden punkt osi czasu."""
+
+    years: List[int] = Field(..., description="Lata")
+    months: Optional[List[int]] = Field(None, description="Miesiące (1–12) — tylko dla osi czasu w trybie miesięcznym")
+    i_pillar: List[float] = Field(..., description="Skumulowany kapitał I filara (nominalnie)")
+    ii_pillar: List[float] = Field(..., description="Skumulowany kapitał II filara (nominalnie)")
+    total: List[float] = Field(..., description="Suma kapitału I+II (nominalnie)")
+    annual_salary: List[float] = Field(..., description="Roczna pensja (nominalnie)")
+    i_pillar_real: List[float] = Field(..., description="Skumulowany kapitał I filara (realnie)")
+    ii_pillar_real: List[float] = Field(..., description="Skumulowany kapitał II filara (realnie)")
+    total_real: List[float] = Field(..., description="Suma kapitału I+II (realnie)")
+    annual_salary_real: List[float] = Field(..., description="Roczna pensja (realnie)")
+
+
+class PensionPreviewColumnarResponse(PensionPreviewResponse):
+    timeline: TimelineColumns = Field(..., description="Oś czasu w formie kolumnowej (nominal + real)")
+
+
+class WhatIfSessionResponse(BaseModel):
+    session_id: str = Field(..., description="Identyfikator sesji (do kolejnych zmian)")
+    version: int = Field(..., description="Numer wersji stanu sesji (0 po utworzeniu)")
+    preview: PensionPreviewColumnarResponse = Field(..., description="Pełny podgląd w chwili utworzenia")
+    events: List[NonFunctionalEvent] = Field(..., description="Bieżąca lista zdarzeń sesji (indeksy dla remove_events)")
+
+
+class WhatIfDelta(BaseModel):
+    base_version: Optional[int] = Field(
+        None, description="Expected session version; a mismatch is rejected with 409"
+    )
+    add_events: List[NonFunctionalEvent] = Field([], description="Events appended to the session")
+    remove_events: List[int] = Field([], description="Indices of session events to remove (applied before additions)")
+    current_monthly_salary: Optional[float] = Field(None, ge=0, description="New current monthly gross salary (PLN)")
+    retirement_age: Optional[int] = Field(None, ge=0, le=120, description="New retirement age")
+
+
+class TimelineSplice(BaseModel):
+    from_year: Optional[int] = Field(None, description="Pierwszy zmieniony rok (brak = bez zmian w punktach)")
+    last_year: int = Field(..., description="Ostatni rok osi czasu (późniejsze punkty należy usunąć)")
+    columns: TimelineColumns = Field(..., description="Nowe wartości dla lat from_year..last_year")
+
+
+class WhatIfDiffResponse(BaseModel):
+    session_id: str = Field(..., description="Identyfikator sesji")
+    version: int = Field(..., description="Numer wersji stanu po zmianie")
+    summary: PensionSummary = Field(..., description="Wyniki po zmianie")
+    timeline: TimelineSplice = Field(..., description="Zmiana osi czasu względem poprzedniej wersji")
+    events: List[NonFunctionalEvent] = Field(..., description="Bieżąca lista zdarzeń sesji")
+
+
+class PensionPreviewBatchRequestItem(PensionPreviewRequest):
+    # batch liczy macierz float64 (jak 'numpy'); inny jawny silnik to błąd elementu
+    default_engine: ClassVar[str] = "numpy"
+
+
+class PensionPreviewBatchItem(BaseModel):
+    index: int = Field(..., description="Pozycja elementu w żądaniu")
+    result: Optional[Union[PensionPreviewColumnarResponse, PensionPreviewResponse]] = Field(
+        None, description="Wynik podglądu (brak przy błędzie)"
+    )
+    error: Optional[str] = Field(None, description="Opis błędu dla tego elementu")
+
+
+class PensionPreviewBatchResponse(BaseModel):
+    items: List[PensionPreviewBatchItem] = Field(..., description="Wyniki w kolejności żądania")
+
+
+class PensionMonteCarloRequest(PensionPreviewRequest):
+    # ścieżki są roczne i liczone we float64 — inny jawny silnik czy tryb miesięczny byłby pominięty
+    default_engine: ClassVar[str] = "numpy"
+
+    n_paths: int = Field(1000, ge=1, le=10000, description="Number of simulated macroeconomic paths")
+    seed: Optional[int] = Field(None, description="Random seed for reproducible bands")
+
+    @model_validator(mode="after")
+    def check_monte_carlo_engine(self):
+        if self.resolution != "year":
+            raise ValueError("Monte Carlo paths are simulated at yearly resolution only (use resolution='year')")
+        if self.engine != "numpy":
+            raise ValueError(
+                f"Monte Carlo paths are computed in float64; engine='{self.engine}' is not supported "
+                "(use engine='numpy' or omit it)"
+            )
+        return self
+
+
+class MonteCarloTimelinePoint(BaseModel):
+    year: int = Field(..., description="Rok")
+    total: Dict[str, float] = Field(..., description="Percentyle kapitału I+II (nominalnie), np. p10/p50/p90")
+    total_real: Dict[str, float] = Field(..., description="Percentyle kapitału I+II (realnie)")
+
+
+class PensionMonteCarloResponse(BaseModel):
+    n_paths: int = Field(..., description="Liczba symulowanych ścieżek")
+    retirement_age: int = Field(..., description="Wiek przejścia na emeryturę")
+    years_to_retirement: int = Field(..., description="Liczba lat do emerytury")
+
+    monthly_pension_nominal: Dict[str, float] = Field(..., description="Percentyle emerytury (nominalnie)")
+    monthly_pension_real: Dict[str, float] = Field(..., description="Percentyle emerytury (realnie)")
+    replacement_rate_percent_nominal: Dict[str, float] = Field(..., description="Percentyle replacement rate w % (nominalnie)")
+    replacement_rate_percent_real: Dict[str, float] = Field(..., description="Percentyle replacement rate w % (realnie)")
+
+    timeline: List[MonteCarloTimelinePoint] = Field(..., description="Pasma percentyli kapitału w czasie")
+
+    simulation_events: List[SimulationEventDTO] = []
+
+
+class RetirementSweepRequest(PensionPreviewRequest):
+    # przegląd domyślnie liczy wszystkie wieki z jednej projekcji float64
+    default_engine: ClassVar[str] = "numpy"
+
+    retirement_age_from: int = Field(..., ge=0, le=120, description="First retirement age of the sweep")
+    retirement_age_to: int = Field(..., ge=0, le=120, description="Last retirement age of the sweep (inclusive)")
+
+    @model_validator(mode="after")
+    def check_retirement_age_range(self):
+        if self.retirement_age_to < self.retirement_age_from:
+            raise ValueError("retirement_age_to must be >= retirement_age_from")
+        return self
+
+
+class RetirementSweepPoint(BaseModel):
+    retirement_age: int = Field(..., description="Wiek przejścia na emeryturę")
+    years_to_retirement: int = Field(..., description="Liczba lat do emerytury")
+    monthly_pension_nominal: float = Field(..., description="Miesięczna emerytura (nominalnie)")
+    monthly_pension_real: float = Field(..., description="Miesięczna emerytura (realnie)")
+    total_capital_nominal: float = Field(..., description="Kapitał łączny I+II (nominalnie)")
+    total_capital_real: float = Field(..., description="Kapitał łączny I+II (realnie)")
+    replacement_rate_percent_nominal: float = Field(..., description="Replacement rate w % (nominalnie)")
+    replacement_rate_percent_real: float = Field(..., description="Replacement rate w % (realnie)")
+
+
+class RetirementSweepResponse(BaseModel):
+    points: List[RetirementSweepPoint] = Field(..., description="Wyniki dla kolejnych wieków emerytalnych")
+    simulation_events: List[SimulationEventDTO] = []
+
+
+class GoalSeekRequest(PensionPreviewRequest):
+    solve_for: Literal["current_salary", "retirement_age", "accumulated_i_pillar_capital"] = Field(
+        ..., description="Input to solve for (the other inputs stay as given)"
+    )
+    target_monthly_pension: float = Field(..., gt=0, description="Target monthly pension (PLN)")
+    target_measure: Literal["real", "nominal"] = Field(
+        "real", description="Whether the target is the real or the nominal monthly pension"
+    )
+
+
+class GoalSeekResponse(BaseModel):
+    solve_for: str = Field(..., description="Solved input")
+    target_measure: str = Field(..., description="'real' or 'nominal'")
+    target_monthly_pension: float = Field(..., description="Target monthly pension (PLN)")
+    reachable: bool = Field(..., description="False if no value within the solver bounds reaches the target")
+    value: Optional[float] = Field(None, description="Minimal value of the solved input reaching the target")
+    iterations: int = Field(..., description="Model evaluations used by the solver")
+    result: Optional[PensionPreviewResponse] = Field(None, description="Preview at the solved value")
+    simulation_events: List[SimulationEventDTO] = []
+
+
+class PensionCohortRequest(BaseModel):
+    n_workers: int = Field(100_000, ge=1, le=5_000_000, description="Number of synthetic workers")
+    seed: Optional[int] = Field(None, description="Random seed for a reproducible cohort")
+    categories: Optional[List[str]] = Field(
+        None, description="Job categories from the regression catalogue (None = all)"
+    )
+    age_min: int = Field(25, ge=18, le=120, description="Youngest sampled age")
+    age_max: int = Field(60, ge=18, le=120, description="Oldest sampled age (inclusive)")
+    male_share: float = Field(0.5, ge=0, le=1, description="Share of men in the cohort")
+    entry_salary_median: float = Field(5000.0, gt=0, description="Median monthly entry salary (PLN)")
+    entry_salary_sigma: float = Field(0.35, ge=0, description="Log-std of the entry salary")
+
+    @model_validator(mode="after")
+    def check_age_range(self):
+        if self.age_max < self.age_min:
+            raise ValueError("age_max must be >= age_min")
+        return self
+
+
 class FunFactsResponse(BaseModel):
     facts: List[FunFact] = Field(..., description="A fun facts about salaries or pensions")
 
@@ -3,5 +3,21 @@ from .excel_service import (
     append_usage_row_to_xlsx,
     DEFAULT_HEADERS,
 )
+from .engine_pool import EnginePool, EnginePoolSaturated, engine_pool
+from .preview_cache import PreviewResponseCache, preview_cache, round_salary
+from .whatif_sessions import WhatIfSession, WhatIfSessionStore, whatif_sessions
 
-__all__ = ["append_row_to_xlsx", "append_usage_row_to_xlsx", "DEFAULT_HEADERS"]
+__all__ = [
+    "append_row_to_xlsx",
+    "append_usage_row_to_xlsx",
+    "DEFAULT_HEADERS",
+    "EnginePool",
+    "EnginePoolSaturated",
+    "engine_pool",
+    "PreviewResponseCache",
+    "preview_cache",
+    "round_salary",
+    "WhatIfSession",
+    "WhatIfSessionStore",
+    "whatif_sessions",
+]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, Sequence
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EnginePoolSaturated(Exception):
+    """No free slot in the engine pool within the queue timeout."""
+
+
+def _init_worker(warm_modules: Sequence[str]) -> None:
+    """
+    Per-process warm-up: imports the task modules, loads the reference data and builds the
+    default macro rate tables. Later data versions are picked up per task (data_registry.ensure).
+    """
+    from backend.models.data.data_registry import data_registry
+    from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
+    from backend.models.pension_models.rate_tables_registry import get_rate_tables
+
+    for name in warm_modules:
+        importlib.import_module(name)
+    data_registry.configure(
+        settings.macro_data_path or None,
+        settings.regression_data_path or None,
+        settings.life_expectancy_table_path or None,
+    )
+    get_rate_tables(MacroeconomicFactors())
+
+
+def _ping() -> int:
+    return multiprocessing.current_process().pid or 0
+
+
+class EnginePool:
+    """
+    Process pool for CPU-bound engine work (pure-Python Decimal holds the GIL, so a
+    thread pool never uses more than one core).
+
+    Workers are spawned (not forked from the threaded server) and warmed up front by
+    `start()`: task modules imported, default macro tables built. Tasks should take and
+    return compact values (JSON bytes); at most `max_pending` tasks are queued or
+    running, a caller waiting longer than `queue_timeout_seconds` for a slot gets
+    EnginePoolSaturated.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int = 0,
+        queue_timeout_seconds: float = 1.0,
+        warm_modules: Sequence[str] = (),
+    ):
+        self.workers = workers
+        self.max_pending = max_pending or 4 * max(1, workers)
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.warm_modules = tuple(warm_modules)
+        self.submitted = 0
+        self.rejected = 0
+        self._pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.warm_modules,),
+                )
+            return self._executor
+
+    def start(self) -> None:
+        """Spawns and warms every worker now instead of on the first requests."""
+        if not self.enabled:
+            return
+        executor = self._ensure_executor()
+        pids = {f.result() for f in [executor.submit(_ping) for _ in range(self.workers)]}
+        logger.info(f"Engine pool ready: {len(pids)} worker process(es)")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Runs a module-level function in a worker; applies backpressure on a full pool."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise EnginePoolSaturated(
+                f"Engine pool saturated ({self.max_pending} tasks pending)"
+            ) from None
+        self._pending += 1
+        self.submitted += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._ensure_executor(), fn, *args)
+        finally:
+            self._pending -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+        }
+
+
+engine_pool = EnginePool(
+    workers=settings.engine_pool_workers,
+    max_pending=settings.engine_pool_max_pending,
+    queue_timeout_seconds=settings.engine_pool_queue_timeout_seconds,
+    warm_modules=("backend.api.routes.user_profile",),
+)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from backend.config import settings
+
+
+class PreviewResponseCache:
+    """
+    LRU + TTL cache of serialized (JSON bytes) pension preview responses.
+
+    Keys are canonical request payloads plus the macro data version and the current
+    year, so a hit returns the exact bytes the route would have produced, skipping
+    both the computation and response serialization.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(payload: dict, data_version: str, current_year: int) -> str:
+        canonical = json.dumps(
+            {"payload": payload, "data_version": data_version, "current_year": current_year},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, body: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def round_salary(salary: float, step: float) -> float:
+    """Rounds the salary input to the nearest multiple of `step` (step <= 0 → unchanged)."""
+    if step <= 0:
+        return salary
+    return round(round(salary / step) * step, 2)
+
+
+preview_cache = PreviewResponseCache(
+    max_entries=settings.preview_cache_max_entries,
+    ttl_seconds=settings.preview_cache_ttl_seconds,
+)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from backend.config import settings
+from backend.models.calculate_pension.incremental import IncrementalProjection
+
+
+@dataclass
+class WhatIfSession:
+    projection: IncrementalProjection
+    version: int = 0
+    data_version: Optional[str] = None  # wersja danych referencyjnych, na których liczy projekcja
+
+
+class WhatIfSessionStore:
+    """
+    LRU + sliding-TTL store of what-if sessions (compiled incremental projection state).
+
+    Every access renews the session's TTL; the least recently used session is evicted
+    once `max_entries` is exceeded. Expired sessions are dropped on every create / get.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.created = 0
+        self.expired = 0
+        self.evicted = 0
+        self._entries: OrderedDict[str, tuple[float, WhatIfSession]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(
+        self, projection: IncrementalProjection, data_version: Optional[str] = None
+    ) -> tuple[str, WhatIfSession]:
+        session_id = secrets.token_urlsafe(16)
+        session = WhatIfSession(projection, data_version=data_version)
+        now = time.monotonic()
+        with self._lock:
+            self._purge_expired(now)
+            self._entries[session_id] = (now + self.ttl_seconds, session)
+            self.created += 1
+            while len(self._entries) > max(1, self.max_entries):
+                self._entries.popitem(last=False)
+                self.evicted += 1
+        return session_id, session
+
+    def get(self, session_id: str) -> Optional[WhatIfSession]:
+        now = time.monotonic()
+        with self._lock:
+            self._purge_expired(now)
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            self._entries[session_id] = (now + self.ttl_seconds, entry[1])
+            self._entries.move_to_end(session_id)
+            return entry[1]
+
+    def _purge_expired(self, now: float) -> None:
+        # kolejność LRU = kolejność terminów wygaśnięcia (TTL liczony od ostatniego użycia)
+        while self._entries:
+            session_id, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[session_id]
+            self.expired += 1
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._entries.pop(session_id, None) is not None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "created": self.created,
+                "expired": self.expired,
+                "evicted": self.evicted,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+whatif_sessions = WhatIfSessionStore(
+    max_entries=settings.whatif_sessions_max_entries,
+    ttl_seconds=settings.whatif_session_ttl_seconds,
+)
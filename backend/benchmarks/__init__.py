@@ -0,0 +1,12 @@
+"""
+Benchmarks for the pension engine and the HTTP routes.
+
+    python -m backend.benchmarks [--quick] [--output results.json]
+                                 [--baseline backend/benchmarks/baseline.json] [--tolerance 0.25]
+                                 [--save-baseline]
+
+Results are written as JSON. With a baseline file present, the run fails (exit code 1)
+when any benchmark's median is slower than baseline * (1 + tolerance), or when the
+'numpy' engine drifts from the 'decimal' one beyond NUMPY_ENGINE_RTOL. LLM calls
+(event generation, job classification, salary estimation) are replaced by stubs.
+"""
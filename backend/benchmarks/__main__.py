@@ -0,0 +1,108 @@
+import logging
+import os
+
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")  # settings wymagają klucza; LLM jest podmieniany
+logging.disable(logging.INFO)  # logi per-request zagłuszają wynik i zawyżają czasy
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from backend.benchmarks.engine import check_numpy_parity, run_engine_benchmarks
+from backend.benchmarks.harness import find_regressions
+from backend.benchmarks.routes import run_route_benchmarks
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_QUICK_BASELINE = Path(__file__).with_name("baseline-quick.json")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks", description=__doc__)
+    parser.add_argument("--quick", action="store_true", help="Smaller grid and fewer repeats")
+    parser.add_argument("--output", type=Path, help="Write results JSON to this file (default: stdout)")
+    parser.add_argument(
+        "--baseline", type=Path, help="Baseline results JSON (default: baseline.json, baseline-quick.json with --quick)"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown vs baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Overwrite the baseline with this run")
+    parser.add_argument("--skip-routes", action="store_true", help="Engine benchmarks only")
+    args = parser.parse_args(argv)
+    if args.baseline is None:
+        args.baseline = DEFAULT_QUICK_BASELINE if args.quick else DEFAULT_BASELINE
+
+    # bez bazy porównanie nic nie sprawdza — świeży checkout ma kończyć się błędem, nie zielenią
+    baseline = None
+    if not args.save_baseline:
+        if not args.baseline.exists():
+            print(
+                f"No baseline at {args.baseline}; create one with --save-baseline "
+                f"(or point --baseline at an existing file)",
+                file=sys.stderr,
+            )
+            return 2
+        baseline = json.loads(args.baseline.read_text())
+        baseline_quick = baseline.get("meta", {}).get("quick")
+        if baseline_quick is not None and baseline_quick != args.quick:
+            print(
+                f"Baseline {args.baseline} was recorded with quick={baseline_quick}; "
+                f"rerun with{'' if baseline_quick else 'out'} --quick or save a new baseline",
+                file=sys.stderr,
+            )
+            return 2
+
+    results = run_engine_benchmarks(quick=args.quick)
+    if not args.skip_routes:
+        results.update(run_route_benchmarks(quick=args.quick))
+    parity = check_numpy_parity(quick=args.quick)
+
+    regressions = []
+    if baseline is not None:
+        regressions = find_regressions(results, baseline.get("results", {}), args.tolerance)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "quick": args.quick,
+            "tolerance": args.tolerance,
+        },
+        "results": results,
+        "parity": parity,
+        "regressions": regressions,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload)
+    else:
+        print(payload)
+
+    if args.save_baseline:
+        args.baseline.write_text(payload)
+
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['name']}: {regression['median_ms']:.3f} ms "
+            f"(baseline {regression['baseline_median_ms']:.3f} ms, x{regression['ratio']:.2f})",
+            file=sys.stderr,
+        )
+    if not parity["ok"]:
+        print(
+            f"PARITY numpy vs decimal: {parity['worst_relative_diff']:.3e} > {parity['rtol']:.0e} "
+            f"at {parity['worst_at']}",
+            file=sys.stderr,
+        )
+    return 1 if regressions or not parity["ok"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""PensionModel benchmarks over a grid of profiles, plus the numpy/decimal parity check."""
+import itertools
+from decimal import Decimal
+
+from backend.benchmarks.harness import measure
+from backend.benchmarks.stubs import stub_events
+from backend.models.PensionModel import PensionModel
+from backend.models.calculate_pension.vectorized_engine import NUMPY_ENGINE_RTOL
+
+AGES = (25, 35, 45, 55)
+EXPERIENCE = (0, 5, 15, 30)
+RETIREMENT_AGES = (None, 60, 67)
+EVENT_COUNTS = (0, 2, 5)
+ENGINES = ("decimal", "numpy", "fixed")
+CURRENT_YEAR = 2025
+
+QUICK_AGES = (30, 50)
+QUICK_EXPERIENCE = (5, 20)
+
+
+def profile_grid(quick: bool = False) -> dict[int, list[dict]]:
+    """PensionModel kwargs grouped by event count (experience capped at age - 18)."""
+    ages = QUICK_AGES if quick else AGES
+    experience = QUICK_EXPERIENCE if quick else EXPERIENCE
+    grid: dict[int, list[dict]] = {}
+    for events in EVENT_COUNTS:
+        profiles = []
+        for age, exp, retirement_age in itertools.product(ages, experience, RETIREMENT_AGES):
+            if exp > age - 18:
+                continue
+            profiles.append({
+                "current_age": age,
+                "years_of_experience": exp,
+                "current_salary": Decimal("9000"),
+                "alpha": 1.2,
+                "beta": 0.1,
+                "retirement_age": retirement_age,
+                "current_year": CURRENT_YEAR,
+                "non_functional_events": stub_events(CURRENT_YEAR - age, CURRENT_YEAR, count=events),
+            })
+        grid[events] = profiles
+    return grid
+
+
+def run_engine_benchmarks(quick: bool = False) -> dict:
+    repeat = 3 if quick else 7
+    results = {}
+    for events, profiles in profile_grid(quick).items():
+        results[f"model.construct[events={events}]"] = measure(
+            lambda: [PensionModel(**kw) for kw in profiles], repeat=repeat
+        )
+        for engine in ENGINES:
+            def breakdown():
+                for kw in profiles:
+                    PensionModel(**kw, engine=engine).get_detailed_breakdown()
+
+            def timeline():
+                for kw in profiles:
+                    PensionModel(**kw, engine=engine).get_timeline_for_visualization()
+
+            results[f"model.breakdown[{engine},events={events}]"] = measure(breakdown, repeat=repeat)
+            results[f"model.timeline[{engine},events={events}]"] = measure(timeline, repeat=repeat)
+    return results
+
+
+def check_numpy_parity(quick: bool = False) -> dict:
+    """Worst relative difference of 'numpy' vs 'decimal' over all monetary outputs of the grid."""
+    worst = 0.0
+    worst_at = None
+    for profiles in profile_grid(quick).values():
+        for kw in profiles:
+            reference = PensionModel(**kw, engine="decimal").evaluate()
+            candidate = PensionModel(**kw, engine="numpy").evaluate()
+            pairs = [(reference.breakdown, candidate.breakdown)]
+            pairs += list(zip(reference.timeline, candidate.timeline))
+            for ref, cand in pairs:
+                for key, value in ref.items():
+                    expected = float(value)
+                    diff = abs(float(cand[key]) - expected) / max(abs(expected), 1.0)
+                    if diff > worst:
+                        worst, worst_at = diff, {"profile": _describe(kw), "key": key}
+    return {
+        "rtol": NUMPY_ENGINE_RTOL,
+        "worst_relative_diff": worst,
+        "worst_at": worst_at,
+        "ok": worst <= NUMPY_ENGINE_RTOL,
+    }
+
+
+def _describe(kw: dict) -> dict:
+    return {
+        "current_age": kw["current_age"],
+        "years_of_experience": kw["years_of_experience"],
+        "retirement_age": kw["retirement_age"],
+        "events": len(kw["non_functional_events"]),
+    }
@@ -0,0 +1,39 @@
+import statistics
+import time
+from typing import Callable
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, number: int = 1) -> dict:
+    """Runs fn `number` times per sample, `repeat` samples; per-call times in ms."""
+    fn()  # rozgrzewka (importy, cache tablic makro)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) * 1000.0 / number)
+    return {
+        "repeat": repeat,
+        "number": number,
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+    }
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """Benchmarks whose median exceeds the baseline median by more than `tolerance` (relative)."""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        limit = base["median_ms"] * (1.0 + tolerance)
+        if stats["median_ms"] > limit:
+            regressions.append({
+                "name": name,
+                "median_ms": stats["median_ms"],
+                "baseline_median_ms": base["median_ms"],
+                "ratio": stats["median_ms"] / base["median_ms"] if base["median_ms"] else float("inf"),
+            })
+    return regressions
@@ -0,0 +1,85 @@
+"""In-process route benchmarks (FastAPI TestClient, LLM stubbed)."""
+from fastapi.testclient import TestClient
+
+from backend.api.services import preview_cache
+from backend.benchmarks.harness import measure
+from backend.benchmarks.stubs import stub_llm
+
+PREFIX = "/api/v1"
+
+PREVIEW_PAYLOAD = {
+    "current_age": 35,
+    "years_of_experience": 10,
+    "current_monthly_salary": 9000,
+    "is_male": True,
+    "alpha": 1.2,
+    "beta": 0.1,
+}
+
+SALARY_PAYLOAD = {"sex": "male", "age": 35, "city": "Warszawa", "industry": "programista"}
+
+
+def run_route_benchmarks(quick: bool = False) -> dict:
+    from backend.api.main import app
+
+    repeat = 3 if quick else 7
+    number = 5 if quick else 20
+    results = {}
+
+    with stub_llm(), TestClient(app) as client:
+        def post(path: str, payload) -> None:
+            response = client.post(PREFIX + path, json=payload)
+            response.raise_for_status()
+
+        def preview_cold():
+            preview_cache.clear()
+            post("/user-profile/pension/preview", PREVIEW_PAYLOAD)
+
+        preview_cache.clear()
+        results["route.preview[cold]"] = measure(preview_cold, repeat=repeat, number=number)
+        results["route.preview[cached]"] = measure(
+            lambda: post("/user-profile/pension/preview", PREVIEW_PAYLOAD), repeat=repeat, number=number
+        )
+        results["route.preview[columnar]"] = measure(
+            lambda: post("/user-profile/pension/preview?timeline_format=columnar", {**PREVIEW_PAYLOAD, "simulation_mode": True}),
+            repeat=repeat,
+            number=number,
+        )
+        results["route.preview[numpy]"] = measure(
+            lambda: post("/user-profile/pension/preview", {**PREVIEW_PAYLOAD, "engine": "numpy", "simulation_mode": True}),
+            repeat=repeat,
+            number=number,
+        )
+        results["route.preview[simulation]"] = measure(
+            lambda: post("/user-profile/pension/preview", {**PREVIEW_PAYLOAD, "simulation_mode": True}),
+            repeat=repeat,
+            number=number,
+        )
+        results["route.preview_batch[100]"] = measure(
+            lambda: post("/user-profile/pension/preview/batch", [
+                {**PREVIEW_PAYLOAD, "current_monthly_salary": 5000 + 100 * i} for i in range(100)
+            ]),
+            repeat=repeat,
+        )
+        results["route.retirement_sweep[55-70]"] = measure(
+            lambda: post("/user-profile/pension/retirement-sweep", {
+                **PREVIEW_PAYLOAD, "retirement_age_from": 55, "retirement_age_to": 70,
+            }),
+            repeat=repeat,
+            number=number,
+        )
+        results["route.goal_seek[salary]"] = measure(
+            lambda: post("/user-profile/pension/goal-seek", {
+                **PREVIEW_PAYLOAD, "solve_for": "current_salary", "target_monthly_pension": 6000,
+            }),
+            repeat=repeat,
+            number=number,
+        )
+        results["route.monte_carlo[1000]"] = measure(
+            lambda: post("/user-profile/pension/monte-carlo", {**PREVIEW_PAYLOAD, "n_paths": 1000, "seed": 1}),
+            repeat=repeat,
+        )
+        results["route.salary_calculate"] = measure(
+            lambda: post("/salary/calculate", SALARY_PAYLOAD), repeat=repeat, number=number
+        )
+    return results
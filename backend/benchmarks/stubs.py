@@ -0,0 +1,57 @@
+"""Deterministic replacements for the LLM-backed calls used by the routes."""
+from contextlib import contextmanager
+from typing import Iterator
+
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+
+STUB_JOB_CATEGORY = "IT"
+STUB_MONTHLY_SALARY = 9000.0
+
+
+def stub_events(birth_year: int, current_year: int, count: int = 3) -> list[NonFunctionalEvent]:
+    """`count` non-overlapping events spread over the working life (ages 25+)."""
+    events = []
+    for i in range(count):
+        start = 25 + 7 * i
+        events.append(NonFunctionalEvent(
+            reason="benchmark",
+            start_age=start,
+            end_age=start + 2,
+            basis_zero=i % 2 == 0,
+            contrib_multiplier=None if i % 2 == 0 else 0.5,
+            kind="przerwa",
+        ))
+    return events
+
+
+async def _generate_periods(birth_year: int, current_year: int, min_events: int = 2, max_events: int = 5):
+    return stub_events(birth_year, current_year, count=max(min_events, min(3, max_events)))
+
+
+async def _classify_job(industry: str) -> str:
+    return STUB_JOB_CATEGORY
+
+
+async def _get_estimated_monthly_salary(industry: str, location: str) -> float:
+    return STUB_MONTHLY_SALARY
+
+
+@contextmanager
+def stub_llm() -> Iterator[None]:
+    """Swaps the LLM entry points in the modules that call them; restores them on exit."""
+    from backend.api.routes import user_profile
+    from backend.models.calculate_salary import calculate_salary
+
+    replacements = [
+        (user_profile, "generate_periods", _generate_periods),
+        (calculate_salary, "classify_job", _classify_job),
+        (calculate_salary, "get_estimated_monthly_salary", _get_estimated_monthly_salary),
+    ]
+    originals = [(module, name, getattr(module, name)) for module, name, _ in replacements]
+    try:
+        for module, name, stub in replacements:
+            setattr(module, name, stub)
+        yield
+    finally:
+        for module, name, original in originals:
+            setattr(module, name, original)
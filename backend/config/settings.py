@@ -38,6 +38,33 @@ class Settings(BaseSettings):
     cors_allow_methods: list[str] = []
     cors_allow_headers: list[str] = []
 
+    # pomiar czasu faz żądań (nagłówek Server-Timing + linia logu)
+    timing_enabled: bool = False
+
+    # cache odpowiedzi /user-profile/pension/preview (tylko bez simulation_mode)
+    preview_cache_enabled: bool = True
+    preview_cache_max_entries: int = 4096
+    preview_cache_ttl_seconds: float = 300.0
+    preview_cache_salary_rounding: float = 0.0  # krok zaokrąglenia pensji w PLN; 0 = bez zaokrąglania
+
+    # sesje what-if (/user-profile/pension/sessions): stan projekcji trzymany w pamięci procesu
+    whatif_sessions_max_entries: int = 1024
+    whatif_session_ttl_seconds: float = 1800.0
+
+    # dane referencyjne (tabela makro, parametry regresji płac); puste ścieżki = pliki z repozytorium
+    macro_data_path: str = ""
+    regression_data_path: str = ""
+    data_watch_interval_seconds: float = 0.0  # co ile sprawdzać zmiany plików; 0 = tylko POST /admin/data/reload
+    life_expectancy_table_path: str = ""  # tablica GUS (.csv lub skompilowany .bin); puste = reguła 84 / 88 lat
+
+    # endpointy /admin/* wymagają nagłówka X-Admin-Token o tej wartości; puste = wyłączone (404)
+    admin_token: str = ""
+
+    # pula procesów dla obliczeń emerytury (0 = wątki, jak dotąd)
+    engine_pool_workers: int = 0
+    engine_pool_max_pending: int = 0  # 0 = 4 × liczba procesów
+    engine_pool_queue_timeout_seconds: float = 1.0  # dłużej bez wolnego miejsca → 503
+
     @model_validator(mode="after")
     def setup_dynamic_settings(self) -> "Settings":
         if self.debug:
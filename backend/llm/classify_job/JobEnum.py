@@ -1,8 +1,16 @@
 from pydantic import BaseModel, Field, field_validator
 
-from backend.models.salary_regressions.data.regression_dict import regression_dict
+from backend.models.data.data_registry import data_registry
 
 
+def _category_enum(schema: dict) -> None:
+    # lista kategorii z bieżącej wersji danych (schemat budowany przy każdym zapytaniu)
+    schema["enum"] = list(data_registry.current().regressions)
+
+
+def _examples(schema: dict) -> None:
+    categories = list(data_registry.current().regressions)
+    schema["examples"] = [{"category": categories[0]}, {"category": categories[min(59, len(categories) - 1)]}]
 
 
 class JobEnum(BaseModel):
@@ -10,21 +18,14 @@ class JobEnum(BaseModel):
     category: str = Field(
         ...,
         description="One of the predefined categories from the regression dictionary",
-        json_schema_extra={"enum": list(regression_dict.keys())},
+        json_schema_extra=_category_enum,
     )
 
     @field_validator("category")
     @classmethod
     def category_must_be_known(cls, v: str) -> str:
-        if v not in regression_dict:
-            raise ValueError("Unknown category: must be one of the regression_dict keys")
+        if v not in data_registry.current().regressions:
+            raise ValueError("Unknown category: must be one of the regression catalogue categories")
         return v
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {"category": list(regression_dict.keys())[0]},
-                {"category": list(regression_dict.keys())[59]},
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": _examples}
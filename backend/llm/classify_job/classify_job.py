@@ -7,15 +7,15 @@ logger = logging.getLogger(__name__)
 async def classify_job(industry: str) -> str:
     """
     Classifies the job title based on the user-provided description of the industry (which can a job title, name of the
-    industry, etc. in Polish or in English). Options for the classification are provided in the regression_dict.py 
-    dictionary.
+    industry, etc. in Polish or in English). Options for the classification are the job categories of the regression
+    catalogue (regression_results.csv, served by the data registry).
 
     Args:
         industry (str): The industry/profession/job description
         (e.g., 'Frontend developer', 'Lekarz', 'budownictwo', 'uczę dzieci' etc.)
 
     Returns:
-        one of the regression_dict.py dictionary keys.
+        one of the regression catalogue categories.
     """
 
     response = await client.chat.completions.create(
@@ -10,6 +10,14 @@ class NonFunctionalEvent(BaseModel):
     reason: str = Field(description="Krótki powód, np. 'bezrobocie', '1/2 etatu', 'zagranica bez ZUS'")
     start_age: int = Field(ge=0, description="Wiek start (włącznie)")
     end_age: int = Field(gt=0, description="Wiek koniec (wyłącznie)")
+    start_month: int = Field(
+        default=0, ge=0, le=11,
+        description="Miesiąc startu w roku życia start_age (0–11); używany tylko w trybie miesięcznym"
+    )
+    end_month: int = Field(
+        default=0, ge=0, le=11,
+        description="Miesiąc końca w roku życia end_age (0–11, wyłącznie); używany tylko w trybie miesięcznym"
+    )
     contrib_multiplier: Optional[float] = Field(
         default=None,
         description="Mnożnik podstawy do składek; przy basis_zero=True będzie ignorowany/ustawiony na 0.0"
@@ -22,8 +30,8 @@ class NonFunctionalEvent(BaseModel):
 
     @model_validator(mode="after")
     def _normalize(cls, values):
-        # start < end
-        if values.end_age <= values.start_age:
+        # start < end (z dokładnością do miesiąca)
+        if values.end_age * 12 + values.end_month <= values.start_age * 12 + values.start_month:
             raise ValueError("end_age must be > start_age")
 
         # basis_zero -> multiplier = 0
@@ -1,21 +1,45 @@
 from datetime import date
 from decimal import Decimal
-from typing import Optional, List
+from typing import Literal, Optional, List
 import logging
 
-from pydantic import BaseModel, Field, computed_field
-
-from backend.models.calculate_salary.experience_multiplier import experience_multiplier
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, model_validator
+
+from backend.models.calculate_pension.decimal_engine import (
+    decimal_balances_at_current_year,
+    decimal_balances_at_retirement,
+    decimal_breakdown,
+    decimal_evaluate,
+    decimal_timeline,
+)
+from backend.models.calculate_pension.fixed_point_engine import fixed_point_evaluate
+from backend.models.calculate_pension.monthly_engine import monthly_evaluate
+from backend.models.calculate_pension.vectorized_engine import vectorized_breakdown, vectorized_evaluate
+from backend.models.calculate_salary.experience_curve import experience_curve
+from backend.models.nonfunctional_periods.compile_multipliers import (
+    ContributionMultipliers,
+    check_whole_year_events,
+    compile_contribution_multipliers,
+)
 from backend.models.nonfunctional_periods.generate_periods import generate_periods
+from backend.models.data.data_registry import data_registry
+from backend.models.pension_models.LifeExpectancyTable import LifeExpectancyTable
 from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
+from backend.models.pension_models.MacroRateTables import MacroRateTables
+from backend.models.pension_models.PensionEvaluation import PensionEvaluation
+from backend.models.pension_models.PensionKernel import PensionKernel
+from backend.models.pension_models.rate_tables_registry import get_rate_tables
 from backend.models.pension_models.RetirementAgeConfig import RetirementAgeConfig
 from backend.models.pension_models.ZUSContributionRates import ZUSContributionRates
 from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+from backend.utils.timing import phase
 
 logger = logging.getLogger(__name__)
 
 ONE = Decimal("1")
 
+RETIREMENT_AGE_CONFIG = RetirementAgeConfig()
+
 
 class PensionModel(BaseModel):
     """
@@ -38,7 +62,7 @@ class PensionModel(BaseModel):
     current_year: int = Field(default_factory=lambda: date.today().year)
 
     macroeconomic_factors: MacroeconomicFactors = Field(
-        default=MacroeconomicFactors(), description="Czynniki makro (z historią)"
+        default_factory=MacroeconomicFactors, description="Czynniki makro (z historią, bieżąca wersja danych)"
     )
     zus_contribution_rate: ZUSContributionRates = Field(
         default=ZUSContributionRates(), description="Stawki składek ZUS (I/II filar)"
@@ -61,14 +85,108 @@ class PensionModel(BaseModel):
         description="Okresy nieczynności/redukcji podstawy składek (basis_zero lub multiplier < 1)."
     )
 
+    # --- SILNIK OBLICZEŃ ---
+    engine: Literal["decimal", "numpy", "fixed"] = Field(
+        default="decimal",
+        description=(
+            "'decimal' — dokładne pętle Decimal; 'numpy' — wektorowy float64 (te same klucze, wartości float); "
+            "'fixed' — stałoprzecinkowy: grosze jako int, stopy jako skalowane int (powtarzalny co do grosza)"
+        ),
+    )
+    resolution: Literal["year", "month"] = Field(
+        default="year",
+        description=(
+            "'month' — składki naliczane miesięcznie, eventy z dokładnością do miesiąca (tylko engine='numpy'); "
+            "'year' — eventy z granicami miesięcznymi są odrzucane"
+        ),
+    )
+    timeline_granularity: Literal["year", "month"] = Field(
+        default="year",
+        description="Ziarnistość osi czasu w trybie miesięcznym",
+    )
+    life_expectancy_table: Optional[LifeExpectancyTable] = Field(
+        default_factory=lambda: data_registry.current().life_table,
+        exclude=True,
+        description="Tablica średniego dalszego trwania życia (GUS); None — reguła 84 / 88 lat",
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # --- cache (budowane leniwie, unieważniane przy zmianie wejść) ---
+    _rate_tables: Optional[MacroRateTables] = PrivateAttr(default=None)
+    _multipliers: Optional[ContributionMultipliers] = PrivateAttr(default=None)
+    _monthly_multipliers: Optional[ContributionMultipliers] = PrivateAttr(default=None)
+    _evaluation: Optional[PensionEvaluation] = PrivateAttr(default=None)
+    _summary: Optional[PensionEvaluation] = PrivateAttr(default=None)
+    _kernel: Optional[PensionKernel] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _check_engine_resolution(self):
+        # tryb miesięczny liczy tylko silnik float64; jawny 'decimal' / 'fixed' byłby po cichu pominięty
+        if self.resolution == "month" and self.engine != "numpy":
+            if "engine" in self.model_fields_set:
+                raise ValueError(
+                    f"resolution='month' is computed in float64 only; engine='{self.engine}' is not supported "
+                    "(use engine='numpy' or omit it)"
+                )
+            self.engine = "numpy"
+        return self
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._evaluation = None
+            self._summary = None
+            self._kernel = None
+            if name == "macroeconomic_factors":
+                self._rate_tables = None
+            elif name in ("non_functional_events", "resolution"):
+                self._multipliers = None
+                self._monthly_multipliers = None
+
+    @property
+    def rate_tables(self) -> MacroRateTables:
+        """
+        Gęste tablice stóp i iloczynów prefiksowych (rok → indeks), współdzielone w procesie
+        przez wszystkie modele o tej samej treści macroeconomic_factors.
+        """
+        if self._rate_tables is None:
+            self._rate_tables = get_rate_tables(self.macroeconomic_factors)
+        return self._rate_tables
+
+    @property
+    def kernel(self) -> PensionKernel:
+        """Niemutowalny snapshot wejść dla silników obliczeń (bez walidacji pydantic w pętlach)."""
+        if self._kernel is None:
+            self._kernel = PensionKernel.from_model(self)
+        return self._kernel
+
+    @property
+    def contribution_multipliers(self) -> ContributionMultipliers:
+        """
+        Mnożniki podstawy składek per wiek, skompilowane raz z listy eventów.
+        W trybie rocznym eventy z granicami miesięcznymi → ValueError (nie są gubione po cichu).
+        """
+        if self._multipliers is None:
+            if self.resolution == "year":
+                check_whole_year_events(self.non_functional_events)
+            self._multipliers = compile_contribution_multipliers(self.non_functional_events)
+        return self._multipliers
+
+    @property
+    def monthly_contribution_multipliers(self) -> ContributionMultipliers:
+        """Jak wyżej, ale indeksowane miesiącem życia (wiek * 12 + miesiąc)."""
+        if self._monthly_multipliers is None:
+            self._monthly_multipliers = compile_contribution_multipliers(self.non_functional_events, monthly=True)
+        return self._monthly_multipliers
+
     # ------------------------------
     # Krzywa doświadczenia
     # ------------------------------
     def _experience_multiplier_ratio(self, year_delta: int) -> Decimal:
+        curve = experience_curve(self.alpha, self.beta)
         exp_then = max(0, self.years_of_experience + year_delta)
-        m_then = experience_multiplier(exp=exp_then, alpha=self.alpha, beta=self.beta)
-        m_now  = experience_multiplier(exp=self.years_of_experience, alpha=self.alpha, beta=self.beta)
-        return Decimal(str(m_then / m_now))
+        return Decimal(str(curve.at(exp_then) / curve.at(self.years_of_experience)))
 
     def salary_in_the_past_or_future_real(self, current_salary: Decimal, year_delta: int) -> Decimal:
         """
@@ -80,51 +198,25 @@ class PensionModel(BaseModel):
     # Stopy makro (z historii lub defaultów)
     # ------------------------------
     def _inflation_rate_for_year(self, year: int) -> Decimal:
-        ys = str(year)
-        if ys in self.macroeconomic_factors.historical_data:
-            infl = self.macroeconomic_factors.historical_data[ys][0]
-            return infl
-        return self.macroeconomic_factors.inflation_rate
+        return self.rate_tables.rate("inflation", year)
 
     def _real_wage_growth_rate_for_year(self, year: int) -> Decimal:
-        ys = str(year)
-        if ys in self.macroeconomic_factors.historical_data:
-            real = self.macroeconomic_factors.historical_data[ys][1]
-            return real
-        return self.macroeconomic_factors.real_wage_growth_rate
+        return self.rate_tables.rate("real_wage", year)
 
     def _nominal_wage_growth_rate_for_year(self, year: int) -> Decimal:
-        ys = str(year)
-        if ys in self.macroeconomic_factors.historical_data:
-            infl, real, *_ = self.macroeconomic_factors.historical_data[ys]
-            return infl + real
-        return self.macroeconomic_factors.nominal_wage_growth_rate
+        return self.rate_tables.rate("nominal_wage", year)
 
     # ------------------------------
     # Akumulatory wzrostów (nominalny / realny)
     # ------------------------------
     def _cumulative_nominal_growth(self, from_year: int, to_year: int) -> Decimal:
-        factor = ONE
-        if to_year > from_year:
-            for y in range(from_year, to_year):
-                factor *= (ONE + self._nominal_wage_growth_rate_for_year(y))
-        elif to_year < from_year:
-            for y in range(to_year, from_year):
-                factor /= (ONE + self._nominal_wage_growth_rate_for_year(y))
-        return factor
+        return self.rate_tables.factor("nominal_wage", from_year, to_year)
 
     def _cumulative_real_growth(self, from_year: int, to_year: int) -> Decimal:
         """
         Skumulowany REALNY wzrost płac (bez inflacji) między latami.
         """
-        factor = ONE
-        if to_year > from_year:
-            for y in range(from_year, to_year):
-                factor *= (ONE + self._real_wage_growth_rate_for_year(y))
-        elif to_year < from_year:
-            for y in range(to_year, from_year):
-                factor /= (ONE + self._real_wage_growth_rate_for_year(y))
-        return factor
+        return self.rate_tables.factor("real_wage", from_year, to_year)
 
     # ------------------------------
     # Pensje: nominalna i realna (z makro)
@@ -158,15 +250,12 @@ class PensionModel(BaseModel):
     @computed_field  # type: ignore
     @property
     def years_to_standard_retirement(self) -> int:
-        config = RetirementAgeConfig()
-        retirement_age = self.retirement_age or config.get_retirement_age(self.is_male)
-        return max(0, retirement_age - self.current_age)
+        return max(0, self.effective_retirement_age - self.current_age)
 
     @computed_field  # type: ignore
     @property
     def effective_retirement_age(self) -> int:
-        config = RetirementAgeConfig()
-        return self.retirement_age or config.get_retirement_age(self.is_male)
+        return self.retirement_age or RETIREMENT_AGE_CONFIG.get_retirement_age(self.is_male)
 
     # --- pomocnicze do eventów ---
     @property
@@ -184,13 +273,7 @@ class PensionModel(BaseModel):
         - w przeciwnym razie min(contrib_multiplier) z pokrywających
         - brak eventów → 1
         """
-        applicable = [e for e in self.non_functional_events if e.start_age <= age < e.end_age]
-        if not applicable:
-            return Decimal("1")
-        if any(e.basis_zero for e in applicable):
-            return Decimal("0")
-        min_m = min(e.contrib_multiplier for e in applicable)
-        return Decimal(str(min_m))
+        return self.contribution_multipliers.for_age(age)
 
     # ------------------------------
     # Składki roczne (z miesięcznego brutto)
@@ -205,200 +288,96 @@ class PensionModel(BaseModel):
     # Stopy waloryzacji I/II: nominalne i realne
     # ------------------------------
     def get_i_pillar_valorization_rate(self, year: int) -> Decimal:
-        ys = str(year)
-        if ys in self.macroeconomic_factors.historical_data:
-            return self.macroeconomic_factors.historical_data[ys][2]
-        return self.macroeconomic_factors.i_pillar_indexation_rate
+        return self.rate_tables.rate("i_pillar", year)
 
     def get_ii_pillar_indexation_rate(self, year: int) -> Decimal:
-        ys = str(year)
-        if ys in self.macroeconomic_factors.historical_data:
-            return self.macroeconomic_factors.historical_data[ys][3]
-        return self.macroeconomic_factors.ii_pillar_indexation_rate
+        return self.rate_tables.rate("ii_pillar", year)
 
     def get_i_pillar_real_valorization_rate(self, year: int) -> Decimal:
-        r_nom = self.get_i_pillar_valorization_rate(year)
-        pi    = self._inflation_rate_for_year(year)
-        return (ONE + r_nom) / (ONE + pi) - ONE
+        return self.rate_tables.rate("i_pillar_real", year)
 
     def get_ii_pillar_real_indexation_rate(self, year: int) -> Decimal:
-        r_nom = self.get_ii_pillar_indexation_rate(year)
-        pi    = self._inflation_rate_for_year(year)
-        return (ONE + r_nom) / (ONE + pi) - ONE
+        return self.rate_tables.rate("ii_pillar_real", year)
 
     # ------------------------------
     # Waloryzacja kapitału: nominal / real
     # ------------------------------
+    def _valorize(self, series: str, capital: Decimal, from_year: int, to_year: int) -> Decimal:
+        if to_year <= from_year:
+            return capital
+        return capital * self.rate_tables.factor(series, from_year, to_year)
+
     def valorize_i_pillar_capital(self, capital: Decimal, from_year: int, to_year: int) -> Decimal:
-        out = capital
-        for y in range(from_year, to_year):
-            out *= (ONE + self.get_i_pillar_valorization_rate(y))
-        return out
+        return self._valorize("i_pillar", capital, from_year, to_year)
 
     def index_ii_pillar_capital(self, capital: Decimal, from_year: int, to_year: int) -> Decimal:
-        out = capital
-        for y in range(from_year, to_year):
-            out *= (ONE + self.get_ii_pillar_indexation_rate(y))
-        return out
+        return self._valorize("ii_pillar", capital, from_year, to_year)
 
     def valorize_i_pillar_capital_real(self, capital: Decimal, from_year: int, to_year: int) -> Decimal:
-        out = capital
-        for y in range(from_year, to_year):
-            out *= (ONE + self.get_i_pillar_real_valorization_rate(y))
-        return out
+        return self._valorize("i_pillar_real", capital, from_year, to_year)
 
     def index_ii_pillar_capital_real(self, capital: Decimal, from_year: int, to_year: int) -> Decimal:
-        out = capital
-        for y in range(from_year, to_year):
-            out *= (ONE + self.get_ii_pillar_real_indexation_rate(y))
-        return out
+        return self._valorize("ii_pillar_real", capital, from_year, to_year)
 
     # ------------------------------
-    # Rekonstrukcja i projekcja (NOMINALNIE) — z eventami
+    # Rekonstrukcja i projekcja — z eventami (silnik referencyjny decimal_engine)
     # ------------------------------
     def reconstruct_historical_contributions(self) -> tuple[Decimal, Decimal]:
         """
         NOMINAL: składki od nominalnej pensji miesięcznej, modyfikowane przez eventy,
-        zwaloryzowane/indexowane do roku bieżącego.
+        zwaloryzowane/indexowane do roku bieżącego (plus kapitał już zgromadzony).
         """
-        total_i = self.accumulated_i_pillar_capital or Decimal("0")
-        total_ii = self.accumulated_ii_pillar_capital or Decimal("0")
-
-        for year in range(self.work_start_year, self.current_year):
-            year_delta = year - self.current_year
-            base_monthly_nom = self.salary_in_the_past_or_future_nominal(self.current_salary, year_delta)
-
-            age_then = self.age_in_year(year)
-            mult = self.contribution_multiplier_for_age(age_then)
-            if mult == 0:
-                continue
-
-            adj_monthly = base_monthly_nom * mult
-            i_contrib = self.calculate_annual_contribution_i_pillar(adj_monthly)
-            ii_contrib = self.calculate_annual_contribution_ii_pillar(adj_monthly)
-
-            total_i += self.valorize_i_pillar_capital(i_contrib, year, self.current_year)
-            total_ii += self.index_ii_pillar_capital(ii_contrib, year, self.current_year)
-        return total_i, total_ii
+        i_nom, ii_nom, _, _ = decimal_balances_at_current_year(self.kernel)
+        return self._accumulated_i() + i_nom, self._accumulated_ii() + ii_nom
 
     def project_future_accumulation(self) -> tuple[Decimal, Decimal]:
-        """
-        NOMINAL: projekcja do roku emerytury z eventami, waloryzacja/indexacja do roku emerytury.
-        """
-        total_i = Decimal("0")
-        total_ii = Decimal("0")
-        retirement_year = self.current_year + self.years_to_standard_retirement
-
-        for year in range(self.current_year, retirement_year):
-            year_delta = year - self.current_year
-            base_monthly_nom = self.salary_in_the_past_or_future_nominal(self.current_salary, year_delta)
-
-            age_then = self.age_in_year(year)
-            mult = self.contribution_multiplier_for_age(age_then)
-            if mult == 0:
-                continue
-
-            adj_monthly = base_monthly_nom * mult
-            i_contrib = self.calculate_annual_contribution_i_pillar(adj_monthly)
-            ii_contrib = self.calculate_annual_contribution_ii_pillar(adj_monthly)
+        """NOMINAL: składki od roku bieżącego z eventami, waloryzowane/indexowane do roku emerytury."""
+        i_nom, ii_nom, _, _ = decimal_balances_at_retirement(self.kernel, self.current_year)
+        return i_nom, ii_nom
 
-            total_i += self.valorize_i_pillar_capital(i_contrib, year, retirement_year)
-            total_ii += self.index_ii_pillar_capital(ii_contrib, year, retirement_year)
-        return total_i, total_ii
-
-    # ------------------------------
-    # Rekonstrukcja i projekcja (REALNIE) — z eventami
-    # ------------------------------
     def reconstruct_historical_contributions_real(self) -> tuple[Decimal, Decimal]:
         """
         REAL: składki od pensji REALNYCH (doświadczenie × real growth) z eventami,
-        waloryzowane realnie do roku bieżącego.
+        waloryzowane realnie do roku bieżącego (plus kapitał już zgromadzony — nominalny na dziś).
         """
-        total_i = Decimal("0")
-        total_ii = Decimal("0")
-
-        # (opcjonalnie) już zgromadzone kapitały — tu bez zmiany, są nominalne na dziś
-        if self.accumulated_i_pillar_capital:
-            total_i += self.valorize_i_pillar_capital_real(self.accumulated_i_pillar_capital,
-                                                           self.current_year, self.current_year)
-        if self.accumulated_ii_pillar_capital:
-            total_ii += self.index_ii_pillar_capital_real(self.accumulated_ii_pillar_capital,
-                                                          self.current_year, self.current_year)
-
-        for year in range(self.work_start_year, self.current_year):
-            year_delta = year - self.current_year
-            base_monthly_real = self.salary_in_the_past_or_future_real_with_macro(self.current_salary, year_delta)
-
-            age_then = self.age_in_year(year)
-            mult = self.contribution_multiplier_for_age(age_then)
-            if mult == 0:
-                continue
-
-            adj_monthly = base_monthly_real * mult
-            i_contrib = self.calculate_annual_contribution_i_pillar(adj_monthly)
-            ii_contrib = self.calculate_annual_contribution_ii_pillar(adj_monthly)
-
-            total_i += self.valorize_i_pillar_capital_real(i_contrib, year, self.current_year)
-            total_ii += self.index_ii_pillar_capital_real(ii_contrib, year, self.current_year)
-        return total_i, total_ii
+        _, _, i_real, ii_real = decimal_balances_at_current_year(self.kernel)
+        return self._accumulated_i() + i_real, self._accumulated_ii() + ii_real
 
     def project_future_accumulation_real(self) -> tuple[Decimal, Decimal]:
-        """
-        REAL: projekcja do roku emerytury z eventami, waloryzacja realna do roku emerytury.
-        """
-        total_i = Decimal("0")
-        total_ii = Decimal("0")
-        retirement_year = self.current_year + self.years_to_standard_retirement
-
-        for year in range(self.current_year, retirement_year):
-            year_delta = year - self.current_year
-            base_monthly_real = self.salary_in_the_past_or_future_real_with_macro(self.current_salary, year_delta)
+        """REAL: składki od roku bieżącego z eventami, waloryzowane realnie do roku emerytury."""
+        _, _, i_real, ii_real = decimal_balances_at_retirement(self.kernel, self.current_year)
+        return i_real, ii_real
 
-            age_then = self.age_in_year(year)
-            mult = self.contribution_multiplier_for_age(age_then)
-            if mult == 0:
-                continue
+    def _accumulated_i(self) -> Decimal:
+        return self.accumulated_i_pillar_capital or Decimal("0")
 
-            adj_monthly = base_monthly_real * mult
-            i_contrib = self.calculate_annual_contribution_i_pillar(adj_monthly)
-            ii_contrib = self.calculate_annual_contribution_ii_pillar(adj_monthly)
-
-            total_i += self.valorize_i_pillar_capital_real(i_contrib, year, retirement_year)
-            total_ii += self.index_ii_pillar_capital_real(ii_contrib, year, retirement_year)
-        return total_i, total_ii
+    def _accumulated_ii(self) -> Decimal:
+        return self.accumulated_ii_pillar_capital or Decimal("0")
 
     # ------------------------------
     # Łączny kapitał na emeryturę
     # ------------------------------
+    def _decimal_summary(self) -> PensionEvaluation:
+        """Breakdown silnika referencyjnego — zapamiętany, gdy to silnik modelu."""
+        if self.engine == "decimal" and self.resolution == "year":
+            return self.evaluate_summary()
+        return decimal_breakdown(self.kernel)
+
     def calculate_total_retirement_capital(self) -> tuple[Decimal, Decimal]:
         """Nominalnie."""
-        past_i, past_ii = self.reconstruct_historical_contributions()
-        future_i, future_ii = self.project_future_accumulation()
-
-        retirement_year = self.current_year + self.years_to_standard_retirement
-        past_i_at_ret = self.valorize_i_pillar_capital(past_i, self.current_year, retirement_year)
-        past_ii_at_ret = self.index_ii_pillar_capital(past_ii, self.current_year, retirement_year)
-
-        return past_i_at_ret + future_i, past_ii_at_ret + future_ii
+        breakdown = self._decimal_summary().breakdown
+        return breakdown["i_pillar_capital_nominal"], breakdown["ii_pillar_capital_nominal"]
 
     def calculate_total_retirement_capital_real(self) -> tuple[Decimal, Decimal]:
         """Realnie."""
-        past_i, past_ii = self.reconstruct_historical_contributions_real()
-        future_i, future_ii = self.project_future_accumulation_real()
-
-        retirement_year = self.current_year + self.years_to_standard_retirement
-        past_i_at_ret = self.valorize_i_pillar_capital_real(past_i, self.current_year, retirement_year)
-        past_ii_at_ret = self.index_ii_pillar_capital_real(past_ii, self.current_year, retirement_year)
-
-        return past_i_at_ret + future_i, past_ii_at_ret + future_ii
+        breakdown = self._decimal_summary().breakdown
+        return breakdown["i_pillar_capital_real"], breakdown["ii_pillar_capital_real"]
 
     # ------------------------------
     # Emerytura miesięczna
     # ------------------------------
-    def _life_expectancy_years_default(self) -> int:
-        retirement_age = self.effective_retirement_age
-        years = (84 - retirement_age) if self.is_male else (88 - retirement_age)
-        return max(1, years)
+    def _life_expectancy_months_default(self) -> Decimal:
+        return self.kernel.life_expectancy_months
 
     def calculate_monthly_pension(
         self,
@@ -409,135 +388,85 @@ class PensionModel(BaseModel):
         """Nominalnie."""
         if total_i_pillar is None or total_ii_pillar is None:
             total_i_pillar, total_ii_pillar = self.calculate_total_retirement_capital()
-        life_expectancy_years = life_expectancy_years or self._life_expectancy_years_default()
-        return (total_i_pillar + total_ii_pillar) / Decimal(str(life_expectancy_years * 12))
+        if life_expectancy_years:
+            months = Decimal(life_expectancy_years * 12)
+        else:
+            months = self._life_expectancy_months_default()
+        return (total_i_pillar + total_ii_pillar) / months
 
     def calculate_monthly_pension_real(self) -> Decimal:
         """Realnie."""
         total_i, total_ii = self.calculate_total_retirement_capital_real()
-        life_expectancy_years = self._life_expectancy_years_default()
-        return (total_i + total_ii) / Decimal(str(life_expectancy_years * 12))
+        return (total_i + total_ii) / self._life_expectancy_months_default()
 
     # ------------------------------
     # Replacement rate
     # ------------------------------
     def get_replacement_rate_nominal(self) -> Decimal:
-        mp = self.calculate_monthly_pension()
-        yrs = self.years_to_standard_retirement
-        final_salary_nom = self.salary_in_the_past_or_future_nominal(self.current_salary, yrs)
-        return (mp / final_salary_nom) if final_salary_nom else Decimal("0")
+        return self.evaluate_summary().replacement_rate_nominal
 
     def get_replacement_rate_real(self) -> Decimal:
-        mp_real = self.calculate_monthly_pension_real()
-        yrs = self.years_to_standard_retirement
-        final_salary_real = self.salary_in_the_past_or_future_real_with_macro(self.current_salary, yrs)
-        return (mp_real / final_salary_real) if final_salary_real else Decimal("0")
+        return self.evaluate_summary().replacement_rate_real
+
+    # ------------------------------
+    # Jedno przejście: breakdown + replacement rates + oś czasu
+    # ------------------------------
+    def evaluate(self) -> PensionEvaluation:
+        """
+        Liczy wszystko naraz i zapamiętuje wynik na instancji
+        (unieważniany przy przypisaniu dowolnego pola wejściowego).
+        """
+        if self._evaluation is None:
+            with phase("pension_evaluate"):
+                kernel = self.kernel
+                if self.resolution == "month":
+                    self._evaluation = monthly_evaluate(kernel)
+                elif self.engine == "numpy":
+                    self._evaluation = vectorized_evaluate(kernel)
+                elif self.engine == "fixed":
+                    self._evaluation = fixed_point_evaluate(kernel)
+                else:
+                    self._evaluation = decimal_evaluate(kernel)
+        return self._evaluation
+
+    def evaluate_summary(self) -> PensionEvaluation:
+        """
+        Sam breakdown (pusta oś czasu). Silniki 'decimal' i 'numpy' liczą pętlą tylko lata
+        historyczne i z eventami, ogon kariery o stałych stopach — w postaci zamkniętej.
+        Gdy pełny wynik jest już policzony, zwraca go.
+        """
+        if self._evaluation is not None or self.resolution == "month" or self.engine == "fixed":
+            return self.evaluate()
+        if self._summary is None:
+            with phase("pension_evaluate"):
+                if self.engine == "numpy":
+                    self._summary = vectorized_breakdown(self.kernel)
+                else:
+                    self._summary = decimal_breakdown(self.kernel)
+        return self._summary
 
     # ------------------------------
     # Szczegóły (obie waluty)
     # ------------------------------
     def get_detailed_breakdown(self) -> dict:
-        # nominal
-        total_i_nom, total_ii_nom = self.calculate_total_retirement_capital()
-        monthly_pension_nom = self.calculate_monthly_pension(total_i_nom, total_ii_nom)
-        rr_nom = self.get_replacement_rate_nominal()
-
-        # real
-        total_i_real, total_ii_real = self.calculate_total_retirement_capital_real()
-        monthly_pension_real = self.calculate_monthly_pension_real()
-        rr_real = self.get_replacement_rate_real()
-
-        yrs = self.years_to_standard_retirement
-        final_salary_nom = self.salary_in_the_past_or_future_nominal(self.current_salary, yrs)
-        final_salary_real = self.salary_in_the_past_or_future_real_with_macro(self.current_salary, yrs)
-
-        return {
-            "current_age": self.current_age,
-            "retirement_age": self.effective_retirement_age,
-            "years_to_retirement": yrs,
-
-            # salaries
-            "current_monthly_salary_nominal": self.current_salary,
-            "final_monthly_salary_nominal": final_salary_nom,
-            "final_monthly_salary_real": final_salary_real,
-
-            # nominal block
-            "i_pillar_capital_nominal": total_i_nom,
-            "ii_pillar_capital_nominal": total_ii_nom,
-            "total_capital_nominal": total_i_nom + total_ii_nom,
-            "monthly_pension_nominal": monthly_pension_nom,
-            "replacement_rate_percent_nominal": rr_nom * Decimal("100"),
-
-            # real block
-            "i_pillar_capital_real": total_i_real,
-            "ii_pillar_capital_real": total_ii_real,
-            "total_capital_real": total_i_real + total_ii_real,
-            "monthly_pension_real": monthly_pension_real,
-            "replacement_rate_percent_real": rr_real * Decimal("100"),
-        }
+        evaluation = self.evaluate_summary()
+        with phase("breakdown"):
+            return dict(evaluation.breakdown)
 
     # ------------------------------
     # Oś czasu dla obu walut (z eventami)
     # ------------------------------
     def get_cumulative_capital_by_year(self) -> dict[int, dict]:
-        timeline = {}
-        retirement_year = self.current_year + self.years_to_standard_retirement
-
-        for target_year in range(self.current_year, retirement_year + 1):
-            # NOMINAL: sumujemy po latach pracy do target_year z eventami
-            i_nom = Decimal("0")
-            ii_nom = Decimal("0")
-            for y in range(self.work_start_year, target_year):
-                yd = y - self.current_year
-                sal_nom = self.salary_in_the_past_or_future_nominal(self.current_salary, yd)
-
-                age_then = self.age_in_year(y)
-                mult = self.contribution_multiplier_for_age(age_then)
-                if mult == 0:
-                    continue
-                adj = sal_nom * mult
-
-                i_nom += self.valorize_i_pillar_capital(self.calculate_annual_contribution_i_pillar(adj), y, target_year)
-                ii_nom += self.index_ii_pillar_capital(self.calculate_annual_contribution_ii_pillar(adj), y, target_year)
-
-            # REAL: analogicznie, ale pensje realne i waloryzacja realna
-            i_real = Decimal("0")
-            ii_real = Decimal("0")
-            for y in range(self.work_start_year, target_year):
-                yd = y - self.current_year
-                sal_real = self.salary_in_the_past_or_future_real_with_macro(self.current_salary, yd)
-
-                age_then = self.age_in_year(y)
-                mult = self.contribution_multiplier_for_age(age_then)
-                if mult == 0:
-                    continue
-                adj = sal_real * mult
-
-                i_real += self.valorize_i_pillar_capital_real(self.calculate_annual_contribution_i_pillar(adj), y, target_year)
-                ii_real += self.index_ii_pillar_capital_real(self.calculate_annual_contribution_ii_pillar(adj), y, target_year)
-
-            # Pensje w roku target_year (bez redukcji eventem — do referencji/wykresu)
-            yrs_since = target_year - self.current_year
-            sal_nom_year  = self.salary_in_the_past_or_future_nominal(self.current_salary, yrs_since)
-            sal_real_year = self.salary_in_the_past_or_future_real_with_macro(self.current_salary, yrs_since)
-
-            timeline[target_year] = {
-                "i_pillar_nominal": i_nom,
-                "ii_pillar_nominal": ii_nom,
-                "total_nominal": i_nom + ii_nom,
-                "annual_salary_nominal": sal_nom_year * Decimal("12"),
-
-                "i_pillar_real": i_real,
-                "ii_pillar_real": ii_real,
-                "total_real": i_real + ii_real,
-                "annual_salary_real": sal_real_year * Decimal("12"),
-            }
-
-        return timeline
+        """
+        Salda kont (bez kapitału zgromadzonego) i pensje roczne dla lat od bieżącego do
+        roku emerytury — przebieg w przód silnika Decimal.
+        """
+        return decimal_timeline(self.kernel)
 
     def get_timeline_for_visualization(self) -> list[dict]:
-        tl = self.get_cumulative_capital_by_year()
-        return [{"year": y, **data} for y, data in sorted(tl.items())]
+        evaluation = self.evaluate()
+        with phase("timeline"):
+            return [dict(point) for point in evaluation.timeline]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+"""
+Batch projection engine: evaluates many PensionModel profiles at once as a
+(profiles x calendar years) float64 matrix.
+
+All profiles share one calendar-year axis and one set of macro rate vectors (taken
+from the first model's rate tables), so the macro data is read once per batch.
+Profiles may differ in age, experience, salary, alpha/beta, sex, retirement age,
+accumulated capital and events. Results match the per-profile 'numpy' engine.
+
+Per-profile inputs enter the matrices by gathers, not per-profile array ops: experience
+curves from a table of the distinct (alpha, beta) pairs, event multipliers from one
+flat table of all compiled events, and the timelines are converted to Python values
+once for the whole matrix.
+"""
+from typing import Sequence
+
+import numpy as np
+
+from backend.models.calculate_pension.vectorized_engine import (
+    _breakdown_dict,
+    _columns,
+    _prefix_products,
+)
+from backend.models.calculate_salary.experience_curve import experience_curve
+from backend.models.pension_models.PensionEvaluation import PensionEvaluation
+from backend.models.pension_models.PensionKernel import PensionKernel
+
+
+def batch_evaluate(kernels: Sequence[PensionKernel]) -> list[PensionEvaluation]:
+    """
+    All profiles must share macroeconomic_factors and zus_contribution_rate
+    (the rates of the first one are used for the whole batch).
+    """
+    if not kernels:
+        return []
+
+    def column(values) -> np.ndarray:
+        return np.asarray(values)[:, None]
+
+    current_year = column([k.current_year for k in kernels])
+    work_start = column([k.work_start_year for k in kernels])
+    retirement_year = column([k.retirement_year for k in kernels])
+    experience = column([k.years_of_experience for k in kernels])
+    salary = column([float(k.current_salary) for k in kernels])
+
+    y0 = int(work_start.min())
+    y1 = int(retirement_year.max())
+    years = np.arange(y0, y1 + 1)
+    n = years.size
+
+    tables = kernels[0].rate_tables
+    infl, real, i_val, ii_idx = (
+        tables.float_rates(series, y0, y1 + 1)
+        for series in ("inflation", "real_wage", "i_pillar", "ii_pillar")
+    )
+
+    rows = np.arange(len(kernels))
+    c = (current_year - y0).ravel()
+    w = (retirement_year - y0).ravel()
+
+    # pensje: krzywa doświadczenia × skumulowany wzrost płac od roku bieżącego
+    p_nom = _prefix_products(1.0 + infl + real)
+    p_real = _prefix_products(1.0 + real)
+    nominal_factor = p_nom[None, :n] / p_nom[c][:, None]
+    real_factor = p_real[None, :n] / p_real[c][:, None]
+
+    exp = np.maximum(0, experience + (years[None, :] - current_year))
+    curves, curve_rows = _curve_table(kernels, int(exp.max()) + 1)
+    base = salary * (curves[curve_rows[:, None], exp] / curves[curve_rows[:, None], experience])
+    salary_nom = base * nominal_factor
+    salary_real = base * real_factor
+
+    working = (years[None, :] >= work_start) & (years[None, :] < retirement_year)
+    mult = working.astype(np.float64) * _multiplier_matrix(kernels, years)
+
+    i_rate = float(kernels[0].i_pillar_rate) * 12.0
+    ii_rate = float(kernels[0].ii_pillar_rate) * 12.0
+
+    v_i = _prefix_products(1.0 + i_val)
+    v_ii = _prefix_products(1.0 + ii_idx)
+    v_i_real = _prefix_products((1.0 + i_val) / (1.0 + infl))
+    v_ii_real = _prefix_products((1.0 + ii_idx) / (1.0 + infl))
+
+    adj_nom = salary_nom * mult
+    adj_real = salary_real * mult
+
+    def balances(contrib: np.ndarray, v: np.ndarray) -> np.ndarray:
+        # B[p, k] = v[k] * sum_{j<k} contrib[p, j] / v[j]  (k ↔ rok y0 + k)
+        acc = np.zeros((contrib.shape[0], n))
+        np.cumsum(contrib[:, :-1] / v[None, :n - 1], axis=1, out=acc[:, 1:])
+        return acc * v[None, :n]
+
+    i_nom = balances(adj_nom * i_rate, v_i)
+    ii_nom = balances(adj_nom * ii_rate, v_ii)
+    i_real = balances(adj_real * i_rate, v_i_real)
+    ii_real = balances(adj_real * ii_rate, v_ii_real)
+
+    acc_i = np.array([float(k.accumulated_i_pillar_capital) for k in kernels])
+    acc_ii = np.array([float(k.accumulated_ii_pillar_capital) for k in kernels])
+    totals = np.stack([
+        acc_i * v_i[w] / v_i[c] + i_nom[rows, w],
+        acc_ii * v_ii[w] / v_ii[c] + ii_nom[rows, w],
+        acc_i * v_i_real[w] / v_i_real[c] + i_real[rows, w],
+        acc_ii * v_ii_real[w] / v_ii_real[c] + ii_real[rows, w],
+    ], axis=1)
+    final_nom = salary_nom[rows, w]
+    final_real = salary_real[rows, w]
+
+    full = _columns(np.broadcast_to(years, i_nom.shape), i_nom, ii_nom, salary_nom, i_real, ii_real, salary_real)
+    keys = tuple(full)
+    values = {key: full[key].tolist() for key in keys}
+
+    results = []
+    for p, k in enumerate(kernels):
+        breakdown, rr_nom, rr_real = _breakdown_dict(k, tuple(totals[p]), final_nom[p], final_real[p])
+        sl = slice(c[p], w[p] + 1)
+        columns = {key: full[key][p, sl] for key in keys}
+        points = [dict(zip(keys, row)) for row in zip(*(values[key][p][sl] for key in keys))]
+        results.append(PensionEvaluation.build(breakdown, rr_nom, rr_real, points, columns=columns))
+    return results
+
+
+def _curve_table(kernels: Sequence[PensionKernel], width: int) -> tuple[np.ndarray, np.ndarray]:
+    """Experience curves of the distinct (alpha, beta) pairs (rows) and each profile's row."""
+    pairs = [(k.alpha, k.beta) for k in kernels]
+    distinct = {pair: row for row, pair in enumerate(dict.fromkeys(pairs))}
+    table = np.stack([experience_curve(alpha, beta).head(width) for alpha, beta in distinct])
+    return table, np.array([distinct[pair] for pair in pairs])
+
+
+def _multiplier_matrix(kernels: Sequence[PensionKernel], years: np.ndarray) -> np.ndarray:
+    """(profiles x years) contribution multipliers, gathered from one flat table of all events."""
+    out = np.ones((len(kernels), years.size))
+    compiled = [(p, k.birth_year, k.contribution_multipliers) for p, k in enumerate(kernels)
+                if k.contribution_multipliers.values]
+    if not compiled:
+        return out
+    rows = np.array([p for p, _, _ in compiled])
+    birth_year = np.array([b for _, b, _ in compiled])
+    first_age = np.array([m.first_age for _, _, m in compiled])
+    lengths = np.array([m.floats.size for _, _, m in compiled])
+    flat = np.concatenate([m.floats for _, _, m in compiled])
+    offsets = np.cumsum(lengths) - lengths
+
+    idx = (years[None, :] - birth_year[:, None]) - first_age[:, None]
+    covered = (idx >= 0) & (idx < lengths[:, None])
+    gathered = np.ones(idx.shape)
+    gathered[covered] = flat[(offsets[:, None] + idx)[covered]]
+    out[rows] = gathered
+    return out
@@ -0,0 +1,127 @@
+"""
+Closed-form accumulation over constant-rate, event-free stretches.
+
+Past the last year of the historical macro table every rate is the constant default
+from MacroeconomicFactors, and past the last event every contribution multiplier is 1.
+On such a stretch the monthly salary is
+
+    S(t) = S0 / m_now * F * q^(t - a) * (1 + alpha - alpha * e^(-beta * exp_t))
+
+(q — constant wage growth, F — cumulative wage growth from the current year to `a`), so
+the contributions valorized at a constant rate g to the end of the stretch are two
+geometric series, in q/g and in q·e^(-beta)/g. Only historical and event-affected years
+need the year-by-year loop: the breakdown-only paths of the engines (decimal_breakdown,
+vectorized_breakdown) stop the loop at tail_start() and add the tail from here.
+"""
+import math
+from decimal import Decimal
+from functools import lru_cache
+
+from backend.models.calculate_salary.experience_curve import experience_curve
+from backend.models.pension_models.PensionKernel import PensionKernel
+
+
+ONE = Decimal("1")
+ZERO = Decimal("0")
+
+
+@lru_cache(maxsize=4096)
+def _exp(x: Decimal) -> Decimal:
+    """Decimal e^x — the same (beta, experience) terms recur for every account and request."""
+    return x.exp()
+
+
+def _geometric_sum(ratio: Decimal, n: int) -> Decimal:
+    """sum_{j=0}^{n-1} ratio^j"""
+    if ratio == ONE:
+        return Decimal(n)
+    return (ratio ** n - ONE) / (ratio - ONE)
+
+
+def constant_rate_start(kernel: PensionKernel) -> int:
+    """First year from which all macro rates are defaults and no event affects contributions."""
+    tables = kernel.rate_tables
+    start = tables.first_year + tables.size
+    multipliers = kernel.contribution_multipliers
+    if multipliers.values:
+        start = max(start, kernel.birth_year + multipliers.first_age + len(multipliers.values))
+    return start
+
+
+def tail_start(kernel: PensionKernel, retirement_year: int) -> int:
+    """First year summed in closed form; retirement_year when the whole career needs the loop."""
+    return min(retirement_year, max(kernel.current_year, constant_rate_start(kernel)))
+
+
+def valorized_salary_sum(
+    kernel: PensionKernel,
+    start_year: int,
+    end_year: int,
+    wage_series: str,
+    valorization_series: str,
+) -> Decimal:
+    """
+    Sum of annual salaries (12 × monthly) of years [start_year, end_year), each valorized
+    with `valorization_series` to end_year. Multiplied by a ZUS rate it is the account
+    balance those contributions build. Valid only for
+    start_year >= max(current_year, constant_rate_start(kernel)).
+    """
+    n = end_year - start_year
+    if n <= 0:
+        return ZERO
+
+    tables = kernel.rate_tables
+    q = tables.growth(wage_series, start_year)
+    g = tables.growth(valorization_series, start_year)
+
+    alpha = Decimal(str(kernel.alpha))
+    beta = Decimal(str(kernel.beta))
+    m_now = Decimal(str(experience_curve(kernel.alpha, kernel.beta).at(kernel.years_of_experience)))
+    exp_start = kernel.years_of_experience + (start_year - kernel.current_year)
+
+    salary_scale = kernel.current_salary / m_now * tables.factor(wage_series, kernel.current_year, start_year)
+    series = (
+        (ONE + alpha) * _geometric_sum(q / g, n)
+        - alpha * _exp(-beta * exp_start) * _geometric_sum(q * _exp(-beta) / g, n)
+    )
+    # pensja z roku t = start + j waloryzowana g^(end - t) = g^n · g^(-j)
+    return salary_scale * series * g ** n * Decimal("12")
+
+
+def _geometric_sum_float(ratio: float, n: int) -> float:
+    """sum_{j=0}^{n-1} ratio^j without the cancellation of (ratio^n - 1) / (ratio - 1) near 1."""
+    d = ratio - 1.0
+    if d == 0.0:
+        return float(n)
+    return math.expm1(n * math.log1p(d)) / d
+
+
+def valorized_salary_sum_float(
+    kernel: PensionKernel,
+    start_year: int,
+    end_year: int,
+    wage_series: str,
+    valorization_series: str,
+) -> float:
+    """float64 counterpart of valorized_salary_sum (same preconditions)."""
+    n = end_year - start_year
+    if n <= 0:
+        return 0.0
+
+    tables = kernel.rate_tables
+    q = float(tables.growth(wage_series, start_year))
+    g = float(tables.growth(valorization_series, start_year))
+
+    alpha, beta = kernel.alpha, kernel.beta
+    m_now = experience_curve(alpha, beta).at(kernel.years_of_experience)
+    exp_start = kernel.years_of_experience + (start_year - kernel.current_year)
+
+    salary_scale = (
+        float(kernel.current_salary) / m_now
+        * float(tables.factor(wage_series, kernel.current_year, start_year))
+    )
+    series = (
+        (1.0 + alpha) * _geometric_sum_float(q / g, n)
+        - alpha * math.exp(-beta * exp_start) * _geometric_sum_float(q * math.exp(-beta) / g, n)
+    )
+    return salary_scale * series * g ** n * 12.0
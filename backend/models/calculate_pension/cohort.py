@@ -0,0 +1,298 @@
+"""
+Synthetic cohort simulator over the regression job catalogue.
+
+Samples workers (job category → alpha/beta, sex, age, experience, salary) and evaluates
+them in chunks as (workers x calendar years) float64 arrays with the same formulas as the
+batch engine (no events, no capital accumulated before the model). Every worker shares
+the current year, so salary growth and valorization reduce to per-year weight vectors and
+each worker's capital at retirement is one masked row of a matrix product.
+
+Only aggregates survive a chunk: per (category, sex) histograms plus count / sum / sum of
+squares of every measure. Quantiles are read off the histograms (exact to a bin width),
+so memory does not grow with n_workers.
+"""
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+from backend.models.calculate_pension.vectorized_engine import _prefix_products
+from backend.models.data.data_registry import DataSnapshot, data_registry
+from backend.models.calculate_salary.experience_curve import experience_curve
+from backend.models.pension_models.CohortConfig import CohortConfig
+from backend.models.pension_models.MacroRateTables import MacroRateTables
+from backend.models.pension_models.PensionKernel import life_expectancy_months
+from backend.models.pension_models.RetirementAgeConfig import RetirementAgeConfig
+from backend.models.pension_models.ZUSContributionRates import ZUSContributionRates
+
+MEASURES = (
+    "replacement_rate_percent_real",
+    "replacement_rate_percent_nominal",
+    "monthly_pension_real",
+    "monthly_pension_nominal",
+)
+SEXES = ("female", "male")
+
+
+def _measure_edges(config: CohortConfig) -> dict[str, np.ndarray]:
+    rr = np.linspace(0.0, config.replacement_rate_max_percent, config.replacement_rate_bins + 1)
+    pension = np.linspace(0.0, config.pension_max, config.pension_bins + 1)
+    return {
+        "replacement_rate_percent_real": rr,
+        "replacement_rate_percent_nominal": rr,
+        "monthly_pension_real": pension,
+        "monthly_pension_nominal": pension,
+    }
+
+
+def _histogram_quantiles(
+    counts: np.ndarray, edges: np.ndarray, percentiles: Sequence[float]
+) -> list[Optional[float]]:
+    """
+    Quantiles from a histogram with an underflow (counts[0]) and overflow (counts[-1]) slot;
+    linear within a bin, clamped to the outer edges.
+    """
+    total = int(counts.sum())
+    if total == 0:
+        return [None] * len(percentiles)
+    cumulative = np.cumsum(counts)
+    out = []
+    for q in percentiles:
+        target = q / 100.0 * total
+        slot = int(np.searchsorted(cumulative, target, side="left"))
+        if slot == 0:
+            out.append(float(edges[0]))
+        elif slot >= counts.size - 1:
+            out.append(float(edges[-1]))
+        else:
+            below = cumulative[slot - 1]
+            inside = counts[slot]
+            share = (target - below) / inside if inside else 0.0
+            lo, hi = edges[slot - 1], edges[slot]
+            out.append(float(lo + share * (hi - lo)))
+    return out
+
+
+class CohortAggregates:
+    """Streaming per-(category, sex) aggregates of every measure; merged on demand."""
+
+    def __init__(self, categories: Sequence[str], config: CohortConfig):
+        self.categories = list(categories)
+        self.percentiles = tuple(config.percentiles)
+        self.edges = _measure_edges(config)
+        groups = len(self.categories) * 2
+        # [grupa, slot]: slot 0 = poniżej zakresu, 1..bins = przedziały, bins + 1 = powyżej
+        self.counts = {m: np.zeros((groups, self.edges[m].size + 1), dtype=np.int64) for m in MEASURES}
+        self.sums = {m: np.zeros(groups) for m in MEASURES}
+        self.sums_sq = {m: np.zeros(groups) for m in MEASURES}
+        self.workers = 0
+
+    def update(self, category: np.ndarray, is_male: np.ndarray, values: dict[str, np.ndarray]) -> None:
+        group = category * 2 + is_male.astype(np.int64)
+        n_groups = len(self.categories) * 2
+        for m in MEASURES:
+            x = values[m]
+            slots = self.edges[m].size + 1
+            slot = np.searchsorted(self.edges[m], x, side="right")
+            self.counts[m] += np.bincount(group * slots + slot, minlength=n_groups * slots).reshape(n_groups, slots)
+            self.sums[m] += np.bincount(group, weights=x, minlength=n_groups)
+            self.sums_sq[m] += np.bincount(group, weights=x * x, minlength=n_groups)
+        self.workers += category.size
+
+    def _stats(self, measure: str, rows) -> dict:
+        counts = self.counts[measure][rows].reshape(-1, self.edges[measure].size + 1).sum(axis=0)
+        n = int(counts.sum())
+        total = float(np.sum(self.sums[measure][rows]))
+        total_sq = float(np.sum(self.sums_sq[measure][rows]))
+        if n:
+            mean = total / n
+            std = max(0.0, total_sq / n - mean * mean) ** 0.5
+        else:
+            mean = std = None  # pusta grupa (np. mała próba) — bez NaN w JSON
+        stats = {"count": n, "mean": mean, "std": std}
+        for q, v in zip(self.percentiles, _histogram_quantiles(counts, self.edges[measure], self.percentiles)):
+            stats[f"p{q:g}"] = v
+        return stats
+
+    def _group_summary(self, rows) -> dict:
+        return {m: self._stats(m, rows) for m in MEASURES}
+
+    def overall(self) -> dict:
+        return self._group_summary(slice(None))
+
+    def summary(self) -> dict:
+        """Overall, per sex and per category (all / female / male) statistics plus overall and per-sex histograms."""
+        by_category = {}
+        for i, name in enumerate(self.categories):
+            by_category[name] = {
+                "all": self._group_summary(slice(2 * i, 2 * i + 2)),
+                **{sex: self._group_summary([2 * i + s]) for s, sex in enumerate(SEXES)},
+            }
+        histograms = {}
+        for m in MEASURES:
+            slots = self.edges[m].size + 1
+            per_sex = self.counts[m].reshape(-1, 2, slots).sum(axis=0)
+            histograms[m] = {
+                "edges": self.edges[m].tolist(),
+                "below": int(per_sex[:, 0].sum()),
+                "above": int(per_sex[:, -1].sum()),
+                "counts": per_sex[:, 1:-1].sum(axis=0).tolist(),
+                **{sex: per_sex[s, 1:-1].tolist() for s, sex in enumerate(SEXES)},
+            }
+        return {
+            "workers": self.workers,
+            "overall": self.overall(),
+            "by_sex": {sex: self._group_summary(slice(s, None, 2)) for s, sex in enumerate(SEXES)},
+            "by_category": by_category,
+            "histograms": histograms,
+        }
+
+
+def _career_weights(
+    tables: MacroRateTables,
+    current_year: int,
+    first_year: int,
+    last_year: int,
+) -> dict:
+    """Per-calendar-year wage growth and valorization vectors shared by the whole cohort."""
+    years = np.arange(first_year, last_year + 1)
+    infl, real, i_val, ii_idx = (
+        tables.float_rates(series, first_year, last_year + 1)
+        for series in ("inflation", "real_wage", "i_pillar", "ii_pillar")
+    )
+    c = current_year - first_year
+    p_nom = _prefix_products(1.0 + infl + real)
+    p_real = _prefix_products(1.0 + real)
+    nominal_factor = p_nom[:-1] / p_nom[c]
+    real_factor = p_real[:-1] / p_real[c]
+
+    v_i = _prefix_products(1.0 + i_val)
+    v_ii = _prefix_products(1.0 + ii_idx)
+    v_i_real = _prefix_products((1.0 + i_val) / (1.0 + infl))
+    v_ii_real = _prefix_products((1.0 + ii_idx) / (1.0 + infl))
+
+    # składka z roku j na koncie w roku k: v[k] / v[j] — kolumny macierzy wag
+    weights = np.stack([
+        nominal_factor / v_i[:-1],
+        nominal_factor / v_ii[:-1],
+        real_factor / v_i_real[:-1],
+        real_factor / v_ii_real[:-1],
+    ], axis=1)
+    return {
+        "years": years,
+        "nominal_factor": nominal_factor,
+        "real_factor": real_factor,
+        "valorization": np.stack([v_i, v_ii, v_i_real, v_ii_real], axis=1),
+        "weights": weights,
+    }
+
+
+def _evaluate_chunk(
+    grid: dict,
+    current_year: int,
+    curves: np.ndarray,
+    age: np.ndarray,
+    experience: np.ndarray,
+    salary: np.ndarray,
+    retirement_age: np.ndarray,
+    months: np.ndarray,
+    i_rate: float,
+    ii_rate: float,
+) -> dict[str, np.ndarray]:
+    years = grid["years"]
+    y0 = int(years[0])
+    yrs = np.maximum(0, retirement_age - age)
+    work_start = current_year - experience
+    w = current_year + yrs - y0
+
+    rows = np.arange(experience.size)
+    exp = np.maximum(0, experience[:, None] + (years[None, :] - current_year))
+    curve = np.take_along_axis(curves, exp, axis=1)
+    working = (years[None, :] >= work_start[:, None]) & (years[None, :] < (current_year + yrs)[:, None])
+    base = salary / curves[rows, experience]
+
+    # kolumny: I nominalnie, II nominalnie, I realnie, II realnie
+    sums = np.where(working, curve, 0.0) @ grid["weights"]
+    capital = base[:, None] * sums * grid["valorization"][w] * np.array([i_rate, ii_rate, i_rate, ii_rate])
+
+    pension_nom = (capital[:, 0] + capital[:, 1]) / months
+    pension_real = (capital[:, 2] + capital[:, 3]) / months
+
+    final_base = base * curves[rows, experience + yrs]
+    final_nom = final_base * grid["nominal_factor"][w]
+    final_real = final_base * grid["real_factor"][w]
+    zeros = np.zeros_like(pension_nom)
+    return {
+        "replacement_rate_percent_real": 100.0 * np.divide(pension_real, final_real, out=zeros.copy(), where=final_real != 0),
+        "replacement_rate_percent_nominal": 100.0 * np.divide(pension_nom, final_nom, out=zeros.copy(), where=final_nom != 0),
+        "monthly_pension_real": pension_real,
+        "monthly_pension_nominal": pension_nom,
+    }
+
+
+def simulate_cohort(
+    config: CohortConfig,
+    tables: MacroRateTables,
+    current_year: int,
+    contribution_rates: Optional[ZUSContributionRates] = None,
+    retirement_ages: Optional[RetirementAgeConfig] = None,
+    data: Optional[DataSnapshot] = None,
+) -> Iterator[CohortAggregates]:
+    """
+    Yields the running CohortAggregates after every chunk (the same object, updated in
+    place); the last one covers all n_workers. `data` (job regressions, life expectancy
+    table) defaults to the current data registry version.
+    """
+    contribution_rates = contribution_rates or ZUSContributionRates()
+    retirement_ages = retirement_ages or RetirementAgeConfig()
+
+    data = data or data_registry.current()
+    regressions = data.regressions
+    life_table = data.life_table
+
+    categories = list(config.categories) if config.categories else list(regressions)
+    unknown = [name for name in categories if name not in regressions]
+    if unknown:
+        raise ValueError(f"Unknown job categories: {', '.join(unknown)}")
+
+    male_age = retirement_ages.get_retirement_age(True)
+    female_age = retirement_ages.get_retirement_age(False)
+    male_months = float(life_expectancy_months(male_age, True, current_year))
+    female_months = float(life_expectancy_months(female_age, False, current_year))
+    max_experience = max(0, config.age_max - config.career_start_age_min)
+    max_years_left = max(0, max(male_age, female_age) - config.age_min)
+    grid = _career_weights(tables, current_year, current_year - max_experience, current_year + max_years_left)
+    # krzywe doświadczenia kategorii: doświadczenie 0 .. max_experience + max_years_left
+    category_curves = np.stack([
+        experience_curve(float(regressions[name][0]), float(regressions[name][1])).head(max_experience + max_years_left + 1)
+        for name in categories
+    ])
+
+    i_rate = float(contribution_rates.i_pillar_rate) * 12.0
+    ii_rate = float(contribution_rates.ii_pillar_rate) * 12.0
+
+    aggregates = CohortAggregates(categories, config)
+    rng = np.random.default_rng(config.seed)
+    for lo in range(0, config.n_workers, config.chunk_size):
+        p = min(config.chunk_size, config.n_workers - lo)
+
+        category = rng.integers(0, len(categories), p)
+        is_male = rng.random(p) < config.male_share
+        age = rng.integers(config.age_min, config.age_max + 1, p)
+        career_start = rng.integers(config.career_start_age_min, config.career_start_age_max + 1, p)
+        experience = np.maximum(0, age - career_start)
+        curves = category_curves[category]
+        entry_salary = config.entry_salary_median * np.exp(config.entry_salary_sigma * rng.standard_normal(p))
+        salary = entry_salary * curves[np.arange(p), experience]
+
+        retirement_age = np.where(is_male, male_age, female_age)
+        if life_table is not None:
+            months = life_table.months_array(current_year + np.maximum(0, retirement_age - age), retirement_age)
+        else:
+            months = np.where(is_male, male_months, female_months)
+
+        values = _evaluate_chunk(
+            grid, current_year, curves, age, experience, salary,
+            retirement_age, months, i_rate, ii_rate,
+        )
+        aggregates.update(category, is_male, values)
+        yield aggregates
@@ -0,0 +1,222 @@
+"""
+Reference Decimal projection engine (engine='decimal').
+
+One forward pass over the working years with carried account balances and carried
+cumulative wage-growth factors; works on a PensionKernel, so the per-year loop touches
+only plain attributes, the rate tables and the compiled event multipliers.
+
+decimal_breakdown() skips the timeline: the loop stops where the constant-rate,
+event-free tail begins and the tail is added in closed form (closed_form.py).
+"""
+from decimal import Decimal
+from typing import Optional
+
+from backend.models.calculate_pension.closed_form import tail_start, valorized_salary_sum
+from backend.models.calculate_salary.experience_curve import experience_curve
+from backend.models.pension_models.PensionEvaluation import PensionEvaluation
+from backend.models.pension_models.PensionKernel import PensionKernel
+
+TWELVE = Decimal("12")
+
+
+def _experience_ratio(kernel: PensionKernel, m_now: float, year_delta: int) -> Decimal:
+    exp_then = max(0, kernel.years_of_experience + year_delta)
+    return Decimal(str(experience_curve(kernel.alpha, kernel.beta).at(exp_then) / m_now))
+
+
+def decimal_timeline(kernel: PensionKernel) -> dict[int, dict]:
+    """
+    Jeden przebieg w przód po latach pracy, z przenoszeniem sald kont:
+    kapitał(t+1) = (kapitał(t) + składka_t) · (1 + r_t)
+    (składka z roku t jest waloryzowana już za rok t — tak jak w valorize_*(c, t, target)).
+    """
+    timeline: dict[int, dict] = {}
+    _forward(kernel, kernel.retirement_year, timeline)
+    return timeline
+
+
+def _forward(
+    kernel: PensionKernel,
+    stop_year: int,
+    timeline: Optional[dict[int, dict]] = None,
+    start_year: Optional[int] = None,
+) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    """
+    Salda (I nom., II nom., I real., II real.) na początek `stop_year` ze składek od
+    `start_year` (domyślnie początek kariery); punkty osi czasu od roku bieżącego
+    dopisywane do `timeline`, jeśli podany.
+    """
+    cy = kernel.current_year
+    tables = kernel.rate_tables
+    multipliers = kernel.contribution_multipliers
+    i_rate = kernel.i_pillar_rate
+    ii_rate = kernel.ii_pillar_rate
+    m_now = experience_curve(kernel.alpha, kernel.beta).at(kernel.years_of_experience)
+
+    i_nom = Decimal("0")
+    ii_nom = Decimal("0")
+    i_real = Decimal("0")
+    ii_real = Decimal("0")
+
+    if start_year is None:
+        start_year = kernel.work_start_year
+
+    # skumulowany wzrost płac od roku bieżącego — przenoszony z roku na rok
+    nominal_factor = tables.factor("nominal_wage", cy, start_year)
+    real_factor = tables.factor("real_wage", cy, start_year)
+
+    for year in range(start_year, stop_year + 1):
+        base = kernel.current_salary * _experience_ratio(kernel, m_now, year - cy)
+        sal_nom = base * nominal_factor
+        sal_real = base * real_factor
+
+        if timeline is not None and year >= cy:
+            # Pensje w roku year (bez redukcji eventem — do referencji/wykresu)
+            timeline[year] = {
+                "i_pillar_nominal": i_nom,
+                "ii_pillar_nominal": ii_nom,
+                "total_nominal": i_nom + ii_nom,
+                "annual_salary_nominal": sal_nom * TWELVE,
+
+                "i_pillar_real": i_real,
+                "ii_pillar_real": ii_real,
+                "total_real": i_real + ii_real,
+                "annual_salary_real": sal_real * TWELVE,
+            }
+        if year == stop_year:
+            break
+
+        mult = multipliers.for_age(year - kernel.birth_year)
+        if mult != 0:
+            adj_nom = sal_nom * mult
+            adj_real = sal_real * mult
+            i_nom += adj_nom * i_rate * TWELVE
+            ii_nom += adj_nom * ii_rate * TWELVE
+            i_real += adj_real * i_rate * TWELVE
+            ii_real += adj_real * ii_rate * TWELVE
+
+        i_nom *= tables.growth("i_pillar", year)
+        ii_nom *= tables.growth("ii_pillar", year)
+        i_real *= tables.growth("i_pillar_real", year)
+        ii_real *= tables.growth("ii_pillar_real", year)
+
+        nominal_factor *= tables.growth("nominal_wage", year)
+        real_factor *= tables.growth("real_wage", year)
+
+    return i_nom, ii_nom, i_real, ii_real
+
+
+def decimal_evaluate(kernel: PensionKernel) -> PensionEvaluation:
+    timeline = decimal_timeline(kernel)
+    at_retirement = timeline[kernel.retirement_year]
+    balances = (
+        at_retirement["i_pillar_nominal"],
+        at_retirement["ii_pillar_nominal"],
+        at_retirement["i_pillar_real"],
+        at_retirement["ii_pillar_real"],
+    )
+    points = [{"year": y, **data} for y, data in sorted(timeline.items())]
+    return _evaluation(kernel, balances, points)
+
+
+def decimal_breakdown(kernel: PensionKernel) -> PensionEvaluation:
+    """Breakdown only (empty timeline); the constant-rate, event-free tail in closed form."""
+    return _evaluation(kernel, decimal_balances_at_retirement(kernel), [])
+
+
+def decimal_balances_at_current_year(kernel: PensionKernel) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    """
+    Account balances (I nom., II nom., I real., II real.) built by the contributions of the
+    years before the current one, valorized to the current year.
+    """
+    return _forward(kernel, kernel.current_year)
+
+
+def decimal_balances_at_retirement(
+    kernel: PensionKernel, from_year: Optional[int] = None
+) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    """
+    Account balances in the retirement year built by the contributions from `from_year`
+    (default: the start of the career; at most the current year), the tail in closed form.
+    """
+    retirement_year = kernel.retirement_year
+    start = tail_start(kernel, retirement_year)
+    balances = _forward(kernel, start, start_year=from_year)
+    if start < retirement_year:
+        tables = kernel.rate_tables
+        i_rate, ii_rate = kernel.i_pillar_rate, kernel.ii_pillar_rate
+        balances = tuple(
+            balance * tables.factor(valorization, start, retirement_year)
+            + rate * valorized_salary_sum(kernel, start, retirement_year, wage, valorization)
+            for balance, rate, wage, valorization in zip(
+                balances,
+                (i_rate, ii_rate, i_rate, ii_rate),
+                ("nominal_wage", "nominal_wage", "real_wage", "real_wage"),
+                ("i_pillar", "ii_pillar", "i_pillar_real", "ii_pillar_real"),
+            )
+        )
+    return balances
+
+
+def _evaluation(
+    kernel: PensionKernel, balances: tuple[Decimal, Decimal, Decimal, Decimal], points: list[dict]
+) -> PensionEvaluation:
+    """Breakdown z sald kont w roku emerytury (bez kapitału zgromadzonego przed modelem)."""
+    cy = kernel.current_year
+    yrs = kernel.years_to_standard_retirement
+    retirement_year = kernel.retirement_year
+    tables = kernel.rate_tables
+    i_nom, ii_nom, i_real, ii_real = balances
+
+    def valorize(series: str, capital: Decimal) -> Decimal:
+        if retirement_year <= cy:
+            return capital
+        return capital * tables.factor(series, cy, retirement_year)
+
+    # kapitał zgromadzony przed modelem — waloryzowany od dziś do roku emerytury
+    acc_i = kernel.accumulated_i_pillar_capital
+    acc_ii = kernel.accumulated_ii_pillar_capital
+    months = kernel.life_expectancy_months
+
+    # nominal
+    total_i_nom = valorize("i_pillar", acc_i) + i_nom
+    total_ii_nom = valorize("ii_pillar", acc_ii) + ii_nom
+    monthly_pension_nom = (total_i_nom + total_ii_nom) / months
+
+    # real
+    total_i_real = valorize("i_pillar_real", acc_i) + i_real
+    total_ii_real = valorize("ii_pillar_real", acc_ii) + ii_real
+    monthly_pension_real = (total_i_real + total_ii_real) / months
+
+    m_now = experience_curve(kernel.alpha, kernel.beta).at(kernel.years_of_experience)
+    final_base = kernel.current_salary * _experience_ratio(kernel, m_now, yrs)
+    final_salary_nom = final_base * tables.factor("nominal_wage", cy, retirement_year)
+    final_salary_real = final_base * tables.factor("real_wage", cy, retirement_year)
+    rr_nom = (monthly_pension_nom / final_salary_nom) if final_salary_nom else Decimal("0")
+    rr_real = (monthly_pension_real / final_salary_real) if final_salary_real else Decimal("0")
+
+    breakdown = {
+        "current_age": kernel.current_age,
+        "retirement_age": kernel.effective_retirement_age,
+        "years_to_retirement": yrs,
+
+        # salaries
+        "current_monthly_salary_nominal": kernel.current_salary,
+        "final_monthly_salary_nominal": final_salary_nom,
+        "final_monthly_salary_real": final_salary_real,
+
+        # nominal block
+        "i_pillar_capital_nominal": total_i_nom,
+        "ii_pillar_capital_nominal": total_ii_nom,
+        "total_capital_nominal": total_i_nom + total_ii_nom,
+        "monthly_pension_nominal": monthly_pension_nom,
+        "replacement_rate_percent_nominal": rr_nom * Decimal("100"),
+
+        # real block
+        "i_pillar_capital_real": total_i_real,
+        "ii_pillar_capital_real": total_ii_real,
+        "total_capital_real": total_i_real + total_ii_real,
+        "monthly_pension_real": monthly_pension_real,
+        "replacement_rate_percent_real": rr_real * Decimal("100"),
+    }
+    return PensionEvaluation.build(breakdown, rr_nom, rr_real, points)
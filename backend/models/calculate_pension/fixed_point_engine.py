@@ -0,0 +1,231 @@
+"""
+Fixed-point projection engine for PensionModel: money as integer grosze, rates as
+integers scaled by RATE_SCALE (10^12).
+
+Every year of the career is computed at once with int64 arrays; products of a grosz
+amount and a scaled factor are exact (the factor is split into 10^6 limbs, see
+_mul_round), so there is no float rounding anywhere.
+
+Rounding policy — inputs (rates, salary, capital, event multipliers) are converted
+half-even; every step below rounds half up:
+- factors: the experience ratio m(k) / m(now) (Decimal, cached per alpha, beta and
+  current experience), the cumulative wage growth from the current year and the
+  cumulative valorization to / from the current year (Decimal prefix products, cached
+  in the rate tables) are each rounded once to 1 / RATE_SCALE — never carried year
+  by year,
+- per year: the monthly salary in current-year wages (salary · experience ratio) is
+  kept in units of 10^-3 grosz; its nominal and real value (· wage factor), the
+  event-adjusted base and the annual contribution of each account are rounded to the grosz,
+- balances: each contribution is discounted to the current year and kept in units of
+  10^-6 grosz; a balance is Σ of those units times the valorization factor to the
+  reported year, rounded to the grosz once (no per-year rounding is carried forward).
+  That last product exceeds int64 and runs on Python ints (object arrays, one value
+  per reported year),
+- capital accumulated before the model is valorized to retirement with one rounding,
+- the monthly pension is rounded to the grosz.
+
+The result depends only on the inputs (integer arithmetic, no float accumulation), so
+it is reproducible to the grosz; values are exact Decimals with two decimal places.
+The 'decimal' engine stays as the reference for audit comparisons.
+"""
+from decimal import ROUND_HALF_EVEN, Decimal
+from functools import lru_cache
+
+import numpy as np
+
+from backend.models.calculate_salary.experience_curve import (
+    EXPERIENCE_CURVE_CACHE_SIZE,
+    MAX_EXPERIENCE,
+    experience_curve,
+)
+from backend.models.nonfunctional_periods.compile_multipliers import ContributionMultipliers
+from backend.models.pension_models.MacroRateTables import RATE_SCALE, to_scaled
+from backend.models.pension_models.PensionEvaluation import PensionEvaluation
+from backend.models.pension_models.PensionKernel import PensionKernel
+
+# podział czynnika skalowanego na „limby” 10^6, żeby iloczyny mieściły się w int64
+_SPLIT = 10**6
+_INT64_SAFE = 2**62
+# wartości pośrednie poniżej grosza: pensja w płacach roku bieżącego w 10^-3 grosza,
+# wpłaty zdyskontowane na rok bieżący w 10^-6 grosza
+_MILLI = 10**3
+_MICRO = 10**6
+_GROSZ = Decimal("0.01")
+
+# konta w kolejności wierszy macierzy sald: (seria waloryzacji, wiersz pensji 0 nom / 1 real, filar)
+_ACCOUNTS = (("i_pillar", 0, "i"), ("ii_pillar", 0, "ii"), ("i_pillar_real", 1, "i"), ("ii_pillar_real", 1, "ii"))
+
+
+def _round_div(numerator: int, denominator: int) -> int:
+    """numerator / denominator rounded half up (denominator > 0)."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def _grosze(value: Decimal) -> int:
+    return int((value * 100).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def _pln(grosze: int) -> Decimal:
+    return Decimal(grosze) * _GROSZ
+
+
+def _mul_round(a: np.ndarray, b: np.ndarray, scale: int) -> np.ndarray:
+    """
+    a · b / scale rounded half up, elementwise, for non-negative integer arrays and
+    scale a multiple of 10^6 (at most 10^18). Exact in int64 with b = high · 10^6 + low;
+    on object dtype (Python ints) when the limb products could overflow.
+    """
+    if a.dtype == np.int64 and b.dtype == np.int64 and a.size and b.size:
+        high, low = np.divmod(b, _SPLIT)
+        if int(a.max()) * (int(high.max()) + 2 * _SPLIT) < _INT64_SAFE:
+            quotient, remainder = np.divmod(a * high, scale // _SPLIT)
+            remainder = remainder * _SPLIT + a * low
+            return quotient + (2 * remainder + scale) // (2 * scale)
+    a = np.asarray(a).astype(object)
+    b = np.asarray(b).astype(object)
+    return (2 * a * b + scale) // (2 * scale)
+
+
+@lru_cache(maxsize=EXPERIENCE_CURVE_CACHE_SIZE)
+def _cached_ratios(alpha: float, beta: float, now: int) -> np.ndarray:
+    ratios = _experience_ratios(alpha, beta, now, MAX_EXPERIENCE + 1)
+    ratios.flags.writeable = False
+    return ratios
+
+
+def _experience_ratios(alpha: float, beta: float, now: int, n: int) -> np.ndarray:
+    curve = experience_curve(alpha, beta)
+    at_now = curve.decimal_at(now)
+    return np.array([to_scaled(curve.decimal_at(k) / at_now) for k in range(n)])
+
+
+def _scaled_ratios(kernel: PensionKernel, n: int) -> np.ndarray:
+    """m(k) / m(years_of_experience) for experience 0..n-1, scaled (exact Decimal, rounded once)."""
+    now = kernel.years_of_experience
+    if n <= MAX_EXPERIENCE + 1 and now <= MAX_EXPERIENCE:
+        return _cached_ratios(float(kernel.alpha), float(kernel.beta), now)[:n]
+    return _experience_ratios(float(kernel.alpha), float(kernel.beta), now, n)
+
+
+def _scaled_multipliers(multipliers: ContributionMultipliers, ages: np.ndarray) -> np.ndarray:
+    out = np.full(ages.size, RATE_SCALE, dtype=np.int64)
+    if multipliers.values:
+        scaled = np.array([to_scaled(v) for v in multipliers.values], dtype=np.int64)
+        idx = ages - multipliers.first_age
+        covered = (idx >= 0) & (idx < scaled.size)
+        out[covered] = scaled[idx[covered]]
+    return out
+
+
+def fixed_point_evaluate(kernel: PensionKernel) -> PensionEvaluation:
+    tables = kernel.rate_tables
+    cy = kernel.current_year
+    ws = kernel.work_start_year
+    yrs = kernel.years_to_standard_retirement
+    retirement_year = cy + yrs
+    c = cy - ws
+    n_work = retirement_year - ws
+
+    # pensja miesięczna w płacach roku bieżącego, potem wiersze [nominalna, realna] (lata ws..R)
+    salary_grosze = _grosze(kernel.current_salary)
+    base = _mul_round(np.array([salary_grosze]), _scaled_ratios(kernel, n_work + 1), RATE_SCALE // _MILLI)
+    wage_factors = np.stack([
+        tables.scaled_factors(series, cy, ws, retirement_year + 1) for series in ("nominal_wage", "real_wage")
+    ])
+    salaries = _mul_round(base, wage_factors, RATE_SCALE * _MILLI)
+
+    # podstawa po eventach i składki roczne czterech kont (lata pracy ws..R-1)
+    years = np.arange(ws, retirement_year)
+    mult = _scaled_multipliers(kernel.contribution_multipliers, years - kernel.birth_year)
+    adjusted = _mul_round(salaries[:, :n_work], mult, RATE_SCALE)
+    rates = {
+        "i": to_scaled(kernel.i_pillar_rate) * 12,
+        "ii": to_scaled(kernel.ii_pillar_rate) * 12,
+    }
+    contrib = _mul_round(
+        adjusted[[row for _, row, _ in _ACCOUNTS]],
+        np.array([[rates[pillar]] for _, _, pillar in _ACCOUNTS]),
+        RATE_SCALE,
+    )
+
+    # saldo na początek lat cy..R: suma wpłat z lat < rok, zdyskontowanych na rok bieżący
+    discounted = _mul_round(
+        contrib,
+        np.stack([tables.scaled_factors(series, cy, ws, retirement_year, to_base=True) for series, _, _ in _ACCOUNTS]),
+        RATE_SCALE // _MICRO,
+    )
+    cumulative = np.zeros((len(_ACCOUNTS), n_work + 1), dtype=discounted.dtype)
+    np.cumsum(discounted, axis=1, out=cumulative[:, 1:])
+    valorization = np.stack([tables.scaled_factors(series, cy, cy, retirement_year + 1) for series, _, _ in _ACCOUNTS])
+    i_nom, ii_nom, i_real, ii_real = _mul_round(
+        cumulative[:, c:], valorization, RATE_SCALE * _MICRO
+    ).tolist()
+    sal_nom, sal_real = salaries.tolist()
+
+    points = [
+        {
+            "year": year,
+            "i_pillar_nominal": _pln(i_nom[k]),
+            "ii_pillar_nominal": _pln(ii_nom[k]),
+            "total_nominal": _pln(i_nom[k] + ii_nom[k]),
+            "annual_salary_nominal": _pln(sal_nom[c + k] * 12),
+
+            "i_pillar_real": _pln(i_real[k]),
+            "ii_pillar_real": _pln(ii_real[k]),
+            "total_real": _pln(i_real[k] + ii_real[k]),
+            "annual_salary_real": _pln(sal_real[c + k] * 12),
+        }
+        for k, year in enumerate(range(cy, retirement_year + 1))
+    ]
+
+    # kapitał zgromadzony przed modelem — waloryzowany od dziś do roku emerytury (jedno zaokrąglenie)
+    acc = {
+        series: _round_div(_grosze(amount or Decimal("0")) * int(valorization[k, -1]), RATE_SCALE)
+        for k, (series, amount) in enumerate((
+            ("i_pillar", kernel.accumulated_i_pillar_capital),
+            ("ii_pillar", kernel.accumulated_ii_pillar_capital),
+            ("i_pillar_real", kernel.accumulated_i_pillar_capital),
+            ("ii_pillar_real", kernel.accumulated_ii_pillar_capital),
+        ))
+    }
+
+    total_i_nom = acc["i_pillar"] + i_nom[-1]
+    total_ii_nom = acc["ii_pillar"] + ii_nom[-1]
+    total_i_real = acc["i_pillar_real"] + i_real[-1]
+    total_ii_real = acc["ii_pillar_real"] + ii_real[-1]
+    final_nom = sal_nom[-1]
+    final_real = sal_real[-1]
+
+    # miesiące z tablicy mogą być ułamkowe (dziesiąte części) → dzielenie przez licznik / mianownik
+    months_num, months_den = kernel.life_expectancy_months.as_integer_ratio()
+    pension_nom = _round_div((total_i_nom + total_ii_nom) * months_den, months_num)
+    pension_real = _round_div((total_i_real + total_ii_real) * months_den, months_num)
+
+    rr_nom = (Decimal(pension_nom) / Decimal(final_nom)) if final_nom else Decimal("0")
+    rr_real = (Decimal(pension_real) / Decimal(final_real)) if final_real else Decimal("0")
+
+    breakdown = {
+        "current_age": kernel.current_age,
+        "retirement_age": kernel.effective_retirement_age,
+        "years_to_retirement": yrs,
+
+        # salaries
+        "current_monthly_salary_nominal": _pln(salary_grosze),
+        "final_monthly_salary_nominal": _pln(final_nom),
+        "final_monthly_salary_real": _pln(final_real),
+
+        # nominal block
+        "i_pillar_capital_nominal": _pln(total_i_nom),
+        "ii_pillar_capital_nominal": _pln(total_ii_nom),
+        "total_capital_nominal": _pln(total_i_nom + total_ii_nom),
+        "monthly_pension_nominal": _pln(pension_nom),
+        "replacement_rate_percent_nominal": rr_nom * Decimal("100"),
+
+        # real block
+        "i_pillar_capital_real": _pln(total_i_real),
+        "ii_pillar_capital_real": _pln(total_ii_real),
+        "total_capital_real": _pln(total_i_real + total_ii_real),
+        "monthly_pension_real": _pln(pension_real),
+        "replacement_rate_percent_real": rr_real * Decimal("100"),
+    }
+    return PensionEvaluation.build(breakdown, rr_nom, rr_real, points)
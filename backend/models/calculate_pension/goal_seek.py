@@ -0,0 +1,135 @@
+"""
+Goal seek: the minimal current salary, retirement age or extra accumulated I filar
+capital that reaches a target monthly pension (real or nominal).
+
+The pension is monotone (non-decreasing) in all three inputs, so the solver brackets
+the target and narrows the bracket: integer bisection for the retirement age, false
+position with the Illinois modification for the continuous inputs (the pension is
+linear in salary and in capital, so it usually converges in a couple of steps).
+
+Every iteration assigns one field on a single copy of the model: the copy keeps the
+model's rate tables and compiled event multipliers, only the memoized evaluation is
+dropped.
+"""
+from decimal import ROUND_CEILING, Decimal
+from typing import TYPE_CHECKING, Callable, Literal, Optional
+
+if TYPE_CHECKING:
+    from backend.models.PensionModel import PensionModel
+
+GoalSeekVariable = Literal["current_salary", "retirement_age", "accumulated_i_pillar_capital"]
+GoalSeekMeasure = Literal["monthly_pension_real", "monthly_pension_nominal"]
+
+MAX_RETIREMENT_AGE = 120
+MAX_AMOUNT = 1e9
+AMOUNT_TOLERANCE = 0.005
+MAX_ITERATIONS = 100
+
+
+def _bisect_integer(f: Callable[[int], float], lo: int, hi: int, target: float) -> tuple[Optional[int], int]:
+    """Smallest k in [lo, hi] with f(k) >= target, or None if f(hi) < target."""
+    iterations = 1
+    if f(hi) < target:
+        return None, iterations
+    while lo < hi:
+        mid = (lo + hi) // 2
+        iterations += 1
+        if f(mid) >= target:
+            hi = mid
+        else:
+            lo = mid + 1
+    return hi, iterations
+
+
+def _solve_amount(f: Callable[[float], float], target: float, initial: float) -> tuple[Optional[float], int]:
+    """Smallest x >= 0 (to AMOUNT_TOLERANCE) with f(x) >= target, or None above MAX_AMOUNT."""
+    lo, f_lo = 0.0, f(0.0)
+    iterations = 1
+    if f_lo >= target:
+        return 0.0, iterations
+
+    hi = max(initial, 1.0)
+    f_hi = f(hi)
+    iterations += 1
+    while f_hi < target:
+        # rozszerzanie przedziału: co najmniej ×2, a przy dodatnim nachyleniu od razu
+        # trochę za punkt z ekstrapolacji liniowej
+        step = hi * 2.0
+        if f_hi > f_lo:
+            step = max(step, 1.01 * (hi + (target - f_hi) * (hi - lo) / (f_hi - f_lo)))
+        lo, f_lo = hi, f_hi
+        hi = step
+        if hi > MAX_AMOUNT:
+            return None, iterations
+        f_hi = f(hi)
+        iterations += 1
+
+    side = 0
+    while hi - lo > AMOUNT_TOLERANCE and iterations < MAX_ITERATIONS:
+        x = hi - (f_hi - target) * (hi - lo) / (f_hi - f_lo) if f_hi != f_lo else (lo + hi) / 2.0
+        if not lo < x < hi:
+            x = (lo + hi) / 2.0
+        fx = f(x)
+        iterations += 1
+        if fx >= target:
+            hi, f_hi = x, fx
+            if side == 1:
+                f_lo = target + (f_lo - target) / 2.0
+            side = 1
+        else:
+            lo, f_lo = x, fx
+            if side == -1:
+                f_hi = target + (f_hi - target) / 2.0
+            side = -1
+        # punkt dokładnie na celu — mniejszego x nie szukamy dalej niż tolerancja
+        if fx == target:
+            break
+    return hi, iterations
+
+
+def goal_seek(
+    model: "PensionModel",
+    variable: GoalSeekVariable,
+    target: float,
+    measure: GoalSeekMeasure = "monthly_pension_real",
+) -> dict:
+    """
+    Returns {"variable", "measure", "target", "value", "reachable", "iterations", "model"}.
+    `value` is None when the target cannot be reached (retirement age above
+    MAX_RETIREMENT_AGE or an amount above MAX_AMOUNT); `model` is the copy set to the
+    solution, ready for evaluate().
+    """
+    trial = model.model_copy()
+
+    def pension(**update) -> float:
+        for name, value in update.items():
+            setattr(trial, name, value)
+        return float(trial.evaluate_summary().breakdown[measure])
+
+    if variable == "retirement_age":
+        lo = max(model.current_age, 1)
+        value, iterations = _bisect_integer(
+            lambda age: pension(retirement_age=age), lo, MAX_RETIREMENT_AGE, target
+        )
+        if value is not None:
+            pension(retirement_age=value)
+    else:
+        initial = float(getattr(model, variable) or 0)
+        raw, iterations = _solve_amount(
+            lambda x: pension(**{variable: Decimal(repr(x))}), target, initial
+        )
+        value = None
+        if raw is not None:
+            # do pełnych groszy w górę — wynik nadal osiąga cel
+            value = Decimal(repr(raw)).quantize(Decimal("0.01"), rounding=ROUND_CEILING)
+            pension(**{variable: value})
+
+    return {
+        "variable": variable,
+        "measure": measure,
+        "target": target,
+        "value": value,
+        "reachable": value is not None,
+        "iterations": iterations,
+        "model": trial,
+    }
@@ -0,0 +1,208 @@
+"""
+Incremental what-if projection: mutable float64 state of one profile that absorbs
+edits (events, salary, retirement age) by recomputing only what they affect.
+
+Same formulas as the 'numpy' engine (yearly resolution). The career is projected once
+up to `horizon_age`; per working year j the state keeps contribution weights q[j]
+(salary per 1 PLN of current salary × ZUS rate / valorization prefix) and running sums
+T[k] = sum_{j<k} mult[j] · q[j], so the account balance in year k is
+current_salary · T[k] · v[k]. Hence:
+
+- event edit: contribution multipliers change from the first affected year j0, only
+  T[j0 + 1:] is re-accumulated and the timeline changes from year j0 + 1;
+- salary edit: balances scale linearly, nothing is re-accumulated;
+- retirement age edit: only the read-out index moves (the horizon is extended by a
+  full rebuild when the new age lies beyond it).
+
+Every edit returns a splice of the timeline: values from `from_year` to the new
+retirement year (earlier points are unchanged, later ones dropped).
+"""
+import dataclasses
+from decimal import Decimal
+from typing import Optional, Sequence
+
+import numpy as np
+
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+from backend.models.calculate_pension.vectorized_engine import _breakdown_dict, _career, _columns
+from backend.models.nonfunctional_periods.compile_multipliers import (
+    check_whole_year_events,
+    compile_contribution_multipliers,
+)
+from backend.models.pension_models.PensionKernel import PensionKernel
+
+DEFAULT_HORIZON_AGE = 80
+
+
+class IncrementalProjection:
+    """What-if state of one profile; `kernel` always mirrors the edited inputs."""
+
+    def __init__(
+        self,
+        kernel: PensionKernel,
+        events: Sequence[NonFunctionalEvent] = (),
+        horizon_age: int = DEFAULT_HORIZON_AGE,
+    ):
+        self.kernel = kernel
+        self.events = list(events)
+        self.horizon_age = max(horizon_age, kernel.effective_retirement_age)
+        self._build()
+
+    # ------------------------------
+    # Stan
+    # ------------------------------
+    def _build(self) -> None:
+        k = self.kernel
+        last_year = k.current_year + max(0, self.horizon_age - k.current_age)
+        unit = dataclasses.replace(k, current_salary=Decimal("1"))
+        cv = _career(unit, mult=np.ones(last_year - k.work_start_year), retirement_year=last_year)
+
+        self.years = cv["years"]
+        self.c = cv["c"]
+        self.unit_salary_nom = cv["salary_nom"]
+        self.unit_salary_real = cv["salary_real"]
+        # wiersze: I nominalnie, II nominalnie, I realnie, II realnie
+        self.valorization = np.stack([cv["v_i"], cv["v_ii"], cv["v_i_real"], cv["v_ii_real"]])
+        i_rate = float(k.i_pillar_rate) * 12.0
+        ii_rate = float(k.ii_pillar_rate) * 12.0
+        n_work = cv["n_work"]
+        rates = np.array([i_rate, ii_rate, i_rate, ii_rate])[:, None]
+        salary = np.stack([
+            self.unit_salary_nom[:n_work],
+            self.unit_salary_nom[:n_work],
+            self.unit_salary_real[:n_work],
+            self.unit_salary_real[:n_work],
+        ])
+        self.weights = rates * salary / self.valorization[:, :n_work]
+
+        self.mult = self._multipliers(k.contribution_multipliers)
+        self.sums = np.zeros((4, n_work + 1))
+        np.cumsum(self.mult * self.weights, axis=1, out=self.sums[:, 1:])
+
+    def rebase(self, kernel: PensionKernel) -> None:
+        """
+        Rebuilds the whole state on `kernel` (same profile with other reference data,
+        e.g. after a data reload); the current events are kept.
+        """
+        self.kernel = dataclasses.replace(
+            kernel, contribution_multipliers=compile_contribution_multipliers(self.events)
+        )
+        self.horizon_age = max(self.horizon_age, kernel.effective_retirement_age)
+        self._build()
+
+    def _multipliers(self, multipliers) -> np.ndarray:
+        return multipliers.float_vector(self.years[:-1] - self.kernel.birth_year)
+
+    @property
+    def w(self) -> int:
+        return self.kernel.retirement_year - self.kernel.work_start_year
+
+    def _retarget(self, retirement_age: int) -> PensionKernel:
+        k = self.kernel
+        years_to_retirement = max(0, retirement_age - k.current_age)
+        return dataclasses.replace(
+            k,
+            effective_retirement_age=retirement_age,
+            years_to_standard_retirement=years_to_retirement,
+            retirement_year=k.current_year + years_to_retirement,
+            life_expectancy_months=k.life_expectancy_months_for_age(retirement_age),
+        )
+
+    # ------------------------------
+    # Edycje
+    # ------------------------------
+    def apply(
+        self,
+        add_events: Sequence[NonFunctionalEvent] = (),
+        remove_events: Sequence[int] = (),
+        current_salary: Optional[Decimal] = None,
+        retirement_age: Optional[int] = None,
+    ) -> dict:
+        """
+        Applies one delta (removals are indices into the current event list, applied
+        before additions) and returns {"breakdown", "from_year", "last_year", "columns"}:
+        timeline values for [from_year, last_year]; from_year is None when no point changed.
+        """
+        if any(not 0 <= i < len(self.events) for i in remove_events):
+            raise ValueError("remove_events index out of range")
+        check_whole_year_events(add_events)
+
+        old_w = self.w
+        first = None  # pierwszy indeks (rok - work_start_year) z nowymi wartościami
+
+        if current_salary is not None and current_salary != self.kernel.current_salary:
+            self.kernel = dataclasses.replace(self.kernel, current_salary=current_salary)
+            first = self.c
+
+        if retirement_age is not None and retirement_age != self.kernel.effective_retirement_age:
+            self.kernel = self._retarget(retirement_age)
+            if self.w >= self.years.size:
+                self.horizon_age = retirement_age
+                self._build()
+            if self.w > old_w:
+                first = old_w + 1 if first is None else first
+
+        if add_events or remove_events:
+            removed = set(remove_events)
+            self.events = [e for i, e in enumerate(self.events) if i not in removed] + list(add_events)
+            multipliers = compile_contribution_multipliers(self.events)
+            self.kernel = dataclasses.replace(self.kernel, contribution_multipliers=multipliers)
+            mult = self._multipliers(multipliers)
+            changed = np.flatnonzero(mult != self.mult)
+            self.mult = mult
+            if changed.size:
+                j0 = int(changed[0])
+                self.sums[:, j0 + 1:] = self.sums[:, j0:j0 + 1] + np.cumsum(
+                    mult[j0:] * self.weights[:, j0:], axis=1
+                )
+                start = max(self.c, j0 + 1)
+                if start <= self.w:
+                    first = start if first is None else min(first, start)
+
+        return {
+            "breakdown": self.breakdown(),
+            "from_year": int(self.years[first]) if first is not None else None,
+            "last_year": self.kernel.retirement_year,
+            "columns": self.timeline_columns(first if first is not None else self.w + 1),
+        }
+
+    # ------------------------------
+    # Odczyt
+    # ------------------------------
+    def _balances(self, sl: slice) -> np.ndarray:
+        return float(self.kernel.current_salary) * self.sums[:, sl] * self.valorization[:, sl]
+
+    def timeline_columns(self, start: Optional[int] = None) -> dict[str, np.ndarray]:
+        """Timeline columns for years [work_start_year + start, retirement_year] (default: from the current year)."""
+        sl = slice(self.c if start is None else start, self.w + 1)
+        balances = self._balances(sl)
+        salary = float(self.kernel.current_salary)
+        return _columns(
+            self.years[sl],
+            balances[0],
+            balances[1],
+            salary * self.unit_salary_nom[sl],
+            balances[2],
+            balances[3],
+            salary * self.unit_salary_real[sl],
+        )
+
+    def breakdown(self) -> dict:
+        k = self.kernel
+        c, w = self.c, self.w
+        v = self.valorization
+        acc = np.array([
+            float(k.accumulated_i_pillar_capital),
+            float(k.accumulated_ii_pillar_capital),
+            float(k.accumulated_i_pillar_capital),
+            float(k.accumulated_ii_pillar_capital),
+        ])
+        totals = acc * v[:, w] / v[:, c] + self._balances(slice(w, w + 1))[:, 0]
+        salary = float(k.current_salary)
+        breakdown, _, _ = _breakdown_dict(
+            k,
+            tuple(totals),
+            salary * self.unit_salary_nom[w],
+            salary * self.unit_salary_real[w],
+        )
+        return breakdown
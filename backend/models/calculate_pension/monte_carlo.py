@@ -0,0 +1,220 @@
+"""
+Monte Carlo over stochastic macro paths for a single PensionModel profile.
+
+Beyond the historical table, inflation and real wage growth follow a (bivariate) AR(1)
+around the MacroeconomicFactors defaults, by default calibrated on the historical table
+and started from the last observed year. Valorization rates move with the wage-growth
+shock: fully for the I filar, `ii_pillar_pass_through` of it for the II filar, so the
+shock-free path is exactly the deterministic one.
+
+All paths of a chunk are evaluated together as a (paths x years) float64 array, so
+`chunk_size` bounds the temporary work arrays (rates, prefix products, balances). The
+outputs are kept for every path until the percentiles are taken: pension and
+replacement rates (n_paths values each) and the nominal and real timeline totals, two
+(n_paths x years to retirement) arrays — for 10 000 paths and 45 years about 7 MB.
+"""
+import numpy as np
+
+from backend.models.calculate_salary.experience_curve import experience_curve
+from backend.models.pension_models.MacroRateTables import MacroRateTables
+from backend.models.pension_models.MonteCarloConfig import MonteCarloConfig
+from backend.models.pension_models.PensionKernel import PensionKernel
+
+
+def calibrate_ar1(series: np.ndarray) -> tuple[float, float, np.ndarray]:
+    """
+    OLS fit of x_t - m = phi * (x_{t-1} - m) + eps on a demeaned series; returns
+    (phi, sigma, residuals eps_t = current - phi * lagged).
+    """
+    x = np.asarray(series, dtype=np.float64)
+    if x.size < 3:
+        return 0.0, 0.0, np.zeros(0)
+    d = x - x.mean()
+    lagged, current = d[:-1], d[1:]
+    denom = float(lagged @ lagged)
+    phi = float(np.clip((lagged @ current) / denom, -0.99, 0.99)) if denom else 0.0
+    residuals = current - phi * lagged
+    sigma = float(np.std(residuals, ddof=1))
+    return phi, sigma, residuals
+
+
+def _process_parameters(tables: MacroRateTables, config: MonteCarloConfig) -> dict:
+    infl_hist = tables.series["inflation"].floats
+    real_hist = tables.series["real_wage"].floats
+    infl_phi, infl_sigma, e_infl = calibrate_ar1(infl_hist)
+    real_phi, real_sigma, e_real = calibrate_ar1(real_hist)
+
+    rho = config.shock_correlation
+    if rho is None:
+        # korelacja szoków = korelacja reszt obu dopasowań AR(1)
+        if e_infl.size >= 2 and e_infl.std() and e_real.std():
+            rho = float(np.corrcoef(e_infl, e_real)[0, 1])
+        else:
+            rho = 0.0
+
+    return {
+        "inflation_phi": config.inflation_phi if config.inflation_phi is not None else infl_phi,
+        "inflation_sigma": config.inflation_sigma if config.inflation_sigma is not None else infl_sigma,
+        "real_wage_phi": config.real_wage_phi if config.real_wage_phi is not None else real_phi,
+        "real_wage_sigma": config.real_wage_sigma if config.real_wage_sigma is not None else real_sigma,
+        "rho": rho,
+    }
+
+
+def _prefix_products_2d(growth: np.ndarray) -> np.ndarray:
+    out = np.empty((growth.shape[0], growth.shape[1] + 1))
+    out[:, 0] = 1.0
+    np.cumprod(growth, axis=1, out=out[:, 1:])
+    return out
+
+
+def _sample_ar1(
+    rng: np.random.Generator,
+    n_paths: int,
+    n_years: int,
+    start: tuple[float, float],
+    params: dict,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Deviations from the long-run mean for (inflation, real wage), shape (paths, years)."""
+    z1 = rng.standard_normal((n_paths, n_years))
+    z2 = rng.standard_normal((n_paths, n_years))
+    rho = params["rho"]
+    z2 = rho * z1 + np.sqrt(max(0.0, 1.0 - rho * rho)) * z2
+
+    infl = np.empty((n_paths, n_years))
+    real = np.empty((n_paths, n_years))
+    prev_infl = np.full(n_paths, start[0])
+    prev_real = np.full(n_paths, start[1])
+    for t in range(n_years):
+        prev_infl = params["inflation_phi"] * prev_infl + params["inflation_sigma"] * z1[:, t]
+        prev_real = params["real_wage_phi"] * prev_real + params["real_wage_sigma"] * z2[:, t]
+        infl[:, t] = prev_infl
+        real[:, t] = prev_real
+    return infl, real
+
+
+def simulate_pension_paths(kernel: PensionKernel, config: MonteCarloConfig) -> dict:
+    tables = kernel.rate_tables
+    cy = kernel.current_year
+    ws = kernel.work_start_year
+    yrs = kernel.years_to_standard_retirement
+    retirement_year = cy + yrs
+
+    years = np.arange(ws, retirement_year + 1)
+    n = years.size
+    w = n - 1
+    c = cy - ws
+
+    det = {
+        s: tables.float_rates(s, ws, retirement_year + 1)
+        for s in ("inflation", "real_wage", "i_pillar", "ii_pillar")
+    }
+
+    # lata stochastyczne: od pierwszego roku po tabeli historycznej
+    first_stochastic = tables.first_year + tables.size
+    n_sim = max(0, retirement_year + 1 - first_stochastic)
+    sim_offset = max(0, ws - first_stochastic)
+    col0 = max(0, first_stochastic - ws)
+
+    params = _process_parameters(tables, config)
+    start = (0.0, 0.0)
+    if tables.size:
+        start = (
+            float(tables.series["inflation"].floats[-1] - tables.series["inflation"].float_default),
+            float(tables.series["real_wage"].floats[-1] - tables.series["real_wage"].float_default),
+        )
+
+    curve = experience_curve(kernel.alpha, kernel.beta)
+    base = float(kernel.current_salary) * (curve.head(n) / curve.at(kernel.years_of_experience))
+    mult = kernel.contribution_multipliers.float_vector(years[:w] - kernel.birth_year)
+    i_rate = float(kernel.i_pillar_rate) * 12.0
+    ii_rate = float(kernel.ii_pillar_rate) * 12.0
+    acc_i = float(kernel.accumulated_i_pillar_capital)
+    acc_ii = float(kernel.accumulated_ii_pillar_capital)
+    months = float(kernel.life_expectancy_months)
+
+    n_paths = config.n_paths
+    pension_nom = np.empty(n_paths)
+    pension_real = np.empty(n_paths)
+    rr_nom = np.empty(n_paths)
+    rr_real = np.empty(n_paths)
+    total_nom = np.empty((n_paths, w - c + 1))
+    total_real = np.empty((n_paths, w - c + 1))
+
+    rng = np.random.default_rng(config.seed)
+    for lo in range(0, n_paths, config.chunk_size):
+        hi = min(n_paths, lo + config.chunk_size)
+        p = hi - lo
+
+        infl = np.tile(det["inflation"], (p, 1))
+        real = np.tile(det["real_wage"], (p, 1))
+        if n_sim:
+            d_infl, d_real = _sample_ar1(rng, p, n_sim, start, params)
+            infl[:, col0:] += d_infl[:, sim_offset:]
+            real[:, col0:] += d_real[:, sim_offset:]
+        shock = (infl - det["inflation"]) + (real - det["real_wage"])
+        i_val = det["i_pillar"] + shock
+        ii_idx = det["ii_pillar"] + config.ii_pillar_pass_through * shock
+
+        p_nom = _prefix_products_2d(1.0 + infl + real)
+        p_real = _prefix_products_2d(1.0 + real)
+        salary_nom = base * (p_nom[:, :n] / p_nom[:, c:c + 1])
+        salary_real = base * (p_real[:, :n] / p_real[:, c:c + 1])
+
+        v_i = _prefix_products_2d(1.0 + i_val[:, :w])
+        v_ii = _prefix_products_2d(1.0 + ii_idx[:, :w])
+        v_i_real = _prefix_products_2d((1.0 + i_val[:, :w]) / (1.0 + infl[:, :w]))
+        v_ii_real = _prefix_products_2d((1.0 + ii_idx[:, :w]) / (1.0 + infl[:, :w]))
+
+        def balances(contrib: np.ndarray, v: np.ndarray) -> np.ndarray:
+            acc = np.zeros((p, w + 1))
+            np.cumsum(contrib / v[:, :-1], axis=1, out=acc[:, 1:])
+            return acc * v
+
+        adj_nom = salary_nom[:, :w] * mult
+        adj_real = salary_real[:, :w] * mult
+        b_nom = balances(adj_nom * i_rate, v_i) + balances(adj_nom * ii_rate, v_ii)
+        b_real = balances(adj_real * i_rate, v_i_real) + balances(adj_real * ii_rate, v_ii_real)
+
+        cap_nom = (
+            acc_i * v_i[:, w] / v_i[:, c] + acc_ii * v_ii[:, w] / v_ii[:, c] + b_nom[:, w]
+        )
+        cap_real = (
+            acc_i * v_i_real[:, w] / v_i_real[:, c] + acc_ii * v_ii_real[:, w] / v_ii_real[:, c] + b_real[:, w]
+        )
+        pension_nom[lo:hi] = cap_nom / months
+        pension_real[lo:hi] = cap_real / months
+        final_nom = salary_nom[:, w]
+        final_real = salary_real[:, w]
+        rr_nom[lo:hi] = np.divide(pension_nom[lo:hi], final_nom, out=np.zeros(p), where=final_nom != 0)
+        rr_real[lo:hi] = np.divide(pension_real[lo:hi], final_real, out=np.zeros(p), where=final_real != 0)
+        total_nom[lo:hi] = b_nom[:, c:]
+        total_real[lo:hi] = b_real[:, c:]
+
+    q = list(config.percentiles)
+
+    def bands(values: np.ndarray) -> dict[str, float]:
+        return {f"p{int(k)}": float(v) for k, v in zip(q, np.percentile(values, q))}
+
+    timeline_nom = np.percentile(total_nom, q, axis=0)
+    timeline_real = np.percentile(total_real, q, axis=0)
+    timeline = [
+        {
+            "year": int(year),
+            "total_nominal": {f"p{int(k)}": float(timeline_nom[j, i]) for j, k in enumerate(q)},
+            "total_real": {f"p{int(k)}": float(timeline_real[j, i]) for j, k in enumerate(q)},
+        }
+        for i, year in enumerate(years[c:])
+    ]
+
+    return {
+        "n_paths": n_paths,
+        "retirement_age": kernel.effective_retirement_age,
+        "years_to_retirement": yrs,
+        "process": params,
+        "monthly_pension_nominal": bands(pension_nom),
+        "monthly_pension_real": bands(pension_real),
+        "replacement_rate_percent_nominal": bands(rr_nom * 100.0),
+        "replacement_rate_percent_real": bands(rr_real * 100.0),
+        "timeline": timeline,
+    }
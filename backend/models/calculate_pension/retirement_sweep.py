@@ -0,0 +1,102 @@
+"""
+Retirement-age sweep: pension, capital and replacement rate for a range of retirement
+ages from a single projection.
+
+The career is projected once, up to the latest requested retirement year. Account
+balances of the forward pass at year T only depend on contributions paid before T, so
+every earlier retirement age reads its capital straight from the same balance vectors;
+only the life-expectancy divisor is evaluated per age.
+
+That shared projection is the yearly float64 engine ('numpy'). A model with another
+engine or with resolution='month' is swept age by age through its own engine instead,
+so every point equals the preview of the same payload at that retirement age.
+"""
+from typing import TYPE_CHECKING, Iterable
+
+from backend.models.calculate_pension.vectorized_engine import _career
+from backend.models.pension_models.PensionKernel import PensionKernel
+
+if TYPE_CHECKING:
+    from backend.models.PensionModel import PensionModel
+
+_POINT_KEYS = (
+    "total_capital_nominal",
+    "total_capital_real",
+    "monthly_pension_nominal",
+    "monthly_pension_real",
+    "replacement_rate_percent_nominal",
+    "replacement_rate_percent_real",
+)
+
+
+def model_retirement_age_sweep(model: "PensionModel", retirement_ages: Iterable[int]) -> list[dict]:
+    """
+    Sweep honouring the model's engine and resolution: engine='numpy' at yearly
+    resolution shares one projection, anything else evaluates every age on a copy.
+    """
+    if model.engine == "numpy" and model.resolution == "year":
+        return retirement_age_sweep(model.kernel, retirement_ages)
+
+    trial = model.model_copy()
+    results = []
+    for age in sorted(set(retirement_ages)):
+        trial.retirement_age = age
+        breakdown = trial.evaluate_summary().breakdown
+        results.append({
+            "retirement_age": age,
+            "years_to_retirement": int(breakdown["years_to_retirement"]),
+            **{key: float(breakdown[key]) for key in _POINT_KEYS},
+        })
+    return results
+
+
+def retirement_age_sweep(kernel: PensionKernel, retirement_ages: Iterable[int]) -> list[dict]:
+    ages = sorted(set(retirement_ages))
+    if not ages:
+        return []
+
+    cy = kernel.current_year
+    ws = kernel.work_start_year
+
+    def retirement_year_for(age: int) -> int:
+        return cy + max(0, age - kernel.current_age)
+
+    cv = _career(kernel, retirement_year=retirement_year_for(ages[-1]))
+    c = cv["c"]
+    acc_i = float(kernel.accumulated_i_pillar_capital)
+    acc_ii = float(kernel.accumulated_ii_pillar_capital)
+
+    results = []
+    for age in ages:
+        w = retirement_year_for(age) - ws
+
+        total_nom = (
+            acc_i * cv["v_i"][w] / cv["v_i"][c]
+            + acc_ii * cv["v_ii"][w] / cv["v_ii"][c]
+            + cv["i_nom"][w]
+            + cv["ii_nom"][w]
+        )
+        total_real = (
+            acc_i * cv["v_i_real"][w] / cv["v_i_real"][c]
+            + acc_ii * cv["v_ii_real"][w] / cv["v_ii_real"][c]
+            + cv["i_real"][w]
+            + cv["ii_real"][w]
+        )
+
+        months = float(kernel.life_expectancy_months_for_age(age))
+        pension_nom = float(total_nom) / months
+        pension_real = float(total_real) / months
+        final_nom = float(cv["salary_nom"][w])
+        final_real = float(cv["salary_real"][w])
+
+        results.append({
+            "retirement_age": age,
+            "years_to_retirement": w - c,
+            "total_capital_nominal": float(total_nom),
+            "total_capital_real": float(total_real),
+            "monthly_pension_nominal": pension_nom,
+            "monthly_pension_real": pension_real,
+            "replacement_rate_percent_nominal": (pension_nom / final_nom * 100.0) if final_nom else 0.0,
+            "replacement_rate_percent_real": (pension_real / final_real * 100.0) if final_real else 0.0,
+        })
+    return results
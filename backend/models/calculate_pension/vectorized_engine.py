@@ -0,0 +1,255 @@
+"""
+Float64 (NumPy) projection engine for PensionModel.
+
+Builds salary, contribution-multiplier and valorization vectors over the whole
+career at once and derives the breakdown and the timeline with array ops instead
+of per-year Decimal loops. Results carry the same keys as the Decimal path, with
+plain floats as values.
+
+Parity: every monetary value agrees with the Decimal path within a relative
+tolerance of NUMPY_ENGINE_RTOL (float64 rounding accumulated over ~100 products).
+
+vectorized_breakdown() skips the timeline: the career vectors end where the
+constant-rate, event-free tail begins and the tail is added in closed form.
+"""
+import numpy as np
+
+from backend.models.calculate_pension.closed_form import tail_start, valorized_salary_sum_float
+from backend.models.calculate_salary.experience_curve import experience_curve
+from backend.models.pension_models.PensionEvaluation import PensionEvaluation
+from backend.models.pension_models.PensionKernel import PensionKernel
+
+NUMPY_ENGINE_RTOL = 1e-9
+
+
+def _prefix_products(growth: np.ndarray) -> np.ndarray:
+    """P[k] = prod_{j<k} growth[j]; P[0] = 1. Factor between indices a <= b is P[b] / P[a]."""
+    out = np.empty(growth.size + 1)
+    out[0] = 1.0
+    np.cumprod(growth, out=out[1:])
+    return out
+
+
+def _rate_vectors(kernel: PensionKernel, years: np.ndarray) -> tuple[np.ndarray, ...]:
+    tables = kernel.rate_tables
+    start, stop = int(years[0]), int(years[-1]) + 1
+    return tuple(
+        tables.float_rates(series, start, stop)
+        for series in ("inflation", "real_wage", "i_pillar", "ii_pillar")
+    )
+
+
+def _career(
+    kernel: PensionKernel,
+    mult: np.ndarray | None = None,
+    retirement_year: int | None = None,
+) -> dict:
+    """
+    Wektory całej kariery: lata [work_start_year, retirement_year] włącznie.
+    `mult` — opcjonalny roczny (średni) mnożnik podstawy składek dla lat pracy.
+    `retirement_year` — horyzont inny niż wynikający z modelu (np. sweep wieku emerytalnego).
+    """
+    cy = kernel.current_year
+    ws = kernel.work_start_year
+    if retirement_year is None:
+        retirement_year = kernel.retirement_year
+
+    years = np.arange(ws, retirement_year + 1)
+    n_work = years.size - 1
+    c = cy - ws
+
+    infl, real, i_val, ii_idx = _rate_vectors(kernel, years)
+
+    # wzrost płac: skumulowany od roku bieżącego (w obie strony)
+    p_nom = _prefix_products(1.0 + infl + real)
+    p_real = _prefix_products(1.0 + real)
+    nominal_factor = p_nom[:-1] / p_nom[c]
+    real_factor = p_real[:-1] / p_real[c]
+
+    # kariera zaczyna się z doświadczeniem 0 w roku work_start_year → wycinek krzywej
+    curve = experience_curve(kernel.alpha, kernel.beta)
+    base = float(kernel.current_salary) * (curve.head(years.size) / curve.at(kernel.years_of_experience))
+
+    salary_nom = base * nominal_factor
+    salary_real = base * real_factor
+
+    if mult is None:
+        mult = kernel.contribution_multipliers.float_vector(years[:n_work] - kernel.birth_year)
+    i_rate = float(kernel.i_pillar_rate) * 12.0
+    ii_rate = float(kernel.ii_pillar_rate) * 12.0
+
+    # waloryzacja: prefiksy po latach pracy (indeks k ↔ rok ws + k)
+    v_i = _prefix_products(1.0 + i_val[:n_work])
+    v_ii = _prefix_products(1.0 + ii_idx[:n_work])
+    v_i_real = _prefix_products((1.0 + i_val[:n_work]) / (1.0 + infl[:n_work]))
+    v_ii_real = _prefix_products((1.0 + ii_idx[:n_work]) / (1.0 + infl[:n_work]))
+
+    adj_nom = salary_nom[:n_work] * mult
+    adj_real = salary_real[:n_work] * mult
+
+    def balances(contrib: np.ndarray, v: np.ndarray) -> np.ndarray:
+        # B[k] = v[k] * sum_{j<k} contrib[j] / v[j]
+        acc = np.zeros(n_work + 1)
+        np.cumsum(contrib / v[:-1], out=acc[1:])
+        return acc * v
+
+    return {
+        "years": years,
+        "c": c,
+        "n_work": n_work,
+        "salary_nom": salary_nom,
+        "salary_real": salary_real,
+        "i_nom": balances(adj_nom * i_rate, v_i),
+        "ii_nom": balances(adj_nom * ii_rate, v_ii),
+        "i_real": balances(adj_real * i_rate, v_i_real),
+        "ii_real": balances(adj_real * ii_rate, v_ii_real),
+        "v_i": v_i,
+        "v_ii": v_ii,
+        "v_i_real": v_i_real,
+        "v_ii_real": v_ii_real,
+    }
+
+
+def vectorized_evaluate(kernel: PensionKernel) -> PensionEvaluation:
+    cv = _career(kernel)
+    breakdown, rr_nom, rr_real = _breakdown(kernel, cv)
+    columns = _timeline_columns(cv)
+    return PensionEvaluation.build(breakdown, rr_nom, rr_real, _points(columns), columns=columns)
+
+
+def vectorized_breakdown(kernel: PensionKernel) -> PensionEvaluation:
+    """Breakdown only (empty timeline); the constant-rate, event-free tail in closed form."""
+    retirement_year = kernel.retirement_year
+    start = tail_start(kernel, retirement_year)
+    if start >= retirement_year:
+        breakdown, rr_nom, rr_real = _breakdown(kernel, _career(kernel))
+        return PensionEvaluation.build(breakdown, rr_nom, rr_real, [])
+
+    cv = _career(kernel, retirement_year=start)
+    c, w = cv["c"], cv["n_work"]
+    tables = kernel.rate_tables
+    n = retirement_year - start
+    i_rate = float(kernel.i_pillar_rate)
+    ii_rate = float(kernel.ii_pillar_rate)
+    acc_i = float(kernel.accumulated_i_pillar_capital)
+    acc_ii = float(kernel.accumulated_ii_pillar_capital)
+
+    def total(acc: float, balances: str, v: str, rate: float, wage: str, valorization: str) -> float:
+        # saldo i kapitał zgromadzony na początek ogona, dalej stała stopa g^n + suma zamknięta
+        g = float(tables.growth(valorization, start))
+        at_start = acc * cv[v][w] / cv[v][c] + cv[balances][w]
+        return at_start * g ** n + rate * valorized_salary_sum_float(kernel, start, retirement_year, wage, valorization)
+
+    totals = (
+        total(acc_i, "i_nom", "v_i", i_rate, "nominal_wage", "i_pillar"),
+        total(acc_ii, "ii_nom", "v_ii", ii_rate, "nominal_wage", "ii_pillar"),
+        total(acc_i, "i_real", "v_i_real", i_rate, "real_wage", "i_pillar_real"),
+        total(acc_ii, "ii_real", "v_ii_real", ii_rate, "real_wage", "ii_pillar_real"),
+    )
+    curve = experience_curve(kernel.alpha, kernel.beta)
+    final_exp = kernel.years_of_experience + kernel.years_to_standard_retirement
+    experience_step = curve.at(final_exp) / curve.at(final_exp - n)
+    final_nom = cv["salary_nom"][-1] * experience_step * float(tables.growth("nominal_wage", start)) ** n
+    final_real = cv["salary_real"][-1] * experience_step * float(tables.growth("real_wage", start)) ** n
+    breakdown, rr_nom, rr_real = _breakdown_dict(kernel, totals, final_nom, final_real)
+    return PensionEvaluation.build(breakdown, rr_nom, rr_real, [])
+
+
+def _breakdown(kernel: PensionKernel, cv: dict) -> tuple[dict, float, float]:
+    c, w = cv["c"], cv["n_work"]
+    acc_i = float(kernel.accumulated_i_pillar_capital)
+    acc_ii = float(kernel.accumulated_ii_pillar_capital)
+
+    totals = (
+        acc_i * cv["v_i"][w] / cv["v_i"][c] + cv["i_nom"][w],
+        acc_ii * cv["v_ii"][w] / cv["v_ii"][c] + cv["ii_nom"][w],
+        acc_i * cv["v_i_real"][w] / cv["v_i_real"][c] + cv["i_real"][w],
+        acc_ii * cv["v_ii_real"][w] / cv["v_ii_real"][c] + cv["ii_real"][w],
+    )
+    return _breakdown_dict(kernel, totals, cv["salary_nom"][-1], cv["salary_real"][-1])
+
+
+def _breakdown_dict(
+    kernel: PensionKernel,
+    totals: tuple[float, float, float, float],
+    final_salary_nom: float,
+    final_salary_real: float,
+) -> tuple[dict, float, float]:
+    total_i_nom, total_ii_nom, total_i_real, total_ii_real = (float(t) for t in totals)
+    final_salary_nom = float(final_salary_nom)
+    final_salary_real = float(final_salary_real)
+
+    months = float(kernel.life_expectancy_months)
+    monthly_pension_nom = (total_i_nom + total_ii_nom) / months
+    monthly_pension_real = (total_i_real + total_ii_real) / months
+
+    rr_nom = monthly_pension_nom / final_salary_nom if final_salary_nom else 0.0
+    rr_real = monthly_pension_real / final_salary_real if final_salary_real else 0.0
+
+    breakdown = {
+        "current_age": kernel.current_age,
+        "retirement_age": kernel.effective_retirement_age,
+        "years_to_retirement": kernel.years_to_standard_retirement,
+
+        # salaries
+        "current_monthly_salary_nominal": float(kernel.current_salary),
+        "final_monthly_salary_nominal": final_salary_nom,
+        "final_monthly_salary_real": final_salary_real,
+
+        # nominal block
+        "i_pillar_capital_nominal": total_i_nom,
+        "ii_pillar_capital_nominal": total_ii_nom,
+        "total_capital_nominal": total_i_nom + total_ii_nom,
+        "monthly_pension_nominal": monthly_pension_nom,
+        "replacement_rate_percent_nominal": rr_nom * 100.0,
+
+        # real block
+        "i_pillar_capital_real": total_i_real,
+        "ii_pillar_capital_real": total_ii_real,
+        "total_capital_real": total_i_real + total_ii_real,
+        "monthly_pension_real": monthly_pension_real,
+        "replacement_rate_percent_real": rr_real * 100.0,
+    }
+    return breakdown, rr_nom, rr_real
+
+
+def _timeline_columns(cv: dict) -> dict[str, np.ndarray]:
+    sl = slice(cv["c"], None)
+    return _columns(
+        cv["years"][sl],
+        cv["i_nom"][sl],
+        cv["ii_nom"][sl],
+        cv["salary_nom"][sl],
+        cv["i_real"][sl],
+        cv["ii_real"][sl],
+        cv["salary_real"][sl],
+    )
+
+
+def _columns(
+    years: np.ndarray,
+    i_nom: np.ndarray,
+    ii_nom: np.ndarray,
+    salary_nom: np.ndarray,
+    i_real: np.ndarray,
+    ii_real: np.ndarray,
+    salary_real: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Kolumny osi czasu (pensje miesięczne → roczne), klucze jak w punktach osi czasu."""
+    return {
+        "year": years,
+        "i_pillar_nominal": i_nom,
+        "ii_pillar_nominal": ii_nom,
+        "total_nominal": i_nom + ii_nom,
+        "annual_salary_nominal": salary_nom * 12.0,
+        "i_pillar_real": i_real,
+        "ii_pillar_real": ii_real,
+        "total_real": i_real + ii_real,
+        "annual_salary_real": salary_real * 12.0,
+    }
+
+
+def _points(columns: dict[str, np.ndarray]) -> list[dict]:
+    """Punkty osi czasu (słowniki) z kolumn."""
+    keys = tuple(columns)
+    return [dict(zip(keys, row)) for row in zip(*(columns[k].tolist() for k in keys))]
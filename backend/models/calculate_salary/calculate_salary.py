@@ -2,12 +2,13 @@ import asyncio
 import logging
 from decimal import Decimal
 
-from backend.models.calculate_salary.experience_multiplier import experience_multiplier
-from backend.models.salary_regressions.data.regression_dict import regression_dict
+from backend.models.calculate_salary.experience_curve import experience_curve
+from backend.models.data.data_registry import data_registry
 from backend.llm.classify_job.classify_job import classify_job
 from backend.llm.estimated_monthly_salary.get_estimated_monthly_salary import (
     get_estimated_monthly_salary,
 )
+from backend.utils.timing import phase
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +20,14 @@ async def calculate_salary(industry: str, location: str, experience: int):
     experience_multiplier = 1 + alpha * (1 - e^(-beta * years_of_experience))
     """
 
-    category = await classify_job(industry)
+    with phase("classify_job"):
+        category = await classify_job(industry)
     logger.info(f'Industry {industry} classified as: {category}')
-    alpha, beta = regression_dict.get(category, (.85, .12))
+    alpha, beta = data_registry.current().regressions.get(category, (.85, .12))
     logger.info(f'alpha: {alpha}, beta: {beta}')
-    multi = experience_multiplier(experience, float(alpha), float(beta))
-    base_salary = await get_estimated_monthly_salary(industry, location)
+    multi = experience_curve(float(alpha), float(beta)).at(experience)
+    with phase("estimated_salary"):
+        base_salary = await get_estimated_monthly_salary(industry, location)
     logger.info(f'calculating the salary based on based salary: {base_salary} and experience multiplier: {multi} for experience: {experience} years.')
     calculated_salary = round(Decimal(float(base_salary) * multi), 2)
     return calculated_salary, alpha, beta
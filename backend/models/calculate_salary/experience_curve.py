@@ -0,0 +1,71 @@
+"""
+Precomputed experience curves, shared process-wide per (alpha, beta).
+
+experience_multiplier(exp) is evaluated once for exp = 0..MAX_EXPERIENCE into a
+read-only float64 array (bit-identical to the scalar calls); the ~155 catalogue pairs
+plus ad-hoc ones from requests are kept in an LRU cache. The same table in Decimal
+(for the integer 'fixed' engine) is built lazily on first use. A career starts at experience 0
+in its first year, so the salary path of a model is `values[:n] / values[now]`.
+"""
+from decimal import Decimal
+from functools import lru_cache
+
+import numpy as np
+
+from backend.models.calculate_salary.experience_multiplier import experience_multiplier
+
+MAX_EXPERIENCE = 80
+EXPERIENCE_CURVE_CACHE_SIZE = 1024
+
+
+class ExperienceCurve:
+    __slots__ = ("alpha", "beta", "values", "_list", "_decimals")
+
+    def __init__(self, alpha: float, beta: float):
+        self.alpha = alpha
+        self.beta = beta
+        self.values = experience_multiplier(exp=np.arange(MAX_EXPERIENCE + 1), alpha=alpha, beta=beta)
+        self.values.flags.writeable = False
+        self._list = self.values.tolist()
+        self._decimals = None
+
+    def at(self, exp: int) -> float:
+        """Multiplier for `exp` >= 0 years of experience."""
+        if exp <= MAX_EXPERIENCE:
+            return self._list[exp]
+        return float(experience_multiplier(exp=exp, alpha=self.alpha, beta=self.beta))
+
+    def decimal_at(self, exp: int) -> Decimal:
+        """Multiplier for `exp` >= 0 computed in Decimal from the decimal forms of alpha, beta."""
+        if exp <= MAX_EXPERIENCE:
+            if self._decimals is None:
+                self._decimals = [self._decimal(k) for k in range(MAX_EXPERIENCE + 1)]
+            return self._decimals[exp]
+        return self._decimal(exp)
+
+    def _decimal(self, exp: int) -> Decimal:
+        alpha = Decimal(repr(self.alpha))
+        beta = Decimal(repr(self.beta))
+        return 1 + alpha * (1 - (-beta * exp).exp())
+
+    def head(self, n: int) -> np.ndarray:
+        """Multipliers for experience 0..n-1 (a view of the table when n fits)."""
+        if n <= MAX_EXPERIENCE + 1:
+            return self.values[:n]
+        return experience_multiplier(exp=np.arange(n), alpha=self.alpha, beta=self.beta)
+
+    def take(self, exp: np.ndarray) -> np.ndarray:
+        """Multipliers for an integer array of experience values >= 0."""
+        if exp.size and exp.max() > MAX_EXPERIENCE:
+            return experience_multiplier(exp=exp, alpha=self.alpha, beta=self.beta)
+        return self.values[exp]
+
+
+@lru_cache(maxsize=EXPERIENCE_CURVE_CACHE_SIZE)
+def experience_curve(alpha: float, beta: float) -> ExperienceCurve:
+    return ExperienceCurve(float(alpha), float(beta))
+
+
+def experience_curve_stats() -> dict:
+    info = experience_curve.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
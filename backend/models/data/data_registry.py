@@ -0,0 +1,243 @@
+"""
+Process-wide registry of the reference data files: the macro table
+(`poland_macro_data.csv`), the salary regression parameters per job category
+(`regression_results.csv`) and, optionally, a GUS life expectancy table (compiled to
+a memory-mapped binary on load; without it the 84 / 88 rule applies).
+
+Readers take `data_registry.current()` once per request and use that immutable
+snapshot throughout. `reload()` parses the files off the request path, warms the
+shared rate tables for the new macro table and only then swaps the snapshot in
+(a single reference assignment), so requests never see a half-loaded dataset; a
+malformed file leaves the current snapshot in place. `watch()` polls the files'
+mtime / size from a daemon thread and reloads on change.
+
+Caches key on the digest of the dataset they depend on (rate tables and preview
+responses on the macro table digest), so a swap never serves stale entries, and
+entries of a dataset that did not change stay warm. The experience curves key on
+(alpha, beta) alone; they are dropped when the regression catalogue changes, so the
+LRU holds the pairs of the current catalogue rather than those of a retired one.
+"""
+import csv
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from backend.models.pension_models.LifeExpectancyTable import LifeExpectancyTable, load_life_table
+from backend.models.pension_models.MacroDataTable import DEFAULT_MACRO_DATA_PATH, MacroDataTable, load_macro_table
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGRESSION_DATA_PATH = (
+    Path(__file__).resolve().parent.parent / "salary_regressions" / "data" / "regression_results.csv"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DataSnapshot:
+    """One consistent version of all reference data."""
+
+    macro: MacroDataTable
+    regressions: Mapping[str, tuple[str, str]]  # kategoria → (alpha, beta) jako tekst z pliku
+    regressions_digest: str
+    life_table: Optional[LifeExpectancyTable]
+    version: str
+    loaded_at: float
+
+
+def load_regressions(path: Path | str) -> tuple[Mapping[str, tuple[str, str]], str]:
+    """Parses `Job_Description,alpha,beta` rows; returns (read-only mapping, content digest)."""
+    path = Path(path)
+    content = path.read_bytes()
+    regressions: dict[str, tuple[str, str]] = {}
+    rows = csv.reader(content.decode("utf-8").splitlines())
+    header = next(rows, None)
+    if header is None or [name.strip() for name in header[:3]] != ["Job_Description", "alpha", "beta"]:
+        raise ValueError(f"{path}: expected header 'Job_Description,alpha,beta'")
+    for line_no, row in enumerate(rows, start=2):
+        if not row:
+            continue
+        try:
+            category, alpha, beta = row[0], row[1], row[2]
+            float(alpha), float(beta)
+        except (IndexError, ValueError):
+            raise ValueError(f"{path}: malformed row {line_no}: {row}") from None
+        regressions[category] = (alpha, beta)
+    if not regressions:
+        raise ValueError(f"{path}: no job categories")
+    return MappingProxyType(regressions), hashlib.sha256(content).hexdigest()
+
+
+def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DataRegistry:
+    def __init__(
+        self,
+        macro_path: Path | str = DEFAULT_MACRO_DATA_PATH,
+        regression_path: Path | str = DEFAULT_REGRESSION_DATA_PATH,
+        life_expectancy_path: Optional[Path | str] = None,
+    ):
+        self.macro_path = Path(macro_path)
+        self.regression_path = Path(regression_path)
+        self.life_expectancy_path = Path(life_expectancy_path) if life_expectancy_path else None
+        self.reloads = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self._snapshot: Optional[DataSnapshot] = None
+        self._signatures: tuple = ()
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def current(self) -> DataSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.reload()
+            snapshot = self._snapshot
+        return snapshot
+
+    def configure(
+        self,
+        macro_path: Optional[Path | str] = None,
+        regression_path: Optional[Path | str] = None,
+        life_expectancy_path: Optional[Path | str] = None,
+    ) -> None:
+        """Points the registry at other files (None keeps the current path) and reloads."""
+        with self._lock:
+            self.macro_path = Path(macro_path) if macro_path else self.macro_path
+            self.regression_path = Path(regression_path) if regression_path else self.regression_path
+            if life_expectancy_path:
+                self.life_expectancy_path = Path(life_expectancy_path)
+            self._signatures = ()
+        self.reload()
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Loads the files if they changed on disk (or `force`) and swaps the snapshot in
+        when their content differs. Returns True on a swap; raises ValueError / OSError on
+        unreadable data, keeping the current snapshot.
+        """
+        with self._lock:
+            signatures = (
+                _file_signature(self.macro_path),
+                _file_signature(self.regression_path),
+                _file_signature(self.life_expectancy_path) if self.life_expectancy_path else None,
+            )
+            if self._snapshot is not None and not force and signatures == self._signatures:
+                return False
+            try:
+                macro = load_macro_table(self.macro_path)
+                regressions, regressions_digest = load_regressions(self.regression_path)
+                life_table = load_life_table(self.life_expectancy_path) if self.life_expectancy_path else None
+            except (ValueError, OSError) as exc:
+                # ten sam stan plików nie jest ponawiany przez watch(); force ponawia
+                self._signatures = signatures
+                self.failures += 1
+                self.last_error = str(exc)
+                logger.error(f"Reference data reload failed, keeping version {self._version()}: {exc}")
+                raise
+            self._signatures = signatures
+            self.last_error = None
+            version = f"{macro.version}-{macro.digest[:8]}-{regressions_digest[:8]}"
+            if life_table is not None:
+                version += f"-{life_table.version}-{life_table.digest[:8]}"
+            if self._snapshot is not None and self._snapshot.version == version:
+                return False
+
+            snapshot = DataSnapshot(
+                macro=macro,
+                regressions=regressions,
+                regressions_digest=regressions_digest,
+                life_table=life_table,
+                version=version,
+                loaded_at=time.time(),
+            )
+            _warm(snapshot)
+            previous, self._snapshot = self._snapshot, snapshot
+            if previous is not None and previous.regressions_digest != regressions_digest:
+                _clear_experience_curves()
+            self.reloads += 1
+        logger.info(f"Reference data version {version} loaded")
+        return True
+
+    def ensure(self, version: str) -> None:
+        """Reloads when this process lags behind `version` (e.g. an engine pool worker)."""
+        if self.current().version != version:
+            self.reload(force=True)
+
+    def watch(self, interval_seconds: float) -> None:
+        """Starts a daemon thread reloading the files whenever their mtime or size changes."""
+        if self._watcher is not None or interval_seconds <= 0:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval_seconds,), name="data-registry-watch", daemon=True
+        )
+        self._watcher.start()
+
+    def stop(self) -> None:
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            self._stop.set()
+            watcher.join()
+
+    def _watch(self, interval_seconds: float) -> None:
+        while not self._stop.wait(interval_seconds):
+            try:
+                self.reload()
+            except (ValueError, OSError):
+                pass  # zalogowane w reload(); zostaje bieżąca wersja
+
+    def _version(self) -> Optional[str]:
+        return self._snapshot.version if self._snapshot is not None else None
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "version": self._version(),
+            "macro_version": snapshot.macro.version if snapshot else None,
+            "macro_years": [snapshot.macro.first_year, snapshot.macro.last_year] if snapshot else None,
+            "job_categories": len(snapshot.regressions) if snapshot else 0,
+            "life_expectancy_table": (
+                {
+                    "version": snapshot.life_table.version,
+                    "publication_years": [snapshot.life_table.first_year, snapshot.life_table.last_year],
+                    "ages": [snapshot.life_table.first_age, snapshot.life_table.last_age],
+                }
+                if snapshot and snapshot.life_table is not None
+                else None
+            ),
+            "loaded_at": snapshot.loaded_at if snapshot else None,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "watching": self._watcher is not None,
+        }
+
+
+def _warm(snapshot: DataSnapshot) -> None:
+    """Builds the shared rate tables of the default macro factors before the swap."""
+    from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
+    from backend.models.pension_models.rate_tables_registry import get_rate_tables
+
+    get_rate_tables(MacroeconomicFactors(macro_data=snapshot.macro))
+
+
+def _clear_experience_curves() -> None:
+    from backend.models.calculate_salary.experience_curve import experience_curve
+
+    experience_curve.cache_clear()
+
+
+data_registry = DataRegistry()
@@ -0,0 +1,113 @@
+import heapq
+from decimal import Decimal
+from typing import Sequence
+
+import numpy as np
+
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+
+ONE = Decimal("1")
+ZERO = Decimal("0")
+
+
+class ContributionMultipliers:
+    """
+    Per-age (or per-month-of-age) contribution-base multipliers compiled from a list of
+    NonFunctionalEvent.
+
+    Ages outside [first_age, first_age + len(values)) are not covered by any event (multiplier 1).
+    """
+
+    __slots__ = ("first_age", "values", "floats")
+
+    def __init__(self, first_age: int, values: list[Decimal]):
+        self.first_age = first_age
+        self.values = values
+        self.floats = np.array([float(v) for v in values], dtype=np.float64)
+
+    def for_age(self, age: int) -> Decimal:
+        idx = age - self.first_age
+        if 0 <= idx < len(self.values):
+            return self.values[idx]
+        return ONE
+
+    def float_vector(self, ages: np.ndarray) -> np.ndarray:
+        out = np.ones(ages.size)
+        idx = ages - self.first_age
+        covered = (idx >= 0) & (idx < self.floats.size)
+        out[covered] = self.floats[idx[covered]]
+        return out
+
+
+def check_whole_year_events(events: Sequence[NonFunctionalEvent]) -> None:
+    """
+    Yearly resolution sees only whole years of age, so month bounds would be dropped
+    without a trace — such events are rejected (ValueError) instead.
+    """
+    for e in events:
+        if e.start_month or e.end_month:
+            raise ValueError(
+                f"event '{e.reason}' has month bounds (start_month={e.start_month}, end_month={e.end_month}); "
+                "month-precise events require resolution='month'"
+            )
+
+
+def compile_contribution_multipliers(
+    events: Sequence[NonFunctionalEvent], monthly: bool = False
+) -> ContributionMultipliers:
+    """
+    Sweep over sorted event start/end ages, keeping the count of active basis_zero events
+    and a lazy-deletion min-heap of active multipliers:
+    - any covering event with basis_zero=True → 0
+    - otherwise min(contrib_multiplier) of the covering events
+    - no covering event → 1
+
+    With monthly=True the index is in months of age (age * 12 + month) and honours the
+    events' start_month / end_month; otherwise only whole-year ages are used (callers in
+    yearly resolution reject month bounds first, see check_whole_year_events).
+    """
+    boundaries: list[tuple[int, int, int]] = []  # (age, +1 start / -1 end, event index)
+    for i, e in enumerate(events):
+        if monthly:
+            start, end = e.start_age * 12 + e.start_month, e.end_age * 12 + e.end_month
+        else:
+            start, end = e.start_age, e.end_age
+        if start < end:
+            boundaries.append((start, 1, i))
+            boundaries.append((end, -1, i))
+    if not boundaries:
+        return ContributionMultipliers(0, [])
+    boundaries.sort()
+
+    first_age = boundaries[0][0]
+    values: list[Decimal] = []
+    active = [False] * len(events)
+    zero_count = 0
+    heap: list[tuple[float, int]] = []
+
+    pos = 0
+    while pos < len(boundaries):
+        age = boundaries[pos][0]
+        while pos < len(boundaries) and boundaries[pos][0] == age:
+            _, kind, i = boundaries[pos]
+            e = events[i]
+            active[i] = kind > 0
+            if e.basis_zero:
+                zero_count += kind
+            elif kind > 0:
+                heapq.heappush(heap, (e.contrib_multiplier, i))
+            pos += 1
+        if pos == len(boundaries):
+            break
+
+        while heap and not active[heap[0][1]]:
+            heapq.heappop(heap)
+        if zero_count:
+            value = ZERO
+        elif heap:
+            value = Decimal(str(heap[0][0]))
+        else:
+            value = ONE
+        values.extend([value] * (boundaries[pos][0] - age))
+
+    return ContributionMultipliers(first_age, values)
@@ -0,0 +1,41 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class CohortConfig(BaseModel):
+    """Synthetic worker population sampled over the regression job catalogue"""
+
+    n_workers: int = Field(default=1_000_000, ge=1, description="Number of synthetic workers")
+    seed: Optional[int] = Field(default=None, description="RNG seed (None = non-deterministic)")
+    chunk_size: int = Field(
+        default=20_000, ge=1, description="Workers evaluated per chunk (bounds peak memory)"
+    )
+
+    categories: Optional[list[str]] = Field(
+        default=None, description="Job categories to sample from (None = whole regression catalogue)"
+    )
+    age_min: int = Field(default=25, ge=0, le=120, description="Youngest sampled age")
+    age_max: int = Field(default=60, ge=0, le=120, description="Oldest sampled age (inclusive)")
+    career_start_age_min: int = Field(default=19, ge=0, le=120, description="Earliest career start age")
+    career_start_age_max: int = Field(default=27, ge=0, le=120, description="Latest career start age (inclusive)")
+    male_share: float = Field(default=0.5, ge=0, le=1, description="Probability that a worker is male")
+
+    # pensja na starcie kariery: lognormalna; bieżąca = startowa × mnożnik doświadczenia zawodu
+    entry_salary_median: float = Field(default=5000.0, gt=0, description="Median monthly entry salary (PLN)")
+    entry_salary_sigma: float = Field(default=0.35, ge=0, description="Log-std of the entry salary")
+
+    # histogramy strumieniowe — kwantyle liczone z nich (dokładność = szerokość przedziału)
+    replacement_rate_bins: int = Field(default=400, ge=1, description="Bins of the replacement rate histogram")
+    replacement_rate_max_percent: float = Field(default=200.0, gt=0, description="Upper edge of the replacement rate histogram")
+    pension_bins: int = Field(default=600, ge=1, description="Bins of the monthly pension histogram")
+    pension_max: float = Field(default=60_000.0, gt=0, description="Upper edge of the monthly pension histogram (PLN)")
+    percentiles: tuple[float, ...] = Field(default=(10, 25, 50, 75, 90), description="Reported percentiles")
+
+    @model_validator(mode="after")
+    def _check_ranges(self) -> "CohortConfig":
+        if self.age_min > self.age_max:
+            raise ValueError("age_min must not exceed age_max")
+        if self.career_start_age_min > self.career_start_age_max:
+            raise ValueError("career_start_age_min must not exceed career_start_age_max")
+        return self
@@ -0,0 +1,160 @@
+"""
+Life expectancy used to turn retirement capital into a monthly pension.
+
+Default: the 84 / 88 rule (84 or 88 minus the retirement age, in whole years). With a
+GUS-style table ("tablica średniego dalszego trwania życia": average remaining months of
+life by age in years and months, one table per publication year, unisex as ZUS uses it)
+the divisor is read from the table in effect in the retirement year.
+
+Source CSV (`# version:` line, then `publication_year,age,0,1,…,11`; one row per
+publication year and age, columns are the months of age, values in months with one
+decimal) is compiled once into a binary file next to it: a fixed header plus a dense
+uint16 array [publication year, age, month of age] in tenths of a month. The binary is
+memory-mapped, so every process (engine pool workers included) shares the same pages and
+a lookup is one array index — no parsing per request.
+
+Outside the table the nearest entry applies: retirement years before the first / after
+the last publication use the first / last table, ages are clamped to the covered range.
+"""
+import csv
+import hashlib
+import os
+import struct
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+_MAGIC = b"PLET"
+_FORMAT = 1
+# magic, format, first_year, n_years, first_age, n_ages, version (ASCII, zero-padded)
+_HEADER = struct.Struct("<4sIiiii32s")
+_HEADER_SIZE = 64
+TENTHS = Decimal("0.1")
+
+
+def life_expectancy_years(retirement_age: int, is_male: bool) -> int:
+    """Lata pobierania emerytury: 84 / 88 minus wiek przejścia, co najmniej 1."""
+    years = (84 - retirement_age) if is_male else (88 - retirement_age)
+    return max(1, years)
+
+
+class LifeExpectancyTable:
+    """Memory-mapped GUS-style table: remaining months by (publication year, age, month of age)."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"{self.path}: truncated life expectancy table")
+        magic, fmt, first_year, n_years, first_age, n_ages, version = _HEADER.unpack(header)
+        if magic != _MAGIC or fmt != _FORMAT:
+            raise ValueError(f"{self.path}: not a compiled life expectancy table")
+        self.first_year = first_year
+        self.first_age = first_age
+        self.version = version.rstrip(b"\0").decode("ascii")
+        mapped = np.memmap(self.path, dtype="<u2", mode="r", offset=_HEADER_SIZE, shape=(n_years, n_ages, 12))
+        # zwykły widok ndarray na te same strony — indeksowanie skalarne bez narzutu np.memmap
+        self.tenths = mapped.view(np.ndarray)
+        self._max_year_index = n_years - 1
+        self._max_age_index = n_ages - 1
+        self.digest = hashlib.sha256(self.path.read_bytes()).hexdigest()
+
+    @property
+    def last_year(self) -> int:
+        return self.first_year + self.tenths.shape[0] - 1
+
+    @property
+    def last_age(self) -> int:
+        return self.first_age + self.tenths.shape[1] - 1
+
+    def months(self, year: int, age: int, month_of_age: int = 0) -> Decimal:
+        """Average remaining months of life at `age` years + `month_of_age` for retirement in `year`."""
+        yi = min(max(year - self.first_year, 0), self._max_year_index)
+        ai = min(max(age - self.first_age, 0), self._max_age_index)
+        return int(self.tenths[yi, ai, month_of_age]) * TENTHS
+
+    def months_array(self, years: np.ndarray, ages: np.ndarray) -> np.ndarray:
+        """float64 remaining months for arrays of retirement years and ages (month of age 0)."""
+        yi = np.clip(np.asarray(years) - self.first_year, 0, self._max_year_index)
+        ai = np.clip(np.asarray(ages) - self.first_age, 0, self._max_age_index)
+        return self.tenths[yi, ai, 0] / 10.0
+
+
+def life_expectancy_months(
+    retirement_age: int, is_male: bool, retirement_year: int, table: Optional[LifeExpectancyTable] = None
+) -> Decimal:
+    """Divisor of the retirement capital in months: from the table if given, else the 84 / 88 rule."""
+    if table is not None:
+        return table.months(retirement_year, retirement_age)
+    return Decimal(life_expectancy_years(retirement_age, is_male) * 12)
+
+
+def compile_life_table(csv_path: Path | str, out_path: Path | str) -> None:
+    """Parses the source CSV into the binary layout; written atomically (tmp file + rename)."""
+    csv_path, out_path = Path(csv_path), Path(out_path)
+    version = ""
+    rows: dict[tuple[int, int], list[int]] = {}
+    with csv_path.open(newline="", encoding="utf-8") as f:
+        lines = iter(f)
+        header = None
+        for line in lines:
+            if line.startswith("#"):
+                key, _, value = line[1:].partition(":")
+                if key.strip() == "version":
+                    version = value.strip()
+            elif line.strip():
+                header = next(csv.reader([line]))
+                break
+        if header is None or [h.strip() for h in header] != ["publication_year", "age", *map(str, range(12))]:
+            raise ValueError(f"{csv_path}: expected header 'publication_year,age,0,1,...,11'")
+        for line_no, record in enumerate(csv.reader(lines), start=1):
+            if not record or not "".join(record).strip():
+                continue
+            try:
+                key = (int(record[0]), int(record[1]))
+                values = [int((Decimal(v) / TENTHS).to_integral_value()) for v in record[2:14]]
+            except (ArithmeticError, ValueError, IndexError):
+                raise ValueError(f"{csv_path}: malformed row {line_no}: {record}") from None
+            if len(values) != 12 or not all(0 < v < 2**16 for v in values):
+                raise ValueError(f"{csv_path}: malformed row {line_no}: {record}")
+            if key in rows:
+                raise ValueError(f"{csv_path}: duplicate row for {key}")
+            rows[key] = values
+    if not version:
+        raise ValueError(f"{csv_path}: missing '# version:' line")
+    if not rows:
+        raise ValueError(f"{csv_path}: empty life expectancy table")
+
+    years = sorted({y for y, _ in rows})
+    ages = sorted({a for _, a in rows})
+    first_year, first_age = years[0], ages[0]
+    shape = (years[-1] - first_year + 1, ages[-1] - first_age + 1, 12)
+    if len(rows) != shape[0] * shape[1]:
+        raise ValueError(f"{csv_path}: every publication year must cover ages {first_age}-{ages[-1]}, years consecutive")
+    data = np.empty(shape, dtype="<u2")
+    for (year, age), values in rows.items():
+        data[year - first_year, age - first_age] = values
+
+    header = _HEADER.pack(_MAGIC, _FORMAT, first_year, shape[0], first_age, shape[1], version.encode("ascii")[:32])
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(header.ljust(_HEADER_SIZE, b"\0"))
+        f.write(data.tobytes())
+    os.replace(tmp, out_path)
+
+
+def load_life_table(path: Path | str) -> LifeExpectancyTable:
+    """
+    Opens a table: a compiled `.bin` directly, a source `.csv` through its sibling `.bin`
+    (recompiled only when older than the CSV).
+    """
+    path = Path(path)
+    if path.suffix.lower() != ".csv":
+        return LifeExpectancyTable(path)
+    compiled = path.with_suffix(".bin")
+    if not compiled.exists() or compiled.stat().st_mtime_ns < path.stat().st_mtime_ns:
+        compile_life_table(path, compiled)
+    return LifeExpectancyTable(compiled)
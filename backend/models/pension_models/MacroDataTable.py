@@ -0,0 +1,149 @@
+"""
+Historical macro data as a dense, year-indexed table loaded from a versioned CSV file.
+
+File layout (`backend/models/data/poland_macro_data.csv`): `# key: value` metadata lines
+(version, precision, extrapolate_before, extrapolate_after), then a header
+`year,inflation,real_wage,i_pillar,ii_pillar[,note]` and one row per consecutive year.
+Values are read as exact decimal strings and quantized to `precision` (half-even).
+
+Extrapolation policies say which rate applies outside [first_year, last_year]:
+- "defaults": the MacroeconomicFactors default rates (long-term assumptions),
+- "hold": the nearest observed row (first row before, last row after the data),
+- "mean": the column mean over the whole table (quantized like the data).
+"""
+import csv
+import hashlib
+from dataclasses import dataclass
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from pathlib import Path
+from typing import Literal, Optional, get_args
+
+MACRO_COLUMNS = ("inflation", "real_wage", "i_pillar", "ii_pillar")
+
+ExtrapolationPolicy = Literal["defaults", "hold", "mean"]
+
+DEFAULT_MACRO_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "poland_macro_data.csv"
+
+
+@dataclass(frozen=True, slots=True)
+class MacroDataTable:
+    """Immutable macro table: column name → one quantized rate per year from `first_year`."""
+
+    version: str
+    first_year: int
+    precision: Decimal
+    columns: dict[str, tuple[Decimal, ...]]
+    extrapolate_before: ExtrapolationPolicy = "defaults"
+    extrapolate_after: ExtrapolationPolicy = "defaults"
+    digest: str = ""
+
+    @property
+    def size(self) -> int:
+        return len(self.columns[MACRO_COLUMNS[0]])
+
+    @property
+    def last_year(self) -> int:
+        return self.first_year + self.size - 1
+
+    def row(self, year: int) -> Optional[tuple[Decimal, ...]]:
+        """(inflation, real_wage, i_pillar, ii_pillar) of `year`, None outside the data."""
+        idx = year - self.first_year
+        if not 0 <= idx < self.size:
+            return None
+        return tuple(self.columns[name][idx] for name in MACRO_COLUMNS)
+
+    def extrapolated(
+        self, policy: ExtrapolationPolicy, side: Literal["before", "after"], defaults: tuple[Decimal, ...]
+    ) -> tuple[Decimal, ...]:
+        """Rates (in MACRO_COLUMNS order) used outside the data on `side` under `policy`."""
+        if policy == "defaults" or not self.size:
+            return defaults
+        if policy == "hold":
+            return self.row(self.first_year if side == "before" else self.last_year)
+        return tuple(
+            _quantize(sum(self.columns[name], Decimal(0)) / self.size, self.precision) for name in MACRO_COLUMNS
+        )
+
+    @classmethod
+    def build(
+        cls,
+        version: str,
+        rows: dict[int, tuple[Decimal, ...]],
+        precision: Decimal = Decimal("0.001"),
+        extrapolate_before: ExtrapolationPolicy = "defaults",
+        extrapolate_after: ExtrapolationPolicy = "defaults",
+    ) -> "MacroDataTable":
+        """Table from {year: rates}; the years must be consecutive."""
+        years = sorted(rows)
+        if years and years[-1] - years[0] + 1 != len(years):
+            missing = sorted(set(range(years[0], years[-1] + 1)) - set(years))
+            raise ValueError(f"macro data must cover consecutive years; missing: {missing}")
+        for policy in (extrapolate_before, extrapolate_after):
+            if policy not in get_args(ExtrapolationPolicy):
+                raise ValueError(f"unknown extrapolation policy: {policy!r}")
+
+        columns = {
+            name: tuple(_quantize(rows[year][i], precision) for year in years)
+            for i, name in enumerate(MACRO_COLUMNS)
+        }
+        first_year = years[0] if years else 0
+        digest = hashlib.sha256(
+            repr((version, precision, extrapolate_before, extrapolate_after, first_year, columns)).encode()
+        ).hexdigest()
+        return cls(
+            version=version,
+            first_year=first_year,
+            precision=precision,
+            columns=columns,
+            extrapolate_before=extrapolate_before,
+            extrapolate_after=extrapolate_after,
+            digest=digest,
+        )
+
+
+def _quantize(value: Decimal, precision: Decimal) -> Decimal:
+    return value.quantize(precision, rounding=ROUND_HALF_EVEN)
+
+
+def load_macro_table(path: Path | str = DEFAULT_MACRO_DATA_PATH) -> MacroDataTable:
+    """Parses a macro data CSV (see the module docstring); raises ValueError on malformed input."""
+    path = Path(path)
+    meta: dict[str, str] = {}
+    rows: dict[int, tuple[Decimal, ...]] = {}
+    with path.open(newline="", encoding="utf-8") as f:
+        lines = iter(f)
+        header = None
+        for line in lines:
+            if line.startswith("#"):
+                key, _, value = line[1:].partition(":")
+                meta[key.strip()] = value.strip()
+            elif line.strip():
+                header = next(csv.reader([line]))
+                break
+        if header is None or header[:5] != ["year", *MACRO_COLUMNS]:
+            raise ValueError(f"{path}: expected header 'year,{','.join(MACRO_COLUMNS)}[,...]'")
+
+        for line_no, record in enumerate(csv.reader(lines), start=1):
+            if not record or not "".join(record).strip():
+                continue
+            try:
+                year = int(record[0])
+                values = tuple(Decimal(value) for value in record[1:5])
+            except (ValueError, InvalidOperation, IndexError):
+                raise ValueError(f"{path}: malformed data row {line_no}: {record}") from None
+            if len(values) != len(MACRO_COLUMNS):
+                raise ValueError(f"{path}: malformed data row {line_no}: {record}")
+            if year in rows:
+                raise ValueError(f"{path}: duplicate year {year}")
+            rows[year] = values
+
+    if "version" not in meta:
+        raise ValueError(f"{path}: missing '# version:' line")
+    return MacroDataTable.build(
+        version=meta["version"],
+        rows=rows,
+        precision=Decimal(meta.get("precision", "0.001")),
+        extrapolate_before=meta.get("extrapolate_before", "defaults"),  # type: ignore[arg-type]
+        extrapolate_after=meta.get("extrapolate_after", "defaults"),  # type: ignore[arg-type]
+    )
+
@@ -0,0 +1,186 @@
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import numpy as np
+
+from backend.models.pension_models.MacroDataTable import MACRO_COLUMNS
+from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
+
+ONE = Decimal("1")
+
+# stopy w trybie stałoprzecinkowym: 1 + r jako liczba całkowita × 10^-12
+RATE_SCALE = 10**12
+
+# zakres lat (w obie strony od roku bazowego) skalowanych czynników trzymanych w pamięci
+SCALED_FACTOR_WINDOW = 128
+
+SERIES = (
+    "inflation",
+    "real_wage",
+    "nominal_wage",
+    "i_pillar",
+    "ii_pillar",
+    "i_pillar_real",
+    "ii_pillar_real",
+)
+
+
+class _Series:
+    """
+    One macro series: dense yearly rates over the historical span plus prefix products.
+    `default*` apply after the span, `before*` before it.
+    """
+
+    __slots__ = (
+        "rates", "growth", "prefix", "default", "default_growth", "floats", "float_default",
+        "scaled", "scaled_default", "before", "before_growth", "float_before", "scaled_before",
+    )
+
+    def __init__(self, rates: list[Decimal], default: Decimal, before: Decimal):
+        self.rates = rates
+        self.growth = [ONE + r for r in rates]
+        self.default = default
+        self.default_growth = ONE + default
+        self.before = before
+        self.before_growth = ONE + before
+        prefix = [ONE]
+        for g in self.growth:
+            prefix.append(prefix[-1] * g)
+        self.prefix = prefix
+        self.floats = np.array([float(r) for r in rates], dtype=np.float64)
+        self.floats.flags.writeable = False
+        self.float_default = float(default)
+        self.scaled = [to_scaled(g) for g in self.growth]
+        self.scaled_default = to_scaled(self.default_growth)
+        self.float_before = float(before)
+        self.scaled_before = to_scaled(self.before_growth)
+
+
+def _derived(inflation: Decimal, real_wage: Decimal, i_pillar: Decimal, ii_pillar: Decimal) -> tuple[Decimal, ...]:
+    """Rates of all SERIES (in order) from the four base rates of one year."""
+    return (
+        inflation,
+        real_wage,
+        inflation + real_wage,
+        i_pillar,
+        ii_pillar,
+        (ONE + i_pillar) / (ONE + inflation) - ONE,
+        (ONE + ii_pillar) / (ONE + inflation) - ONE,
+    )
+
+
+def to_scaled(value: Decimal) -> int:
+    """Decimal → integer in units of 1 / RATE_SCALE (half-even)."""
+    return int((value * RATE_SCALE).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+class MacroRateTables:
+    """
+    Year-indexed macro rates built once from MacroeconomicFactors (and shared between
+    models through rate_tables_registry — treat as read-only).
+
+    Inside the historical span every rate is a list lookup at `year - first_year`;
+    outside it a constant rate applies, chosen per side by the extrapolation policies of
+    the MacroDataTable. prefix(series, year) is the cumulative growth from `first_year`
+    to `year`, so the factor between any two years is a single division of two prefix
+    values (constant rates are extrapolated with an integer power).
+    scaled_factors() serves those factors relative to a base year as integer arrays
+    (for the 'fixed' engine), cached per (series, base year, direction).
+    """
+
+    def __init__(self, factors: MacroeconomicFactors):
+        data = factors.macro_data
+        self.version = data.version
+        self.first_year = data.first_year
+        self.size = data.size
+
+        defaults = (
+            factors.inflation_rate,
+            factors.real_wage_growth_rate,
+            factors.i_pillar_indexation_rate,
+            factors.ii_pillar_indexation_rate,
+        )
+        rows = [_derived(*base) for base in zip(*(data.columns[name] for name in MACRO_COLUMNS))]
+        columns = list(zip(*rows)) if rows else [() for _ in SERIES]
+        after = _derived(*data.extrapolated(data.extrapolate_after, "after", defaults))
+        before = _derived(*data.extrapolated(data.extrapolate_before, "before", defaults))
+        self.series = {
+            name: _Series(list(columns[i]), after[i], before[i]) for i, name in enumerate(SERIES)
+        }
+        self._scaled_factors: dict[tuple[str, int, bool], np.ndarray] = {}
+
+    def rate(self, series: str, year: int) -> Decimal:
+        s = self.series[series]
+        idx = year - self.first_year
+        if 0 <= idx < self.size:
+            return s.rates[idx]
+        return s.before if idx < 0 else s.default
+
+    def growth(self, series: str, year: int) -> Decimal:
+        """1 + rate(series, year)."""
+        s = self.series[series]
+        idx = year - self.first_year
+        if 0 <= idx < self.size:
+            return s.growth[idx]
+        return s.before_growth if idx < 0 else s.default_growth
+
+    def scaled_growth(self, series: str, year: int) -> int:
+        """1 + rate(series, year) as an integer in units of 1 / RATE_SCALE."""
+        s = self.series[series]
+        idx = year - self.first_year
+        if 0 <= idx < self.size:
+            return s.scaled[idx]
+        return s.scaled_before if idx < 0 else s.scaled_default
+
+    def prefix(self, series: str, year: int) -> Decimal:
+        s = self.series[series]
+        idx = year - self.first_year
+        if idx < 0:
+            return s.before_growth ** idx
+        if idx <= self.size:
+            return s.prefix[idx]
+        return s.prefix[self.size] * s.default_growth ** (idx - self.size)
+
+    def factor(self, series: str, from_year: int, to_year: int) -> Decimal:
+        """Cumulative growth from `from_year` to `to_year` (an inverse when to_year < from_year)."""
+        if from_year == to_year:
+            return ONE
+        return self.prefix(series, to_year) / self.prefix(series, from_year)
+
+    def scaled_factors(self, series: str, base_year: int, start: int, stop: int, to_base: bool = False) -> np.ndarray:
+        """
+        factor(base_year, year) — or factor(year, base_year) with to_base=True — for years
+        [start, stop) in units of 1 / RATE_SCALE: each rounded once (half-even) from the
+        Decimal prefix products. int64, or object dtype if a value does not fit.
+        """
+        key = (series, base_year, to_base)
+        window = self._scaled_factors.get(key)
+        if window is None:
+            years = range(base_year - SCALED_FACTOR_WINDOW, base_year + SCALED_FACTOR_WINDOW + 1)
+            window = self._scaled_window(series, base_year, years, to_base)
+            window.flags.writeable = False
+            self._scaled_factors[key] = window
+        lo = start - base_year + SCALED_FACTOR_WINDOW
+        hi = stop - base_year + SCALED_FACTOR_WINDOW
+        if 0 <= lo and hi <= window.size:
+            return window[lo:hi]
+        return self._scaled_window(series, base_year, range(start, stop), to_base)
+
+    def _scaled_window(self, series: str, base_year: int, years: range, to_base: bool) -> np.ndarray:
+        if to_base:
+            values = [to_scaled(self.factor(series, year, base_year)) for year in years]
+        else:
+            values = [to_scaled(self.factor(series, base_year, year)) for year in years]
+        # numpy wybiera int64, a dla wartości spoza zakresu — dtype object (int Pythona)
+        return np.array(values) if values else np.zeros(0, dtype=np.int64)
+
+    def float_rates(self, series: str, start: int, stop: int) -> np.ndarray:
+        """float64 rates for years [start, stop)."""
+        s = self.series[series]
+        out = np.full(max(0, stop - start), s.float_default)
+        if start < self.first_year:
+            out[:min(stop, self.first_year) - start] = s.float_before
+        lo = max(start, self.first_year)
+        hi = min(stop, self.first_year + self.size)
+        if lo < hi:
+            out[lo - start:hi - start] = s.floats[lo - self.first_year:hi - self.first_year]
+        return out
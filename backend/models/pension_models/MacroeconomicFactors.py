@@ -1,15 +1,19 @@
 from decimal import Decimal
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
-from backend.models.data.poland_historical_macro_data import poland_macro_data
+from backend.models.data.data_registry import data_registry
+from backend.models.pension_models.MacroDataTable import MacroDataTable
 
 
 class MacroeconomicFactors(BaseModel):
     """Macroeconomic assumptions for pension calculations"""
 
-    historical_data: dict[str, tuple[Decimal, Decimal, Decimal, Decimal]] = Field(
-        default=poland_macro_data
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    macro_data: MacroDataTable = Field(
+        default_factory=lambda: data_registry.current().macro,
+        description="Historical yearly rates (current data registry version); outside its range per its extrapolation policies",
     )
 
     inflation_rate: Decimal = Field(
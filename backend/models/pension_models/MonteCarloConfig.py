@@ -0,0 +1,27 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class MonteCarloConfig(BaseModel):
+    """Stochastic macro scenario settings (AR(1) on inflation and real wage growth)"""
+
+    n_paths: int = Field(default=1000, ge=1, description="Number of simulated macro paths")
+    seed: Optional[int] = Field(default=None, description="RNG seed (None = non-deterministic)")
+    chunk_size: int = Field(
+        default=2000, ge=1, description="Paths evaluated per chunk (bounds the temporary work arrays)"
+    )
+
+    # None → calibrated on the historical table
+    inflation_phi: Optional[float] = Field(default=None, description="AR(1) persistence of inflation")
+    inflation_sigma: Optional[float] = Field(default=None, description="AR(1) shock std of inflation")
+    real_wage_phi: Optional[float] = Field(default=None, description="AR(1) persistence of real wage growth")
+    real_wage_sigma: Optional[float] = Field(default=None, description="AR(1) shock std of real wage growth")
+    shock_correlation: Optional[float] = Field(
+        default=None, ge=-1, le=1, description="Correlation of inflation and real wage shocks"
+    )
+
+    ii_pillar_pass_through: float = Field(
+        default=0.75, description="Share of the wage-growth shock passed to II filar indexation"
+    )
+    percentiles: tuple[float, ...] = Field(default=(10, 50, 90), description="Reported percentiles")
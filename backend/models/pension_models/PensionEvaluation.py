@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class PensionEvaluation:
+    """
+    Immutable result of a single PensionModel evaluation pass.
+
+    Values are Decimals for the 'decimal' and 'fixed' engines and floats for the vectorized one.
+    The float64 engines also keep the timeline as columns (arrays keyed like the points).
+    """
+
+    breakdown: Mapping[str, Any]
+    replacement_rate_nominal: Decimal | float
+    replacement_rate_real: Decimal | float
+    timeline: tuple[Mapping[str, Any], ...]
+    columns: Optional[Mapping[str, np.ndarray]] = None
+
+    @classmethod
+    def build(
+        cls,
+        breakdown: dict,
+        replacement_rate_nominal: Decimal | float,
+        replacement_rate_real: Decimal | float,
+        timeline: list[dict],
+        columns: Optional[dict[str, np.ndarray]] = None,
+    ) -> "PensionEvaluation":
+        if columns is not None:
+            for column in columns.values():
+                column.flags.writeable = False
+            columns = MappingProxyType(columns)
+        return cls(
+            breakdown=MappingProxyType(breakdown),
+            replacement_rate_nominal=replacement_rate_nominal,
+            replacement_rate_real=replacement_rate_real,
+            timeline=tuple(MappingProxyType(point) for point in timeline),
+            columns=columns,
+        )
+
+    def timeline_columns(self) -> Mapping[str, np.ndarray]:
+        """Timeline as columns: the engine's arrays when available, else float64 arrays built from the points."""
+        if self.columns is not None:
+            return self.columns
+        keys = tuple(self.timeline[0]) if self.timeline else ("year",)
+        return {
+            key: np.fromiter(
+                (point[key] for point in self.timeline),
+                dtype=np.int64 if key in ("year", "month") else np.float64,
+                count=len(self.timeline),
+            )
+            for key in keys
+        }
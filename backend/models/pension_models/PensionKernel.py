@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Literal, Optional
+
+from backend.models.nonfunctional_periods.compile_multipliers import ContributionMultipliers
+from backend.models.pension_models.LifeExpectancyTable import (
+    LifeExpectancyTable,
+    life_expectancy_months,
+    life_expectancy_years,
+)
+from backend.models.pension_models.MacroRateTables import MacroRateTables
+
+if TYPE_CHECKING:
+    from backend.models.PensionModel import PensionModel
+
+__all__ = ["PensionKernel", "life_expectancy_months", "life_expectancy_years"]
+
+
+@dataclass(frozen=True, slots=True)
+class PensionKernel:
+    """
+    Immutable, validation-free snapshot of a PensionModel for the calculation engines.
+
+    Built once from the validated model: derived values (retirement year, birth year,
+    life expectancy, ZUS rates) are plain attributes, and the rate tables and compiled
+    event multipliers are shared with the model's caches, so per-year loops do no
+    pydantic attribute handling or allocations.
+    """
+
+    current_age: int
+    current_year: int
+    current_salary: Decimal
+    alpha: float
+    beta: float
+    years_of_experience: int
+    is_male: bool
+
+    effective_retirement_age: int
+    years_to_standard_retirement: int
+    work_start_year: int
+    retirement_year: int
+    birth_year: int
+    life_expectancy_months: Decimal
+
+    accumulated_i_pillar_capital: Decimal
+    accumulated_ii_pillar_capital: Decimal
+    i_pillar_rate: Decimal
+    ii_pillar_rate: Decimal
+
+    rate_tables: MacroRateTables
+    contribution_multipliers: ContributionMultipliers
+    monthly_contribution_multipliers: Optional[ContributionMultipliers]
+    timeline_granularity: Literal["year", "month"]
+    life_table: Optional[LifeExpectancyTable] = None
+
+    @classmethod
+    def from_model(cls, model: "PensionModel") -> "PensionKernel":
+        retirement_age = model.effective_retirement_age
+        years_to_retirement = max(0, retirement_age - model.current_age)
+        return cls(
+            current_age=model.current_age,
+            current_year=model.current_year,
+            current_salary=model.current_salary,
+            alpha=model.alpha,
+            beta=model.beta,
+            years_of_experience=model.years_of_experience,
+            is_male=model.is_male,
+            effective_retirement_age=retirement_age,
+            years_to_standard_retirement=years_to_retirement,
+            work_start_year=model.current_year - model.years_of_experience,
+            retirement_year=model.current_year + years_to_retirement,
+            birth_year=model.current_year - model.current_age,
+            life_expectancy_months=life_expectancy_months(
+                retirement_age,
+                model.is_male,
+                model.current_year + years_to_retirement,
+                model.life_expectancy_table,
+            ),
+            accumulated_i_pillar_capital=model.accumulated_i_pillar_capital or Decimal("0"),
+            accumulated_ii_pillar_capital=model.accumulated_ii_pillar_capital or Decimal("0"),
+            i_pillar_rate=model.zus_contribution_rate.i_pillar_rate,
+            ii_pillar_rate=model.zus_contribution_rate.ii_pillar_rate,
+            rate_tables=model.rate_tables,
+            contribution_multipliers=model.contribution_multipliers,
+            monthly_contribution_multipliers=(
+                model.monthly_contribution_multipliers if model.resolution == "month" else None
+            ),
+            timeline_granularity=model.timeline_granularity,
+            life_table=model.life_expectancy_table,
+        )
+
+    def life_expectancy_months_for_age(self, retirement_age: int) -> Decimal:
+        retirement_year = self.current_year + max(0, retirement_age - self.current_age)
+        return life_expectancy_months(retirement_age, self.is_male, retirement_year, self.life_table)
@@ -0,0 +1,86 @@
+"""
+Process-wide registry of MacroRateTables, interned by the content of MacroeconomicFactors.
+
+Every request builds its own MacroeconomicFactors, but almost all of them carry the same
+historical table and defaults; the registry hands out one shared (read-only) table per
+distinct content, bounded by an LRU policy. Hit / miss counters are kept for monitoring.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
+from backend.models.pension_models.MacroRateTables import MacroRateTables
+
+RATE_TABLES_REGISTRY_SIZE = 32
+
+
+def macro_factors_key(factors: MacroeconomicFactors) -> str:
+    """SHA-256 of the canonical content (defaults + digest of the macro data table)."""
+    digest = hashlib.sha256()
+    digest.update(
+        repr((
+            factors.inflation_rate,
+            factors.real_wage_growth_rate,
+            factors.i_pillar_indexation_rate,
+            factors.ii_pillar_indexation_rate,
+        )).encode()
+    )
+    digest.update(f"|{factors.macro_data.digest}".encode())
+    return digest.hexdigest()
+
+
+class RateTablesRegistry:
+    def __init__(self, maxsize: int = RATE_TABLES_REGISTRY_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._tables: OrderedDict[str, MacroRateTables] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, factors: MacroeconomicFactors) -> MacroRateTables:
+        key = macro_factors_key(factors)
+        with self._lock:
+            tables = self._tables.get(key)
+            if tables is not None:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return tables
+            self.misses += 1
+
+        # budowa poza lockiem; przy wyścigu wygrywa pierwsza wstawiona tablica
+        tables = MacroRateTables(factors)
+        with self._lock:
+            existing = self._tables.get(key)
+            if existing is not None:
+                return existing
+            self._tables[key] = tables
+            if len(self._tables) > self.maxsize:
+                self._tables.popitem(last=False)
+                self.evicted += 1
+        return tables
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evicted": self.evicted,
+                "size": len(self._tables),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evicted = 0
+
+
+rate_tables_registry = RateTablesRegistry()
+
+
+def get_rate_tables(factors: MacroeconomicFactors) -> MacroRateTables:
+    return rate_tables_registry.get(factors)
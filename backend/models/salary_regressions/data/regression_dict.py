@@ -1,252 +0,0 @@
-regression_dict = {
-    "IT - Software Developer Frontend": ("1.751254898549736", "0.12872950707152356"),
-    "IT - Software Developer Backend": ("1.7279040278729318", "0.12418204641904851"),
-    "IT - Data Scientist": ("1.8254088129255126", "0.06934300759916569"),
-    "IT - DevOps Engineer": ("2.5855420216375804", "0.17199538398361797"),
-    "IT - IT Architect": ("1.3649098775594852", "0.0774605212338488"),
-    "IT - Network Engineer": ("5.2421872120254145", "0.0352405964956498"),
-    "IT - QA Engineer": ("2.1670242736982344", "0.07621280889931722"),
-    "IT - Product Manager": ("4.118756249690608", "0.04888268350547002"),
-    "IT - Project Manager": ("3.5059542088010995", "0.051447248830366436"),
-    "Healthcare - Doctor General": ("1.8020304649573802", "0.07970787028578404"),
-    "Healthcare - Doctor Specialist": ("1.9158762525649755", "0.08163826784896845"),
-    "Healthcare - Doctor Surgeon": ("2.351562541506417", "0.06881870950717799"),
-    "Healthcare - Doctor Private Practice": (
-        "3.8756452943329296",
-        "0.05352420954170123",
-    ),
-    "Healthcare - Nurse Registered": ("2.234163168945446", "0.09302867563527377"),
-    "Healthcare - Nurse Master's Degree": ("2.2339274795368995", "0.09304111510341975"),
-    "Healthcare - Dentist": ("2.155354299913744", "0.07094326888049164"),
-    "Healthcare - Dentist Private Practice": (
-        "2.721854421063174",
-        "0.06983762336824012",
-    ),
-    "Healthcare - Pharmacist": ("2.1267023441467323", "0.061195442910778296"),
-    "Healthcare - Medical Specialist": ("2.381622624653661", "0.06983762305603856"),
-    "Healthcare - Hospital Administrator": ("2.2338452295273914", "0.0711420951181205"),
-    "Research - Research Scientist": ("2.0182744968748585", "0.09207528268645604"),
-    "Research - University Professor": ("6.313510644487292", "0.028858921072199818"),
-    "Research - Post-Doctoral Researcher": (
-        "1.5288040266993392",
-        "0.08266564150474266",
-    ),
-    "Finance - CFO/Finance Director": ("4.344339525938616", "0.026982127379894347"),
-    "Finance - Financial Director": ("2.6141250037606008", "0.040478363125901425"),
-    "Finance - Financial Manager": ("5.770043583572511", "0.015964999758490413"),
-    "Finance - Financial Analyst": ("0.7299213524753375", "0.2033042898306786"),
-    "Finance - Junior Financial Analyst": ("0.5554973759898115", "0.11266655991821445"),
-    "Finance - Chief Actuary": ("1.273156342219858", "0.06344164345258305"),
-    "Finance - Risk Manager": ("1.8592865499656412", "0.12599101556091943"),
-    "Finance - Investment Banking Analyst": (
-        "0.5705055738927474",
-        "0.14989682795648046",
-    ),
-    "Finance - Private Banker": ("1.5693335089041822", "0.15060573711835676"),
-    "Finance - Senior Accountant": ("0.5625182211712699", "0.10386346397448679"),
-    "Finance - Accountant": ("0.7351498331936733", "0.11928986797778843"),
-    "Finance - Junior Accountant": ("0.8001320939437765", "0.07621279961423896"),
-    "Banking - Personal Banker": ("2.9270287111872193", "0.06471469364228255"),
-    "Banking - Account Manager": ("2.7458375032265936", "0.04888268341789898"),
-    "Banking - Bank Branch Manager": ("1.8030817854131183", "0.08460596538233163"),
-    "Legal - Lawyer Private Practice": ("2.076649612358944", "0.05583331853952104"),
-    "Legal - Corporate In-House Counsel": ("0.8774891821923354", "0.13479077620800953"),
-    "Legal - Judge": ("1.825001127023011", "0.07004555282655185"),
-    "Legal - Magistrate Judge": ("1.3868956787760924", "0.0762127947707496"),
-    "Legal - Legal Counsel Entry": ("1.5602575764584161", "0.07621280020384108"),
-    "Legal - Notary Public": ("2.409587893261212", "0.04224031659822074"),
-    "Engineering - Mechanical Engineer": ("1.6303417861747496", "0.09522193752858396"),
-    "Engineering - Electrical Engineer": ("1.6303417861747496", "0.09522193752858396"),
-    "Engineering - Civil Engineer": ("1.9494249951451212", "0.08609047477065349"),
-    "Engineering - Chemical Engineer": ("1.586679395021636", "0.09902019122619195"),
-    "Engineering - Aerospace Engineer": ("2.974057683058117", "0.06875565756680906"),
-    "Engineering - Industrial Engineer": ("1.7982366612251337", "0.09902018970024998"),
-    "Engineering - Quality Engineer": ("1.8632477629265587", "0.09522193677402761"),
-    "Manufacturing - Factory Worker": ("0.5200859619189566", "0.07621277311318078"),
-    "Manufacturing - Manufacturing Engineer": (
-        "1.3711381576795791",
-        "0.10386346505760505",
-    ),
-    "Manufacturing - Plant Manager": ("2.637402783071859", "0.07098563401406968"),
-    "Manufacturing - Production Supervisor": (
-        "2.1267023441467323",
-        "0.061195442910778296",
-    ),
-    "Manufacturing - Quality Control Inspector": (
-        "2.0573993373244135",
-        "0.057375491075748845",
-    ),
-    "Construction - Construction Worker": ("0.6277333654549921", "0.1506057633812488"),
-    "Construction - Construction Foreman": (
-        "0.7876606241021868",
-        "0.11928983597100846",
-    ),
-    "Construction - Architect": ("0.9189373029418659", "0.11928986439541221"),
-    "Construction - Structural Engineer": ("1.4985305362821697", "0.09902019170498354"),
-    "Energy - Power Plant Operator": ("0.7999567256290337", "0.12622789065725679"),
-    "Energy - Energy Engineer": ("1.3315112600028114", "0.10862654709513016"),
-    "Energy - Renewable Energy Specialist": ("1.079587903739488", "0.1369264102469854"),
-    "Education - Primary Teacher": ("1.617709996501521", "0.28430785849931506"),
-    "Education - Secondary Teacher": ("1.6248143768839005", "0.2851430335835371"),
-    "Education - University Assistant Professor": (
-        "2.5508981062549805",
-        "0.04603771359378632",
-    ),
-    "Education - University Professor": ("2.0685082861674324", "0.08447406252268583"),
-    "Education - School Principal Small": ("0.8001320939437765", "0.07621279961423896"),
-    "Education - School Principal Large": ("0.7984764281003669", "0.10650652934529416"),
-    "Education - Education Administrator": (
-        "1.5288040266993392",
-        "0.08266564150474266",
-    ),
-    "Civil Service - Entry Administrative": (
-        "1.5018581335785408",
-        "0.10223099664021881",
-    ),
-    "Civil Service - Mid-Level Specialist": (
-        "1.7836048856495372",
-        "0.08266562525769472",
-    ),
-    "Civil Service - Ministry Worker Entry": (
-        "1.6227736056860116",
-        "0.08460596549253428",
-    ),
-    "Civil Service - Ministry Senior Specialist": (
-        "1.6617326931983076",
-        "0.08145369981515205",
-    ),
-    "Retail - Cashier": ("0.4280713280728382", "0.10691270953423777"),
-    "Retail - Sales Associate": ("0.4971287374540551", "0.13460366349325434"),
-    "Retail - Store Manager": ("1.7836048856495372", "0.08266562525769472"),
-    "Retail - Retail Buyer": ("1.8991230891515616", "0.0814536989169839"),
-    "Sales - Sales Representative Base": (
-        "11.655166274930119",
-        "0.0042150080672115385",
-    ),
-    "Sales - Sales Representative Total": (
-        "1.8431420593818426",
-        "0.061195441443702814",
-    ),
-    "Sales - Account Manager": ("1.4268837941427128", "0.08266563765167102"),
-    "Hospitality - Restaurant Server Base": (
-        "1.5341080363394637",
-        "0.027536336117551026",
-    ),
-    "Hospitality - Restaurant Server with Tips": (
-        "1.1239777999878275",
-        "0.07322911321384049",
-    ),
-    "Hospitality - Bartender": ("1.7806939374054307", "0.05093792103089986"),
-    "Hospitality - Chef Commis": ("0.5778732522162183", "0.07621278230574198"),
-    "Hospitality - Chef de Partie": ("0.9456107064567463", "0.07621279238568934"),
-    "Hospitality - Sous Chef": ("1.1144697775471495", "0.07621279039821313"),
-    "Hospitality - Head Chef": ("0.8871959489582503", "0.10650655107002836"),
-    "Hospitality - Hotel Manager": ("3.225972865396281", "0.06534174064494203"),
-    "Hospitality - Hotel Front Desk": ("0.8777802343117139", "0.07515297544178291"),
-    "Tourism - Travel Agent": ("3.01525371108394", "0.026423642147023713"),
-    "Tourism - Tourism Manager": ("2.858216878008221", "0.0749960944103231"),
-    "Transportation - Truck Driver Domestic": (
-        "0.7429798637944459",
-        "0.07621278815034276",
-    ),
-    "Transportation - Truck Driver International": (
-        "0.7733235102980986",
-        "0.09032259960033469",
-    ),
-    "Transportation - Taxi Driver": ("1.300214711084914", "0.07621279347343968"),
-    "Transportation - Train Driver": ("1.5087595136875032", "0.05737549109573387"),
-    "Logistics - Warehouse Worker": ("0.6962758577985211", "0.06555876428059867"),
-    "Logistics - Forklift Operator": ("0.7181838284507994", "0.07515297535178828"),
-    "Logistics - Logistics Specialist": ("1.6165280528501265", "0.05737549096371748"),
-    "Logistics - Supply Chain Planner": ("1.7340696732824727", "0.06741161242724655"),
-    "Agriculture - Farm Worker Seasonal": (
-        "0.31224270236060636",
-        "0.07988118648567177",
-    ),
-    "Agriculture - Farm Worker Permanent": (
-        "0.5778732522162183",
-        "0.07621278230574198",
-    ),
-    "Agriculture - Farmer Small": ("2.0906365825447035", "0.0691150631375326"),
-    "Agriculture - Farmer Commercial": ("6.706728422049664", "0.037461165820520954"),
-    "Agriculture - Agricultural Specialist": (
-        "1.6992694472237984",
-        "0.07402398841596929",
-    ),
-    "Agriculture - Agricultural Engineer": (
-        "0.9331887843940798",
-        "0.08966410651154835",
-    ),
-    "Agriculture - Farm Manager": ("2.0114924187112275", "0.08264346045878639"),
-    "Agriculture - Veterinarian": ("1.9193992739198658", "0.0746550511743458"),
-    "Real Estate - Real Estate Agent": ("1.7811913095089094", "0.060686091349882405"),
-    "Real Estate - Real Estate Agent Top Performer": (
-        "4.451734857806365",
-        "0.050937920789223746",
-    ),
-    "Real Estate - Property Manager": ("1.6617326931983076", "0.08145369981515205"),
-    "Arts Media - Journalist": ("1.273584430537451", "0.10834416009605602"),
-    "Arts Media - Journalist Financial": ("2.3120929059937363", "0.06741161202233849"),
-    "Arts Media - Graphic Designer Junior": (
-        "2.672014675789756",
-        "0.03130301830956671",
-    ),
-    "Arts Media - Graphic Designer Senior": (
-        "2.3710574617528652",
-        "0.05332558276184962",
-    ),
-    "Arts Media - UX/UI Designer": ("2.6687052453708495", "0.05946363503355417"),
-    "Arts Media - Photographer": ("1.8510194317025186", "0.0728960932491333"),
-    "Arts Media - Photographer Commercial": (
-        "2.774511454502362",
-        "0.06741161334854673",
-    ),
-    "Arts Media - Actor": ("2.014344126420909", "0.07763291057726683"),
-    "Arts Media - Musician": ("1.7178088820488049", "0.07686854640942034"),
-    "Arts Media - Orchestra Musician": ("1.1199390800718882", "0.12622798461578888"),
-    "Arts Media - Video Editor": ("1.5035830875677738", "0.0683951945689094"),
-    "Arts Media - Media Producer": ("2.8249637097320077", "0.027626444482744948"),
-    "Arts Media - Content Creator": ("6.68003669457651", "0.031303018280535666"),
-    "Arts Media - Marketing Specialist": ("3.04851275173389", "0.037461168592165583"),
-    "Arts Media - Social Media Manager": ("2.891505214687115", "0.04224032176297048"),
-    "Consulting - IT Consultant": ("1.33816456346159", "0.11832503937181633"),
-    "Consulting - Management Consultant": (
-        "53.47852685205716",
-        "0.0019164717196518577",
-    ),
-    "Consulting - Business Consultant": ("1.8825530784534301", "0.044845013721584025"),
-    "Consulting - SAP Consultant": ("2.0550231435820545", "0.08757977933728336"),
-    "Consulting - Project Manager Junior": (
-        "1.6493210461514662",
-        "0.04594656516148835",
-    ),
-    "Other - HR Specialist": ("1.8859493944582415", "0.057375490986497794"),
-    "Other - HR Manager": ("2.384869362743877", "0.06389588829936854"),
-    "Other - Recruiter": ("2.0573993373244135", "0.057375491075748845"),
-    "Other - Administrative Assistant": ("1.2111391753248089", "0.05352420814241465"),
-    "Other - Executive Assistant": ("1.9747950517512431", "0.06119544202649465"),
-    "Other - Customer Service Representative": (
-        "0.8777802343117139",
-        "0.07515297544178291",
-    ),
-    "Other - Call Center Agent": ("0.688097651956302", "0.06800073192023867"),
-    "Other - Security Guard": ("0.5417561964021358", "0.07621277663215416"),
-    "Other - Cleaner": ("0.3444132977173831", "0.09211071906037356"),
-    "Other - Translator": ("3.9646732253794315", "0.025052477542449884"),
-    "Other - Interpreter": ("2.543848431035674", "0.05093792254473962"),
-    "Other - Librarian": ("1.7806939374054307", "0.05093792103089986"),
-    "Other - Social Worker": ("1.6188126458883698", "0.050937922178538236"),
-    "Other - Psychologist": ("2.1267023441467323", "0.061195442910778296"),
-    "Other - Physiotherapist": ("1.8859493944582415", "0.057375490986497794"),
-    "Other - Occupational Therapist": ("1.7306247386602545", "0.06311381066566442"),
-    "Other - Speech Therapist": ("1.6550975171152886", "0.06228516467497672"),
-    "Other - Dental Hygienist": ("1.4562225426915232", "0.07435602357801095"),
-    "Other - Medical Laboratory Technician": (
-        "1.5507318746785836",
-        "0.07223513765828524",
-    ),
-    "Other - Radiologic Technician": ("1.673055776713516", "0.06717196351750047"),
-    "Other - Paramedic": ("1.6550975171152886", "0.06228516467497672"),
-    "Other - Firefighter": ("1.8859493944582415", "0.057375490986497794"),
-    "Other - Police Officer": ("1.7408763664799052", "0.05737549086798737"),
-}
@@ -0,0 +1,16 @@
+import os
+
+os.environ.setdefault("GEMINI_API_KEY", "test")  # settings wymagają klucza; testy nie wołają LLM
+
+import pytest
+
+from backend.models.data.data_registry import data_registry
+
+
+@pytest.fixture
+def restore_data_registry():
+    """Przywraca domyślne pliki danych rejestru po teście, który je podmienia."""
+    paths = (data_registry.macro_path, data_registry.regression_path, data_registry.life_expectancy_path)
+    yield data_registry
+    data_registry.macro_path, data_registry.regression_path, data_registry.life_expectancy_path = paths
+    data_registry.reload(force=True)
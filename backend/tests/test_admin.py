@@ -0,0 +1,28 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.config import settings
+
+RELOAD_URL = "/api/v1/admin/data/reload"
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_admin_routes_disabled_without_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "")
+    assert client.post(RELOAD_URL).status_code == 404
+    assert client.post(RELOAD_URL, headers={"X-Admin-Token": ""}).status_code == 404
+
+
+def test_reload_requires_admin_token(client, monkeypatch, restore_data_registry):
+    monkeypatch.setattr(settings, "admin_token", "s3cret")
+    assert client.post(RELOAD_URL).status_code == 403
+    assert client.post(RELOAD_URL, headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    response = client.post(RELOAD_URL, headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert "swapped" in response.json()
@@ -0,0 +1,100 @@
+import dataclasses
+from decimal import Decimal
+from types import MappingProxyType
+
+import numpy as np
+import pytest
+
+from backend.models.PensionModel import PensionModel
+from backend.models.calculate_pension import cohort
+from backend.models.calculate_pension.cohort import MEASURES, CohortAggregates, simulate_cohort
+from backend.models.calculate_pension.vectorized_engine import NUMPY_ENGINE_RTOL
+from backend.models.data.data_registry import data_registry
+from backend.models.pension_models.CohortConfig import CohortConfig
+from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
+from backend.models.pension_models.rate_tables_registry import get_rate_tables
+
+CURRENT_YEAR = 2025
+CATALOGUE = {"kierowca": ("0.8", "0.05"), "programista": ("1.2", "0.1"), "nauczyciel": ("1.0", "0.12")}
+
+
+def _run(monkeypatch, config: CohortConfig):
+    """Symulacja na małym katalogu; zwraca końcowe agregaty i wszystkich wylosowanych pracowników."""
+    data = dataclasses.replace(data_registry.current(), regressions=MappingProxyType(CATALOGUE), life_table=None)
+    workers = []
+    evaluate_chunk = cohort._evaluate_chunk
+    update = CohortAggregates.update
+
+    def recording_evaluate(grid, current_year, curves, age, experience, salary, *args):
+        values = evaluate_chunk(grid, current_year, curves, age, experience, salary, *args)
+        workers.append({"age": age, "experience": experience, "salary": salary, **values})
+        return values
+
+    def recording_update(self, category, is_male, values):
+        workers[-1].update(category=category, is_male=is_male)
+        return update(self, category, is_male, values)
+
+    monkeypatch.setattr(cohort, "_evaluate_chunk", recording_evaluate)
+    monkeypatch.setattr(CohortAggregates, "update", recording_update)
+    tables = get_rate_tables(MacroeconomicFactors(macro_data=data.macro))
+    chunks = list(simulate_cohort(config, tables, CURRENT_YEAR, data=data))
+    merged = {key: np.concatenate([chunk[key] for chunk in workers]) for key in workers[0]}
+    return chunks, merged
+
+
+def test_streamed_aggregates_match_direct_computation(monkeypatch):
+    config = CohortConfig(n_workers=2_500, chunk_size=700, seed=11)
+    chunks, workers = _run(monkeypatch, config)
+    # jeden obiekt aktualizowany po każdym kawałku
+    assert len(chunks) == 4 and all(chunk is chunks[-1] for chunk in chunks)
+    aggregates = chunks[-1]
+    summary = aggregates.summary()
+    assert summary["workers"] == config.n_workers == workers["age"].size
+
+    names = list(CATALOGUE)
+    sexes = {"female": ~workers["is_male"], "male": workers["is_male"]}
+    for measure in MEASURES:
+        values = workers[measure]
+        groups = {"overall": (summary["overall"], np.ones(values.size, bool))}
+        groups.update({sex: (summary["by_sex"][sex], mask) for sex, mask in sexes.items()})
+        for i, name in enumerate(names):
+            in_category = workers["category"] == i
+            groups[name] = (summary["by_category"][name]["all"], in_category)
+            for sex, mask in sexes.items():
+                groups[f"{name}/{sex}"] = (summary["by_category"][name][sex], in_category & mask)
+
+        width = aggregates.edges[measure][1] - aggregates.edges[measure][0]
+        for label, (group, mask) in groups.items():
+            stats, x = group[measure], values[mask]
+            assert stats["count"] == x.size, label
+            assert stats["mean"] == pytest.approx(x.mean(), rel=1e-9), label
+            assert stats["std"] == pytest.approx(x.std(), rel=1e-6), label
+            for q in config.percentiles:
+                # dokładność do szerokości przedziału; w luce między obserwacjami każdy punkt jest kwantylem
+                lower, higher = np.percentile(x, q, method="lower"), np.percentile(x, q, method="higher")
+                assert lower - width <= stats[f"p{q:g}"] <= higher + width, (label, q)
+
+        histogram = summary["histograms"][measure]
+        counts, _ = np.histogram(values, bins=aggregates.edges[measure])
+        assert histogram["counts"] == counts.tolist()
+        assert histogram["below"] + sum(histogram["counts"]) + histogram["above"] == values.size
+
+
+def test_cohort_workers_match_pension_model(monkeypatch):
+    _, workers = _run(monkeypatch, CohortConfig(n_workers=40, chunk_size=16, seed=5))
+    names = list(CATALOGUE)
+    for j in range(0, 40, 7):
+        alpha, beta = CATALOGUE[names[workers["category"][j]]]
+        breakdown = PensionModel(
+            current_age=int(workers["age"][j]),
+            years_of_experience=int(workers["experience"][j]),
+            current_salary=Decimal(repr(float(workers["salary"][j]))),
+            is_male=bool(workers["is_male"][j]),
+            alpha=float(alpha),
+            beta=float(beta),
+            current_year=CURRENT_YEAR,
+            engine="numpy",
+            life_expectancy_table=None,
+        ).evaluate().breakdown
+        for measure in MEASURES:
+            assert workers[measure][j] == pytest.approx(float(breakdown[measure]), rel=NUMPY_ENGINE_RTOL), measure
@@ -0,0 +1,67 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.api.routes.user_profile import COLUMNAR_MEDIA_TYPE
+from backend.api.schemas import TimelineColumns, TimelinePoint
+from backend.api.services import preview_cache
+
+PREVIEW_URL = "/api/v1/user-profile/pension/preview"
+BATCH_URL = "/api/v1/user-profile/pension/preview/batch"
+PAYLOAD = {"current_age": 40, "years_of_experience": 15, "current_monthly_salary": 9000, "alpha": 1.2, "beta": 0.1}
+POINT_FIELDS = tuple(name for name in TimelinePoint.model_fields if name not in ("year", "month"))
+
+
+def _to_points(columns: dict) -> list[dict]:
+    """Kolumny → lista punktów (kształt TimelinePoint)."""
+    parsed = TimelineColumns.model_validate(columns)
+    months = parsed.months or [None] * len(parsed.years)
+    return [
+        {"year": year, "month": month, **{name: getattr(parsed, name)[k] for name in POINT_FIELDS}}
+        for k, (year, month) in enumerate(zip(parsed.years, months))
+    ]
+
+
+@pytest.fixture
+def client():
+    preview_cache.clear()
+    yield TestClient(app)
+    preview_cache.clear()
+
+
+@pytest.mark.parametrize("payload", [
+    PAYLOAD,
+    {**PAYLOAD, "engine": "numpy", "retirement_age": 70},
+    {**PAYLOAD, "engine": "fixed"},
+    {**PAYLOAD, "resolution": "month", "timeline_granularity": "month"},
+])
+def test_columnar_preview_round_trips_to_points(client, payload):
+    points = client.post(PREVIEW_URL, json=payload).json()
+    response = client.post(f"{PREVIEW_URL}?timeline_format=columnar", json=payload)
+    assert response.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+    columnar = response.json()
+
+    assert _to_points(columnar["timeline"]) == points["timeline"]
+    # reszta odpowiedzi bez zmian
+    assert {k: v for k, v in columnar.items() if k != "timeline"} == {
+        k: v for k, v in points.items() if k != "timeline"
+    }
+
+
+def test_accept_header_selects_columnar(client):
+    by_header = client.post(PREVIEW_URL, json=PAYLOAD, headers={"Accept": COLUMNAR_MEDIA_TYPE})
+    by_query = client.post(f"{PREVIEW_URL}?timeline_format=columnar", json=PAYLOAD)
+    assert by_header.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+    assert by_header.json() == by_query.json()
+    assert isinstance(by_header.json()["timeline"]["years"], list)
+    # jawny parametr ma pierwszeństwo przed nagłówkiem
+    points = client.post(f"{PREVIEW_URL}?timeline_format=points", json=PAYLOAD, headers={"Accept": COLUMNAR_MEDIA_TYPE})
+    assert isinstance(points.json()["timeline"], list)
+
+
+def test_columnar_batch_round_trips_to_points(client):
+    payload = [PAYLOAD, {**PAYLOAD, "current_age": 30, "retirement_age": 67}]
+    points = client.post(BATCH_URL, json=payload).json()["items"]
+    columnar = client.post(f"{BATCH_URL}?timeline_format=columnar", json=payload).json()["items"]
+    for row, cols in zip(points, columnar):
+        assert _to_points(cols["result"]["timeline"]) == row["result"]["timeline"]
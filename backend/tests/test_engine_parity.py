@@ -0,0 +1,299 @@
+"""
+'numpy' and 'fixed' engines against the Decimal reference, over every breakdown and
+timeline key: ages, experience, retirement ages, sexes, events (whole-year and
+fractional multipliers, overlaps, basis_zero) and both resolutions; the breakdown-only
+paths (closed-form tail) against the full year-by-year pass; PensionModel's capital
+helpers against each contribution valorized separately.
+"""
+import itertools
+from dataclasses import replace
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+from backend.models.PensionModel import PensionModel
+from backend.models.calculate_pension.closed_form import tail_start
+from backend.models.calculate_pension.decimal_engine import decimal_breakdown, decimal_evaluate
+from backend.models.calculate_pension.fixed_point_engine import _mul_round, _scaled_ratios
+from backend.models.calculate_pension.vectorized_engine import NUMPY_ENGINE_RTOL, vectorized_breakdown
+from backend.models.calculate_salary.experience_curve import experience_curve
+from backend.models.nonfunctional_periods.compile_multipliers import ContributionMultipliers
+from backend.models.pension_models.MacroRateTables import RATE_SCALE, to_scaled
+
+CURRENT_YEAR = 2025
+
+PROFILES = [
+    # (current_age, years_of_experience, retirement_age)
+    (22, 0, None),
+    (30, 8, None),
+    (35, 12, 60),
+    (45, 25, 67),
+    (50, 2, 70),
+    (58, 38, None),
+    (63, 44, 65),
+]
+
+EVENTS = {
+    "none": [],
+    "basis_zero": [NonFunctionalEvent(reason="przerwa", start_age=40, end_age=42, basis_zero=True)],
+    "fractional": [
+        NonFunctionalEvent(reason="1/3 etatu", start_age=36, end_age=39, contrib_multiplier=1 / 3),
+        NonFunctionalEvent(reason="prawie pełny", start_age=52, end_age=53, contrib_multiplier=0.999),
+        NonFunctionalEvent(reason="minimalny", start_age=55, end_age=56, contrib_multiplier=0.0001),
+    ],
+    "overlapping": [
+        NonFunctionalEvent(reason="1/2 etatu", start_age=28, end_age=48, contrib_multiplier=0.5),
+        NonFunctionalEvent(reason="1/4 etatu", start_age=33, end_age=37, contrib_multiplier=0.25),
+        NonFunctionalEvent(reason="zagranica", start_age=44, end_age=46, basis_zero=True),
+        NonFunctionalEvent(reason="zero", start_age=60, end_age=61, contrib_multiplier=0.0),
+    ],
+    "past_and_after_retirement": [
+        NonFunctionalEvent(reason="studia", start_age=18, end_age=24, contrib_multiplier=0.3),
+        NonFunctionalEvent(reason="po emeryturze", start_age=68, end_age=75, basis_zero=True),
+    ],
+}
+
+MONTHLY_EVENTS = {
+    "sub_year": [
+        NonFunctionalEvent(reason="L4", start_age=37, start_month=3, end_age=37, end_month=8, contrib_multiplier=0.8),
+        NonFunctionalEvent(reason="urlop", start_age=41, start_month=10, end_age=43, end_month=2, basis_zero=True),
+    ],
+    "fractional_months": [
+        NonFunctionalEvent(reason="1/3 etatu", start_age=30, start_month=7, end_age=35, end_month=1,
+                           contrib_multiplier=1 / 3),
+        NonFunctionalEvent(reason="2/3 etatu", start_age=33, start_month=5, end_age=34, end_month=11,
+                           contrib_multiplier=2 / 3),
+    ],
+}
+
+CASES = [
+    pytest.param(age, exp, retirement_age, is_male, name, id=f"{age}-{exp}-{retirement_age}-{'m' if is_male else 'f'}-{name}")
+    for (age, exp, retirement_age), is_male, name in itertools.product(PROFILES, (True, False), EVENTS)
+]
+
+MONTHLY_CASES = [
+    pytest.param(age, exp, retirement_age, is_male, name, id=f"{age}-{exp}-{retirement_age}-{'m' if is_male else 'f'}-{name}")
+    for (age, exp, retirement_age), is_male, name in itertools.product(
+        PROFILES, (True, False), {**EVENTS, **MONTHLY_EVENTS}
+    )
+]
+
+
+def _model(age: int, exp: int, retirement_age, is_male: bool, events: list, **kw) -> PensionModel:
+    return PensionModel(
+        current_age=age,
+        years_of_experience=exp,
+        current_salary=Decimal("9000"),
+        is_male=is_male,
+        alpha=1.2,
+        beta=0.1,
+        retirement_age=retirement_age,
+        current_year=CURRENT_YEAR,
+        accumulated_i_pillar_capital=Decimal("45000") if exp > 10 else Decimal("0"),
+        accumulated_ii_pillar_capital=Decimal("12000") if exp > 10 else Decimal("0"),
+        non_functional_events=events,
+        **kw,
+    )
+
+
+def _relative_diff(value, expected) -> float:
+    expected = float(expected)
+    return abs(float(value) - expected) / max(abs(expected), 1.0)
+
+
+def _assert_parity(reference, candidate, rtol: float) -> None:
+    assert set(candidate.breakdown) == set(reference.breakdown)
+    for key, expected in reference.breakdown.items():
+        assert _relative_diff(candidate.breakdown[key], expected) <= rtol, key
+    assert [p["year"] for p in candidate.timeline] == [p["year"] for p in reference.timeline]
+    for ref, cand in zip(reference.timeline, candidate.timeline):
+        for key, expected in ref.items():
+            assert _relative_diff(cand[key], expected) <= rtol, (ref["year"], key)
+
+
+def _month_averaged(monthly: ContributionMultipliers) -> ContributionMultipliers:
+    """Yearly multipliers equal to the mean of the months of each year of age (Decimal)."""
+    if not monthly.values:
+        return monthly
+    first_age = monthly.first_age // 12
+    last_age = (monthly.first_age + len(monthly.values) - 1) // 12
+    values = [
+        sum((monthly.for_age(age * 12 + m) for m in range(12)), Decimal(0)) / 12
+        for age in range(first_age, last_age + 1)
+    ]
+    return ContributionMultipliers(first_age, values)
+
+
+def _fixed_tolerance_grosze(model: PensionModel) -> float:
+    """
+    Bound of the 'fixed' engine's rounding against the exact path: per contribution year
+    half a grosz on the salary, the event-adjusted base and the contribution, plus the
+    rounding of the reported balance, each carried to retirement by at most the largest
+    valorization factor.
+    """
+    kernel = model.kernel
+    tables = kernel.rate_tables
+    years = range(kernel.work_start_year, kernel.retirement_year + 1)
+    growth = max(
+        float(tables.factor(series, start, kernel.retirement_year))
+        for series in ("i_pillar", "ii_pillar", "i_pillar_real", "ii_pillar_real")
+        for start in years
+    )
+    return 2.0 * len(years) * max(growth, 1.0) + 2.0
+
+
+@pytest.mark.parametrize("age, exp, retirement_age, is_male, events", CASES)
+def test_numpy_engine_matches_decimal(age, exp, retirement_age, is_male, events):
+    reference = _model(age, exp, retirement_age, is_male, EVENTS[events], engine="decimal").evaluate()
+    candidate = _model(age, exp, retirement_age, is_male, EVENTS[events], engine="numpy").evaluate()
+    _assert_parity(reference, candidate, NUMPY_ENGINE_RTOL)
+
+
+@pytest.mark.parametrize("age, exp, retirement_age, is_male, events", MONTHLY_CASES)
+def test_monthly_resolution_matches_decimal(age, exp, retirement_age, is_male, events):
+    all_events = {**EVENTS, **MONTHLY_EVENTS}[events]
+    model = _model(age, exp, retirement_age, is_male, all_events, engine="numpy", resolution="month")
+    kernel = model.kernel
+    # referencja Decimal: roczny przebieg z mnożnikiem = średnia mnożników miesięcznych roku
+    reference = decimal_evaluate(
+        replace(kernel, contribution_multipliers=_month_averaged(kernel.monthly_contribution_multipliers))
+    )
+    _assert_parity(reference, model.evaluate(), NUMPY_ENGINE_RTOL)
+
+    monthly = _model(
+        age, exp, retirement_age, is_male, all_events,
+        engine="numpy", resolution="month", timeline_granularity="month",
+    ).evaluate()
+    for key, expected in reference.breakdown.items():
+        assert _relative_diff(monthly.breakdown[key], expected) <= NUMPY_ENGINE_RTOL, key
+    # punkty styczniowe osi miesięcznej = salda na początek roku osi rocznej
+    january = [p for p in monthly.timeline if p["month"] == 1]
+    assert [p["year"] for p in january] == [p["year"] for p in reference.timeline]
+    for ref, cand in zip(reference.timeline, january):
+        for key, expected in ref.items():
+            assert _relative_diff(cand[key], expected) <= NUMPY_ENGINE_RTOL, (ref["year"], key)
+
+
+@pytest.mark.parametrize("age, exp, retirement_age, is_male, events", CASES)
+def test_closed_form_breakdown_matches_full_pass(age, exp, retirement_age, is_male, events):
+    model = _model(age, exp, retirement_age, is_male, EVENTS[events], engine="decimal")
+    reference = model.evaluate()
+    summary = decimal_breakdown(model.kernel)
+    assert summary.timeline == ()
+    for key, expected in reference.breakdown.items():
+        # pętla używa krzywej doświadczenia float64, postać zamknięta — Decimal.exp
+        assert _relative_diff(summary.breakdown[key], expected) <= 1e-14, key
+    numpy_summary = vectorized_breakdown(model.kernel)
+    for key, expected in reference.breakdown.items():
+        assert _relative_diff(numpy_summary.breakdown[key], expected) <= NUMPY_ENGINE_RTOL, key
+
+
+def test_closed_form_tail_covers_long_horizons():
+    model = _model(18, 0, 75, False, [], engine="decimal")
+    kernel = model.kernel
+    # po tabeli historycznej bez eventów: cała przyszła kariera w postaci zamkniętej
+    assert tail_start(kernel, kernel.retirement_year) == CURRENT_YEAR
+    reference = model.evaluate()
+    for summary in (decimal_breakdown(kernel), vectorized_breakdown(kernel)):
+        for key, expected in reference.breakdown.items():
+            assert _relative_diff(summary.breakdown[key], expected) <= NUMPY_ENGINE_RTOL, key
+    fresh = _model(18, 0, 75, False, [], engine="decimal")
+    assert fresh.get_detailed_breakdown() == dict(decimal_breakdown(fresh.kernel).breakdown)
+
+
+@pytest.mark.parametrize("age, exp, retirement_age, is_male, events", CASES)
+def test_fixed_engine_matches_decimal_to_the_grosz(age, exp, retirement_age, is_male, events):
+    model = _model(age, exp, retirement_age, is_male, EVENTS[events], engine="fixed")
+    reference = _model(age, exp, retirement_age, is_male, EVENTS[events], engine="decimal").evaluate()
+    candidate = model.evaluate()
+    tolerance = Decimal(str(_fixed_tolerance_grosze(model))) / 100
+
+    for key, expected in reference.breakdown.items():
+        value = candidate.breakdown[key]
+        if isinstance(expected, int):
+            assert value == expected, key
+        elif key.startswith("replacement_rate"):
+            # iloraz zaokrąglonych do grosza: emerytura / pensja z tego samego wyniku
+            currency = key.rsplit("_", 1)[1]
+            salary = candidate.breakdown[f"final_monthly_salary_{currency}"]
+            assert value == candidate.breakdown[f"monthly_pension_{currency}"] / salary * 100, key
+        else:
+            assert value == value.quantize(Decimal("0.01")), key
+            assert abs(value - expected) <= tolerance, (key, value, expected)
+    assert [p["year"] for p in candidate.timeline] == [p["year"] for p in reference.timeline]
+    for ref, cand in zip(reference.timeline, candidate.timeline):
+        for key, expected in ref.items():
+            if key != "year":
+                assert abs(cand[key] - expected) <= tolerance, (ref["year"], key, cand[key], expected)
+
+
+def test_fixed_engine_is_reproducible():
+    first = _model(30, 8, None, True, EVENTS["overlapping"], engine="fixed").evaluate()
+    second = _model(30, 8, None, True, EVENTS["overlapping"], engine="fixed").evaluate()
+    assert dict(first.breakdown) == dict(second.breakdown)
+    assert [dict(p) for p in first.timeline] == [dict(p) for p in second.timeline]
+
+
+def test_fixed_engine_experience_ratios_are_exact():
+    kernel = _model(40, 15, None, True, []).kernel
+    curve = experience_curve(kernel.alpha, kernel.beta)
+    expected = [to_scaled(curve.decimal_at(k) / curve.decimal_at(15)) for k in range(30)]
+    assert _scaled_ratios(kernel, 30).tolist() == expected
+
+
+@pytest.mark.parametrize("scale", [10**6, RATE_SCALE // 10**3, RATE_SCALE, RATE_SCALE * 10**6])
+def test_fixed_engine_products_are_exact(scale):
+    rng = np.random.default_rng(7)
+    a = rng.integers(0, 10**9, size=200, dtype=np.int64)
+    b = rng.integers(0, 10**14, size=200, dtype=np.int64)
+    expected = [(2 * x * y + scale) // (2 * scale) for x, y in zip(a.tolist(), b.tolist())]
+    assert _mul_round(a, b, scale).tolist() == expected
+    # iloczyny poza zakresem int64 → int Pythona
+    big = np.array([2**62, 3 * 10**15], dtype=np.int64)
+    assert _mul_round(big, b[:2], scale).tolist() == [
+        (2 * x * y + scale) // (2 * scale) for x, y in zip(big.tolist(), b[:2].tolist())
+    ]
+
+
+def _year_by_year(model: PensionModel, years: range, target_year: int, real: bool) -> tuple[Decimal, Decimal]:
+    """Składki lat `years` zwaloryzowane osobno, każda do `target_year` (dawna pętla PensionModel)."""
+    total_i = total_ii = Decimal("0")
+    for year in years:
+        mult = model.contribution_multiplier_for_age(model.age_in_year(year))
+        delta = year - model.current_year
+        if real:
+            monthly = model.salary_in_the_past_or_future_real_with_macro(model.current_salary, delta) * mult
+            total_i += model.valorize_i_pillar_capital_real(model.calculate_annual_contribution_i_pillar(monthly), year, target_year)
+            total_ii += model.index_ii_pillar_capital_real(model.calculate_annual_contribution_ii_pillar(monthly), year, target_year)
+        else:
+            monthly = model.salary_in_the_past_or_future_nominal(model.current_salary, delta) * mult
+            total_i += model.valorize_i_pillar_capital(model.calculate_annual_contribution_i_pillar(monthly), year, target_year)
+            total_ii += model.index_ii_pillar_capital(model.calculate_annual_contribution_ii_pillar(monthly), year, target_year)
+    return total_i, total_ii
+
+
+@pytest.mark.parametrize("age, exp, retirement_age, is_male, events", CASES)
+def test_capital_helpers_match_year_by_year_valorization(age, exp, retirement_age, is_male, events):
+    model = _model(age, exp, retirement_age, is_male, EVENTS[events])
+    cy, retirement_year = model.current_year, model.current_year + model.years_to_standard_retirement
+    acc = (model.accumulated_i_pillar_capital, model.accumulated_ii_pillar_capital)
+    breakdown = decimal_breakdown(model.kernel).breakdown
+    for real, suffix in ((False, "nominal"), (True, "real")):
+        past = model.reconstruct_historical_contributions_real() if real else model.reconstruct_historical_contributions()
+        future = model.project_future_accumulation_real() if real else model.project_future_accumulation()
+        total = model.calculate_total_retirement_capital_real() if real else model.calculate_total_retirement_capital()
+
+        expected_past = [a + p for a, p in zip(acc, _year_by_year(model, range(model.work_start_year, cy), cy, real))]
+        expected_future = _year_by_year(model, range(cy, retirement_year), retirement_year, real)
+        for value, expected in zip((*past, *future), (*expected_past, *expected_future)):
+            # pętla przenosi salda i skumulowany wzrost płac — inna kolejność działań na Decimal
+            assert _relative_diff(value, expected) <= 1e-14, suffix
+        valorized = (model._valorize(f"i_pillar{'_real' if real else ''}", past[0], cy, retirement_year),
+                     model._valorize(f"ii_pillar{'_real' if real else ''}", past[1], cy, retirement_year))
+        for value, expected in zip(total, (valorized[0] + future[0], valorized[1] + future[1])):
+            assert _relative_diff(value, expected) <= 1e-14, suffix
+        assert total == (breakdown[f"i_pillar_capital_{suffix}"], breakdown[f"ii_pillar_capital_{suffix}"])
+    assert model.calculate_monthly_pension() == breakdown["monthly_pension_nominal"]
+    assert _relative_diff(model.calculate_monthly_pension_real(), breakdown["monthly_pension_real"]) <= 1e-25
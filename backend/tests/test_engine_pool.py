@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.api.routes import user_profile
+from backend.api.services import EnginePool
+from backend.benchmarks.stubs import stub_llm
+from backend.config import settings
+
+PREVIEW_URL = "/api/v1/user-profile/pension/preview"
+PAYLOAD = {"current_age": 40, "years_of_experience": 15, "current_monthly_salary": 9000, "alpha": 1.2, "beta": 0.1}
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = EnginePool(workers=1, warm_modules=("backend.api.routes.user_profile",))
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # bez cache odpowiedzi — każde żądanie liczone (w procesie albo w puli)
+    monkeypatch.setattr(settings, "preview_cache_enabled", False)
+    with stub_llm():
+        yield TestClient(app)
+
+
+@pytest.mark.parametrize("query, payload", [
+    ("", PAYLOAD),
+    ("?timeline_format=columnar", PAYLOAD),
+    ("", {**PAYLOAD, "engine": "fixed", "retirement_age": 67}),
+    ("", {**PAYLOAD, "resolution": "month"}),
+    ("", {**PAYLOAD, "simulation_mode": True}),
+])
+def test_pool_returns_the_in_process_preview(client, pool, monkeypatch, query, payload):
+    in_process = client.post(PREVIEW_URL + query, json=payload)
+    assert in_process.status_code == 200
+
+    monkeypatch.setattr(user_profile, "engine_pool", pool)
+    submitted = pool.submitted
+    pooled = client.post(PREVIEW_URL + query, json=payload)
+    assert pooled.status_code == 200
+    assert pool.submitted == submitted + 1
+    assert pooled.content == in_process.content
+    assert pooled.headers["content-type"] == in_process.headers["content-type"]
+
+
+def test_saturated_pool_returns_503(client, monkeypatch):
+    pool = EnginePool(workers=1, max_pending=1, queue_timeout_seconds=0.05)
+    pool._slots = asyncio.Semaphore(0)  # jedyne miejsce zajęte przez trwające zadanie
+    monkeypatch.setattr(user_profile, "engine_pool", pool)
+
+    response = client.post(PREVIEW_URL, json=PAYLOAD)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert "saturated" in response.json()["detail"]
+    assert pool.stats()["rejected"] == 1 and pool.stats()["submitted"] == 0
+    assert pool._executor is None  # odrzucone przed wysłaniem do procesu
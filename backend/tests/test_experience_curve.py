@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from backend.models.calculate_salary.experience_curve import (
+    MAX_EXPERIENCE,
+    ExperienceCurve,
+    experience_curve,
+    experience_curve_stats,
+)
+from backend.models.calculate_salary.experience_multiplier import experience_multiplier
+
+PAIRS = [(1.2, 0.1), (0.8, 0.05), (1.751254898549736, 0.12872950707152356)]
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    experience_curve.cache_clear()
+    yield
+    experience_curve.cache_clear()
+
+
+@pytest.mark.parametrize("alpha, beta", PAIRS)
+def test_cached_curve_matches_direct_computation(alpha, beta):
+    cached = experience_curve(alpha, beta)
+    direct = ExperienceCurve(alpha, beta)
+    np.testing.assert_array_equal(cached.values, direct.values)
+    assert not cached.values.flags.writeable
+    for exp in (0, 1, 17, MAX_EXPERIENCE, MAX_EXPERIENCE + 5):
+        # bit w bit jak wywołanie skalarne
+        assert cached.at(exp) == direct.at(exp) == float(experience_multiplier(exp=exp, alpha=alpha, beta=beta))
+        assert cached.decimal_at(exp) == direct.decimal_at(exp)
+    assert cached.decimal_at(10) == 1 + Decimal(repr(alpha)) * (1 - (-Decimal(repr(beta)) * 10).exp())
+    np.testing.assert_array_equal(cached.head(MAX_EXPERIENCE + 10), experience_multiplier(
+        exp=np.arange(MAX_EXPERIENCE + 10), alpha=alpha, beta=beta
+    ))
+    exp = np.array([0, 3, 40, MAX_EXPERIENCE])
+    np.testing.assert_array_equal(cached.take(exp), direct.values[exp])
+    np.testing.assert_array_equal(cached.take(np.append(exp, 90)), [direct.at(int(e)) for e in (*exp, 90)])
+
+
+def test_curves_are_shared_per_pair():
+    first = experience_curve(1.2, 0.1)
+    assert experience_curve(1.2, 0.1) is first
+    assert experience_curve(0.8, 0.05) is not first
+    assert experience_curve_stats() | {"maxsize": None} == {"hits": 1, "misses": 2, "size": 2, "maxsize": None}
+
+
+def _write_regressions(path, rows):
+    path.write_text("Job_Description,alpha,beta\n" + "".join(f"{name},{a},{b}\n" for name, a, b in rows))
+    return path
+
+
+def test_cache_cleared_when_regressions_reload(tmp_path, restore_data_registry):
+    path = _write_regressions(tmp_path / "regressions.csv", [("kierowca", 0.8, 0.05)])
+    restore_data_registry.configure(regression_path=path)
+    curve = experience_curve(0.8, 0.05)
+    assert experience_curve_stats()["size"] == 1
+
+    # przeładowanie bez zmiany katalogu zachowuje cache
+    restore_data_registry.reload(force=True)
+    assert experience_curve(0.8, 0.05) is curve
+
+    _write_regressions(path, [("kierowca", 0.9, 0.05)])
+    assert restore_data_registry.reload(force=True)
+    assert experience_curve_stats()["size"] == 0
+    assert experience_curve(0.8, 0.05) is not curve
@@ -0,0 +1,126 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.models.PensionModel import PensionModel
+from backend.models.calculate_pension.goal_seek import (
+    AMOUNT_TOLERANCE,
+    MAX_RETIREMENT_AGE,
+    _bisect_integer,
+    _solve_amount,
+    goal_seek,
+)
+
+GOAL_SEEK_URL = "/api/v1/user-profile/pension/goal-seek"
+PAYLOAD = {"current_age": 40, "years_of_experience": 15, "current_monthly_salary": 9000, "alpha": 1.2, "beta": 0.1}
+
+
+def _model(current_year: int = 2025, **kw) -> PensionModel:
+    return PensionModel(
+        current_age=40, years_of_experience=15, current_salary=Decimal("9000"), alpha=1.2, beta=0.1,
+        current_year=current_year, **kw,
+    )
+
+
+def _pension(model: PensionModel, measure: str = "monthly_pension_real", **update) -> float:
+    trial = model.model_copy()
+    for name, value in update.items():
+        setattr(trial, name, value)
+    return float(trial.evaluate().breakdown[measure])
+
+
+def test_bisect_integer_finds_smallest_reaching_value():
+    calls = []
+
+    def f(k: int) -> float:
+        calls.append(k)
+        return k * k
+
+    assert _bisect_integer(f, 0, 100, 50.0)[0] == 8
+    assert _bisect_integer(f, 0, 100, 49.0)[0] == 7
+    assert _bisect_integer(f, 5, 100, 0.0)[0] == 5
+    value, iterations = _bisect_integer(f, 0, 100, 10_001.0)
+    assert value is None and iterations == 1
+    # log2 kroków zamiast przeglądu całego przedziału
+    calls.clear()
+    _bisect_integer(f, 0, 1000, 250_000.0)
+    assert len(calls) <= 12
+
+
+@pytest.mark.parametrize("f, target, expected", [
+    (lambda x: 3.0 * x + 10.0, 1000.0, 330.0),          # liniowa, jak emerytura w pensji
+    (lambda x: x ** 0.5, 70.0, 4900.0),                  # wklęsła
+    (lambda x: max(0.0, x - 1e5) ** 2, 4e6, 102_000.0),  # płaska na początku
+])
+def test_solve_amount_converges(f, target, expected):
+    value, iterations = _solve_amount(f, target, initial=100.0)
+    assert f(value) >= target
+    assert value == pytest.approx(expected, abs=AMOUNT_TOLERANCE)
+    assert iterations < 60
+
+
+def test_solve_amount_bounds():
+    assert _solve_amount(lambda x: x + 5.0, 1.0, initial=10.0) == (0.0, 1)
+    value, _ = _solve_amount(lambda x: 1e-12 * x, 1.0, initial=10.0)
+    assert value is None
+
+
+def test_unreachable_target():
+    model = _model()
+    for variable in ("retirement_age", "current_salary"):
+        solution = goal_seek(model, variable, 1e12)
+        assert solution["reachable"] is False
+        assert solution["value"] is None
+
+    response = TestClient(app).post(GOAL_SEEK_URL, json={
+        **PAYLOAD, "solve_for": "retirement_age", "target_monthly_pension": 1e9,
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["reachable"] is False and body["value"] is None and body["result"] is None
+
+
+@pytest.mark.parametrize("measure", ["monthly_pension_real", "monthly_pension_nominal"])
+def test_solved_salary_reaches_target(measure):
+    model = _model()
+    target = 1.5 * _pension(model, measure)
+    solution = goal_seek(model, "current_salary", target, measure)
+    salary = solution["value"]
+    assert solution["reachable"] and salary > model.current_salary
+    assert _pension(model, measure, current_salary=salary) >= target
+    # grosz mniej już nie wystarcza (do tolerancji solvera)
+    below = salary - Decimal("0.01") - Decimal(repr(AMOUNT_TOLERANCE))
+    assert _pension(model, measure, current_salary=below) < target
+
+
+def test_solved_retirement_age_and_capital_reach_target():
+    model = _model()
+    target = _pension(model, retirement_age=68) - 1.0
+    solution = goal_seek(model, "retirement_age", target)
+    age = solution["value"]
+    assert solution["reachable"] and age == 68
+    assert _pension(model, retirement_age=age) >= target
+    assert _pension(model, retirement_age=age - 1) < target
+    assert age <= MAX_RETIREMENT_AGE
+
+    target = _pension(model) + 300.0
+    capital = goal_seek(model, "accumulated_i_pillar_capital", target)["value"]
+    assert _pension(model, accumulated_i_pillar_capital=capital) >= target
+    # wejściowy model bez zmian
+    assert model.accumulated_i_pillar_capital == Decimal("0")
+
+
+def test_goal_seek_route_result_reaches_target():
+    target = 4000.0
+    response = TestClient(app).post(GOAL_SEEK_URL, json={
+        **PAYLOAD, "solve_for": "current_salary", "target_monthly_pension": target,
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["reachable"]
+    assert body["result"]["monthly_pension_real"] >= target - 0.005
+    direct = _pension(_model(current_year=date.today().year), current_salary=Decimal(repr(body["value"])))
+    assert direct >= target
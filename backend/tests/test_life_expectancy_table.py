@@ -0,0 +1,113 @@
+import os
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from backend.models.PensionModel import PensionModel
+from backend.models.pension_models.LifeExpectancyTable import (
+    LifeExpectancyTable,
+    life_expectancy_months,
+    load_life_table,
+)
+
+YEARS = (2024, 2025, 2026)
+AGES = range(55, 71)
+
+
+def _months(year: int, age: int, month: int) -> Decimal:
+    """Wartość źródłowa w miesiącach (jedno miejsce po przecinku) — różna dla każdej komórki."""
+    return Decimal(3000 - (age - 55) * 120 - month * 10 + (year - 2024) * 7) / 10
+
+
+def _write_csv(path: Path, version: str = "test-1") -> Path:
+    lines = [f"# version: {version}", "publication_year,age," + ",".join(map(str, range(12)))]
+    for year in YEARS:
+        for age in AGES:
+            lines.append(f"{year},{age}," + ",".join(str(_months(year, age, m)) for m in range(12)))
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def table(tmp_path) -> LifeExpectancyTable:
+    return load_life_table(_write_csv(tmp_path / "life.csv"))
+
+
+@pytest.mark.parametrize("year, age, month", [(2024, 55, 0), (2025, 60, 0), (2025, 65, 7), (2026, 70, 11), (2024, 67, 3)])
+def test_lookup_at_sample_ages(table, year, age, month):
+    assert table.months(year, age, month) == _months(year, age, month)
+    if month == 0:
+        assert life_expectancy_months(age, True, year, table) == _months(year, age, 0)
+        assert life_expectancy_months(age, False, year, table) == _months(year, age, 0)
+
+
+def test_lookup_outside_table_uses_nearest_entry(table):
+    assert (table.first_year, table.last_year, table.first_age, table.last_age) == (2024, 2026, 55, 70)
+    assert table.months(1990, 60) == _months(2024, 60, 0)
+    assert table.months(2080, 60) == _months(2026, 60, 0)
+    assert table.months(2025, 40) == _months(2025, 55, 0)
+    assert table.months(2025, 90, 5) == _months(2025, 70, 5)
+
+
+def test_months_array_matches_scalar_lookup(table):
+    years = np.array([2020, 2024, 2025, 2026, 2040, 2025])
+    ages = np.array([60, 55, 65, 70, 67, 80])
+    expected = [float(table.months(int(y), int(a))) for y, a in zip(years, ages)]
+    np.testing.assert_array_equal(table.months_array(years, ages), expected)
+
+
+@pytest.mark.parametrize("age, is_male, months", [(65, True, 19 * 12), (60, False, 28 * 12), (86, True, 12), (90, False, 12)])
+def test_without_table_falls_back_to_84_88_rule(age, is_male, months):
+    assert life_expectancy_months(age, is_male, 2030, None) == Decimal(months)
+
+
+def test_pension_model_divides_by_table_months(table):
+    kwargs = dict(current_age=40, years_of_experience=15, current_salary=Decimal("9000"), alpha=1.2, beta=0.1,
+                  current_year=2025, retirement_age=65)
+    with_table = PensionModel(**kwargs, life_expectancy_table=table)
+    without = PensionModel(**kwargs, life_expectancy_table=None)
+    # przejście w 2050 — ostatnia publikacja (2026)
+    assert with_table.kernel.life_expectancy_months == _months(2026, 65, 0)
+    assert without.kernel.life_expectancy_months == Decimal(19 * 12)
+    assert with_table.kernel.life_expectancy_months_for_age(60) == _months(2026, 60, 0)
+    table_result, rule_result = with_table.evaluate().breakdown, without.evaluate().breakdown
+    assert table_result["total_capital_nominal"] == rule_result["total_capital_nominal"]
+    assert table_result["monthly_pension_nominal"] == (
+        table_result["total_capital_nominal"] / _months(2026, 65, 0)
+    )
+
+
+def test_compiled_file_is_reused_until_csv_changes(tmp_path):
+    source = _write_csv(tmp_path / "life.csv")
+    first = load_life_table(source)
+    compiled = source.with_suffix(".bin")
+    assert compiled.exists() and first.version == "test-1"
+    assert isinstance(first.tenths, np.ndarray) and first.tenths.dtype == np.dtype("<u2")
+    mtime = compiled.stat().st_mtime_ns
+    assert load_life_table(source).digest == first.digest
+    assert compiled.stat().st_mtime_ns == mtime
+
+    _write_csv(source, version="test-2")
+    os.utime(source, ns=(mtime + 10**9, mtime + 10**9))
+    second = load_life_table(source)
+    assert second.version == "test-2" and second.digest != first.digest
+    # binarny plik otwierany bezpośrednio
+    assert LifeExpectancyTable(compiled).months(2025, 65, 7) == _months(2025, 65, 7)
+
+
+def test_malformed_sources_are_rejected(tmp_path):
+    missing_age = tmp_path / "gap.csv"
+    _write_csv(missing_age)
+    missing_age.write_text("\n".join(line for line in missing_age.read_text().splitlines() if not line.startswith("2025,60,")))
+    with pytest.raises(ValueError, match="every publication year"):
+        load_life_table(missing_age)
+    no_version = tmp_path / "no_version.csv"
+    no_version.write_text("\n".join(_write_csv(tmp_path / "ok.csv").read_text().splitlines()[1:]))
+    with pytest.raises(ValueError, match="version"):
+        load_life_table(no_version)
+    not_compiled = tmp_path / "life.bin"
+    not_compiled.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError, match="not a compiled"):
+        load_life_table(not_compiled)
@@ -0,0 +1,116 @@
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from backend.models.pension_models.MacroDataTable import MACRO_COLUMNS, MacroDataTable, load_macro_table
+from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
+from backend.models.pension_models.MacroRateTables import MacroRateTables
+
+# dawny słownik poland_macro_data (literały float podawane do Decimal(...))
+LEGACY_MACRO_DATA = {
+    2005: (0.021, 0.018, 0.039, 0.029),
+    2006: (0.013, 0.022, 0.035, 0.026),
+    2007: (0.025, 0.025, 0.050, 0.038),
+    2008: (0.043, 0.020, 0.063, 0.047),
+    2009: (0.035, 0.015, 0.050, 0.038),
+    2010: (0.026, 0.018, 0.044, 0.033),
+    2011: (0.043, 0.017, 0.060, 0.045),
+    2012: (0.037, 0.012, 0.049, 0.037),
+    2013: (0.009, 0.015, 0.024, 0.018),
+    2014: (0.000, 0.018, 0.018, 0.014),
+    2015: (-0.009, 0.020, 0.011, 0.008),
+    2016: (-0.006, 0.022, 0.016, 0.012),
+    2017: (0.020, 0.024, 0.044, 0.033),
+    2018: (0.016, 0.028, 0.044, 0.033),
+    2019: (0.023, 0.030, 0.053, 0.040),
+    2020: (0.034, 0.008, 0.042, 0.032),
+    2021: (0.051, -0.010, 0.041, 0.031),
+    2022: (0.144, -0.021, 0.123, 0.092),
+    2023: (0.115, 0.011, 0.126, 0.095),
+    2024: (0.037, 0.045, 0.082, 0.062),
+}
+ROWS = {
+    2010: (Decimal("0.02"), Decimal("0.01"), Decimal("0.03"), Decimal("0.025")),
+    2011: (Decimal("0.04"), Decimal("0.02"), Decimal("0.06"), Decimal("0.045")),
+    2012: (Decimal("0.01"), Decimal("0.035"), Decimal("0.045"), Decimal("0.0305")),
+}
+
+
+def _write_csv(path: Path, before: str, after: str) -> Path:
+    lines = [
+        "# version: test",
+        "# precision: 0.001",
+        f"# extrapolate_before: {before}",
+        f"# extrapolate_after: {after}",
+        "year,inflation,real_wage,i_pillar,ii_pillar,note",
+        *(f"{year}," + ",".join(str(v) for v in values) + ",x" for year, values in ROWS.items()),
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_default_csv_reproduces_legacy_dict():
+    table = load_macro_table()
+    assert (table.first_year, table.last_year) == (2005, 2024)
+    tables = MacroRateTables(MacroeconomicFactors(macro_data=table))
+    for year, legacy in LEGACY_MACRO_DATA.items():
+        expected = tuple(Decimal(value).quantize(Decimal("0.001")) for value in legacy)
+        assert table.row(year) == expected
+        # dokładne wartości dziesiętne zamiast rozwinięć binarnych floatów
+        assert table.row(year) == tuple(Decimal(repr(value)) for value in legacy)
+        for name, rate in zip(MACRO_COLUMNS, expected):
+            assert tables.rate(name, year) == rate
+        assert tables.rate("nominal_wage", year) == expected[0] + expected[1]
+    assert table.row(2004) is None and table.row(2025) is None
+
+
+def test_quantizes_to_precision():
+    table = MacroDataTable.build("t", ROWS, precision=Decimal("0.001"))
+    # 0.0305 → 0.030 (half-even)
+    assert table.row(2012)[3] == Decimal("0.030")
+    assert table.row(2010) == (Decimal("0.020"), Decimal("0.010"), Decimal("0.030"), Decimal("0.025"))
+
+
+@pytest.mark.parametrize("before, after", [("defaults", "defaults"), ("hold", "mean"), ("mean", "hold")])
+def test_extrapolation_policies(tmp_path, before, after):
+    table = load_macro_table(_write_csv(tmp_path / "macro.csv", before, after))
+    factors = MacroeconomicFactors(macro_data=table)
+    tables = MacroRateTables(factors)
+    defaults = (
+        factors.inflation_rate,
+        factors.real_wage_growth_rate,
+        factors.i_pillar_indexation_rate,
+        factors.ii_pillar_indexation_rate,
+    )
+    mean = tuple(
+        (sum(table.columns[name], Decimal(0)) / 3).quantize(Decimal("0.001")) for name in MACRO_COLUMNS
+    )
+    expected = {
+        "defaults": {"before": defaults, "after": defaults},
+        "hold": {"before": table.row(2010), "after": table.row(2012)},
+        "mean": {"before": mean, "after": mean},
+    }
+    for side, policy, years in (("before", before, (2000, 2009)), ("after", after, (2013, 2060))):
+        for year in years:
+            rates = tuple(tables.rate(name, year) for name in MACRO_COLUMNS)
+            assert rates == expected[policy][side], (side, year)
+        floats = np.array([tables.float_rates(name, years[0], years[0] + 1)[0] for name in MACRO_COLUMNS])
+        np.testing.assert_allclose(floats, [float(v) for v in expected[policy][side]])
+    # w zakresie danych — zawsze wiersz tabeli
+    assert tuple(tables.rate(name, 2011) for name in MACRO_COLUMNS) == table.row(2011)
+    # mnożnik wieloletni przez granicę danych = iloczyn stóp rok po roku
+    growth = [1 + tables.rate("inflation", year) for year in range(2008, 2016)]
+    assert float(tables.factor("inflation", 2008, 2016)) == pytest.approx(float(np.prod(growth)), rel=1e-15)
+
+
+def test_malformed_tables_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="consecutive"):
+        MacroDataTable.build("t", {2010: ROWS[2010], 2012: ROWS[2012]})
+    with pytest.raises(ValueError, match="extrapolation policy"):
+        load_macro_table(_write_csv(tmp_path / "bad.csv", "nearest", "defaults"))
+    path = tmp_path / "no_version.csv"
+    path.write_text("year,inflation,real_wage,i_pillar,ii_pillar\n2010,0.01,0.01,0.01,0.01\n")
+    with pytest.raises(ValueError, match="version"):
+        load_macro_table(path)
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.models.calculate_pension.monte_carlo import _process_parameters, calibrate_ar1
+from backend.models.pension_models.MonteCarloConfig import MonteCarloConfig
+
+MONTE_CARLO_URL = "/api/v1/user-profile/pension/monte-carlo"
+
+
+def _ar1_pair(n: int, phi: tuple[float, float], rho: float, seed: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    z1 = rng.standard_normal(n)
+    z2 = rho * z1 + np.sqrt(1 - rho * rho) * rng.standard_normal(n)
+    x = np.zeros(n)
+    y = np.zeros(n)
+    for t in range(1, n):
+        x[t] = phi[0] * x[t - 1] + 0.01 * z1[t]
+        y[t] = phi[1] * y[t - 1] + 0.02 * z2[t]
+    return 0.025 + x, 0.02 + y
+
+
+def _tables(inflation: np.ndarray, real_wage: np.ndarray) -> SimpleNamespace:
+    return SimpleNamespace(series={
+        "inflation": SimpleNamespace(floats=inflation),
+        "real_wage": SimpleNamespace(floats=real_wage),
+    })
+
+
+def test_calibrate_ar1_returns_residuals():
+    inflation, _ = _ar1_pair(200, (0.7, 0.4), rho=0.0)
+    phi, sigma, residuals = calibrate_ar1(inflation)
+    d = inflation - inflation.mean()
+    np.testing.assert_allclose(residuals, d[1:] - phi * d[:-1])
+    assert sigma == pytest.approx(np.std(residuals, ddof=1))
+    assert calibrate_ar1(inflation[:2])[2].size == 0
+
+
+def test_shock_correlation_is_residual_correlation():
+    inflation, real_wage = _ar1_pair(5000, (0.95, 0.1), rho=0.6)
+    params = _process_parameters(_tables(inflation, real_wage), MonteCarloConfig())
+    residuals = calibrate_ar1(inflation)[2], calibrate_ar1(real_wage)[2]
+    assert params["rho"] == pytest.approx(np.corrcoef(*residuals)[0, 1])
+    # reszty odtwarzają korelację szoków; różnice szeregów przy różnych phi ją zaniżają (~0.46)
+    assert params["rho"] == pytest.approx(0.6, abs=0.03)
+    differences = np.diff(inflation - inflation.mean()), np.diff(real_wage - real_wage.mean())
+    assert np.corrcoef(*differences)[0, 1] < 0.5
+
+
+def test_shock_correlation_override_and_short_history():
+    inflation, real_wage = _ar1_pair(50, (0.8, 0.5), rho=0.6)
+    assert _process_parameters(_tables(inflation, real_wage), MonteCarloConfig(shock_correlation=-0.2))["rho"] == -0.2
+    assert _process_parameters(_tables(inflation[:2], real_wage[:2]), MonteCarloConfig())["rho"] == 0.0
+
+
+@pytest.mark.parametrize("options, status", [
+    ({}, 200),
+    ({"engine": "numpy"}, 200),
+    ({"engine": "decimal"}, 422),
+    ({"engine": "fixed"}, 422),
+    ({"resolution": "month"}, 422),
+])
+def test_monte_carlo_route_rejects_unsupported_engine_and_resolution(options, status):
+    payload = {"current_age": 40, "years_of_experience": 15, "current_monthly_salary": 9000, "alpha": 1.2, "beta": 0.1}
+    response = TestClient(app).post(MONTE_CARLO_URL, json={**payload, **options, "n_paths": 50, "seed": 1})
+    assert response.status_code == status
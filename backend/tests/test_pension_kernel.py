@@ -0,0 +1,73 @@
+import dataclasses
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+from backend.models.PensionModel import PensionModel
+from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
+from backend.models.pension_models.PensionKernel import life_expectancy_months
+
+
+def _model(**kw) -> PensionModel:
+    return PensionModel(
+        current_age=40, years_of_experience=15, current_salary=Decimal("9000"), alpha=1.2, beta=0.1,
+        current_year=2025, **kw,
+    )
+
+
+def test_kernel_is_immutable():
+    kernel = _model().kernel
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        kernel.current_salary = Decimal("1")
+    with pytest.raises((AttributeError, TypeError)):
+        kernel.extra = 1  # __slots__ — bez __dict__
+    assert not hasattr(kernel, "__dict__")
+
+
+def test_kernel_snapshot_of_derived_values():
+    model = _model(is_male=False, retirement_age=62)
+    kernel = model.kernel
+    assert kernel.effective_retirement_age == model.effective_retirement_age == 62
+    assert kernel.years_to_standard_retirement == 22
+    assert kernel.retirement_year == 2047
+    assert kernel.work_start_year == 2010
+    assert kernel.birth_year == 1985
+    assert kernel.life_expectancy_months == life_expectancy_months(62, False, 2047, model.life_expectancy_table)
+    assert kernel.rate_tables is model.rate_tables
+    assert kernel.contribution_multipliers is model.contribution_multipliers
+    # snapshot jest budowany raz i współdzielony między odczytami
+    assert model.kernel is kernel
+
+
+@pytest.mark.parametrize("name, value, check", [
+    ("current_salary", Decimal("12000"), lambda k: k.current_salary == Decimal("12000")),
+    ("retirement_age", 67, lambda k: k.effective_retirement_age == 67 and k.retirement_year == 2052),
+    ("is_male", False, lambda k: not k.is_male),
+    (
+        "non_functional_events",
+        [NonFunctionalEvent(reason="przerwa", start_age=45, end_age=47, basis_zero=True)],
+        lambda k: k.contribution_multipliers.float_vector(np.arange(44, 48)).tolist() == [1.0, 0.0, 0.0, 1.0],
+    ),
+])
+def test_setattr_rebuilds_snapshot(name, value, check):
+    model = _model()
+    before = model.kernel
+    snapshot = {f.name: getattr(before, f.name) for f in dataclasses.fields(before)}
+    summary = model.evaluate_summary()
+    setattr(model, name, value)
+    after = model.kernel
+    assert after is not before
+    assert check(after)
+    # stary snapshot (np. trzymany przez trwające obliczenie) pozostaje bez zmian
+    assert all(getattr(before, key) is old for key, old in snapshot.items())
+    assert model.evaluate_summary() is not summary
+
+
+def test_setattr_on_macro_factors_rebuilds_rate_tables():
+    model = _model()
+    before = model.kernel
+    model.macroeconomic_factors = MacroeconomicFactors(inflation_rate=Decimal("0.05"))
+    assert model.kernel.rate_tables is not before.rate_tables
+    assert model.kernel.contribution_multipliers is before.contribution_multipliers
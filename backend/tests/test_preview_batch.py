@@ -0,0 +1,75 @@
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.api.routes import user_profile
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+from backend.models.PensionModel import PensionModel
+from backend.models.calculate_pension.batch_engine import batch_evaluate
+from backend.models.calculate_pension.vectorized_engine import NUMPY_ENGINE_RTOL, vectorized_evaluate
+
+BATCH_URL = "/api/v1/user-profile/pension/preview/batch"
+PAYLOAD = {"current_age": 40, "years_of_experience": 15, "current_monthly_salary": 9000, "alpha": 1.2, "beta": 0.1}
+
+
+def _kernels():
+    events = [
+        [],
+        [NonFunctionalEvent(reason="1/2 etatu", start_age=30, end_age=45, contrib_multiplier=0.5)],
+        [NonFunctionalEvent(reason="przerwa", start_age=50, end_age=52, basis_zero=True),
+         NonFunctionalEvent(reason="1/4 etatu", start_age=51, end_age=55, contrib_multiplier=0.25)],
+    ]
+    return [
+        PensionModel(
+            current_age=age,
+            years_of_experience=exp,
+            current_salary=Decimal(5000 + 700 * i),
+            is_male=i % 2 == 0,
+            alpha=(1.2, 0.8, 1.2)[i % 3],
+            beta=(0.1, 0.15, 0.1)[i % 3],
+            retirement_age=(None, 67)[i % 2],
+            current_year=2025,
+            accumulated_i_pillar_capital=Decimal(1000 * exp),
+            non_functional_events=events[i % 3],
+        ).kernel
+        for i, (age, exp) in enumerate([(22, 0), (35, 10), (47, 25), (58, 36), (29, 4), (63, 40)])
+    ]
+
+
+def test_batch_matches_numpy_engine():
+    kernels = _kernels()
+    for kernel, batched in zip(kernels, batch_evaluate(kernels)):
+        single = vectorized_evaluate(kernel)
+        assert dict(batched.breakdown) == pytest.approx(dict(single.breakdown), rel=NUMPY_ENGINE_RTOL)
+        assert len(batched.timeline) == len(single.timeline)
+        for cand, ref in zip(batched.timeline, single.timeline):
+            assert dict(cand) == pytest.approx(dict(ref), rel=NUMPY_ENGINE_RTOL)
+
+
+def test_batch_isolates_failing_items(monkeypatch):
+    def failing_on_salary(kernels):
+        if any(k.current_salary == Decimal("6666") for k in kernels):
+            raise RuntimeError("boom")
+        return batch_evaluate(kernels)
+
+    monkeypatch.setattr(user_profile, "batch_evaluate", failing_on_salary)
+    payload = [
+        PAYLOAD,
+        {**PAYLOAD, "current_monthly_salary": 6666},
+        {**PAYLOAD, "resolution": "month"},
+        {**PAYLOAD, "current_age": 45},
+        {**PAYLOAD, "engine": "decimal"},
+        {**PAYLOAD, "engine": "fixed"},
+        {**PAYLOAD, "engine": "numpy"},
+    ]
+    response = TestClient(app).post(BATCH_URL, json=payload)
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["index"] for item in items] == list(range(7))
+    assert items[0]["result"] and items[3]["result"] and items[6]["result"] == items[0]["result"]
+    assert items[1]["result"] is None and items[1]["error"] == "evaluation failed (RuntimeError)"
+    assert items[2]["result"] is None and "resolution" in items[2]["error"]
+    for item in items[4:6]:
+        assert item["result"] is None and "engine=" in item["error"]
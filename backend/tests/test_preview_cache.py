@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.api.services import preview_cache
+
+PREVIEW_URL = "/api/v1/user-profile/pension/preview"
+PAYLOAD = {"current_age": 40, "years_of_experience": 15, "current_monthly_salary": 9000, "alpha": 1.2, "beta": 0.1}
+
+
+def _write_life_table(path: Path, version: str, scale: float) -> None:
+    lines = [f"# version: {version}", "publication_year,age," + ",".join(map(str, range(12)))]
+    for year in (2024, 2025):
+        for age in range(55, 71):
+            months = 300.0 - (age - 55) * 12
+            lines.append(f"{year},{age}," + ",".join(f"{scale * (months - m):.1f}" for m in range(12)))
+    path.write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def client():
+    preview_cache.clear()
+    yield TestClient(app)  # bez lifespan: rejestr danych konfiguruje test
+    preview_cache.clear()
+
+
+def test_preview_cache_follows_life_table_reload(client, restore_data_registry, tmp_path):
+    table = tmp_path / "life.csv"
+    _write_life_table(table, "v1", scale=2.0)
+    restore_data_registry.configure(life_expectancy_path=table)
+
+    first = client.post(PREVIEW_URL, json=PAYLOAD)
+    assert first.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+    assert client.post(PREVIEW_URL, json=PAYLOAD).headers["X-Cache"] == "HIT"
+
+    version = restore_data_registry.current().version
+    _write_life_table(table, "v2", scale=1.0)
+    assert restore_data_registry.reload(force=True)
+    assert restore_data_registry.current().version != version
+
+    second = client.post(PREVIEW_URL, json=PAYLOAD)
+    assert second.headers["X-Cache"] == "MISS"
+    assert second.json()["monthly_pension_real"] == pytest.approx(2 * first.json()["monthly_pension_real"], rel=1e-3)
+
+    preview_cache.clear()
+    fresh = client.post(PREVIEW_URL, json=PAYLOAD)
+    assert fresh.json() == second.json()
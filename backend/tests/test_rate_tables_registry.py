@@ -0,0 +1,39 @@
+from decimal import Decimal
+
+from backend.models.pension_models.MacroeconomicFactors import MacroeconomicFactors
+from backend.models.pension_models.rate_tables_registry import RateTablesRegistry, macro_factors_key
+
+
+def _factors(inflation: str = "0.025") -> MacroeconomicFactors:
+    return MacroeconomicFactors(inflation_rate=Decimal(inflation))
+
+
+def test_equal_contents_share_one_table():
+    registry = RateTablesRegistry(maxsize=4)
+    first = registry.get(_factors())
+    # osobne instancje o tej samej treści → ta sama tablica
+    assert registry.get(_factors()) is first
+    assert registry.get(_factors()) is first
+    assert macro_factors_key(_factors()) == macro_factors_key(_factors())
+    assert registry.stats() == {"hits": 2, "misses": 1, "evicted": 0, "size": 1, "maxsize": 4}
+
+    other = registry.get(_factors("0.03"))
+    assert other is not first
+    assert registry.stats()["misses"] == 2
+
+
+def test_least_recently_used_table_is_evicted():
+    registry = RateTablesRegistry(maxsize=2)
+    a = registry.get(_factors("0.01"))
+    registry.get(_factors("0.02"))
+    registry.get(_factors("0.01"))  # a staje się ostatnio użytą
+    registry.get(_factors("0.03"))  # wypiera 0.02
+    assert registry.stats() == {"hits": 1, "misses": 3, "evicted": 1, "size": 2, "maxsize": 2}
+
+    assert registry.get(_factors("0.01")) is a
+    registry.get(_factors("0.02"))
+    stats = registry.stats()
+    assert (stats["hits"], stats["misses"], stats["evicted"]) == (2, 4, 2)
+
+    registry.clear()
+    assert registry.stats() == {"hits": 0, "misses": 0, "evicted": 0, "size": 0, "maxsize": 2}
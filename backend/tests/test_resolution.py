@@ -0,0 +1,64 @@
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from backend.api.main import app
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+from backend.models.PensionModel import PensionModel
+
+PREFIX = "/api/v1/user-profile"
+PAYLOAD = {"current_age": 40, "years_of_experience": 15, "current_monthly_salary": 9000, "alpha": 1.2, "beta": 0.1}
+SUB_YEAR = NonFunctionalEvent(reason="L4", start_age=45, start_month=3, end_age=45, end_month=8, contrib_multiplier=0.8)
+
+
+def _model(**kw) -> PensionModel:
+    return PensionModel(
+        current_age=40, years_of_experience=15, current_salary=Decimal("9000"), alpha=1.2, beta=0.1,
+        current_year=2025, **kw,
+    )
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_month_resolution_defaults_to_numpy_and_rejects_other_engines(client):
+    assert _model(resolution="month").engine == "numpy"
+    for engine in ("decimal", "fixed"):
+        with pytest.raises(ValidationError, match="resolution='month'"):
+            _model(resolution="month", engine=engine)
+
+    assert client.post(f"{PREFIX}/pension/preview", json={**PAYLOAD, "resolution": "month"}).status_code == 200
+    response = client.post(f"{PREFIX}/pension/preview", json={**PAYLOAD, "resolution": "month", "engine": "decimal"})
+    assert response.status_code == 422
+    assert "resolution='month'" in response.text
+
+
+def test_yearly_resolution_rejects_month_bounds():
+    with pytest.raises(ValueError, match="month bounds"):
+        _model(non_functional_events=[SUB_YEAR]).evaluate()
+    # w trybie miesięcznym ten sam event jest liczony
+    assert _model(non_functional_events=[SUB_YEAR], resolution="month").evaluate().breakdown
+
+    whole_years = NonFunctionalEvent(reason="przerwa", start_age=45, end_age=47, basis_zero=True)
+    assert _model(non_functional_events=[whole_years]).evaluate().breakdown
+
+
+def test_whatif_session_rejects_month_bounds(client):
+    session = client.post(f"{PREFIX}/pension/sessions", json=PAYLOAD).json()
+    response = client.patch(
+        f"{PREFIX}/pension/sessions/{session['session_id']}",
+        json={"add_events": [SUB_YEAR.model_dump()]},
+    )
+    assert response.status_code == 422
+    assert "month bounds" in response.json()["detail"]
+    # stan sesji bez zmian — kolejna poprawna edycja przechodzi od tej samej wersji
+    ok = client.patch(
+        f"{PREFIX}/pension/sessions/{session['session_id']}",
+        json={"add_events": [{"reason": "przerwa", "start_age": 45, "end_age": 47, "basis_zero": True}]},
+    )
+    assert ok.status_code == 200
+    assert ok.json()["version"] == session["version"] + 1
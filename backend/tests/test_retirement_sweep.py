@@ -0,0 +1,70 @@
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+from backend.models.PensionModel import PensionModel
+from backend.models.calculate_pension.retirement_sweep import model_retirement_age_sweep
+from backend.models.calculate_pension.vectorized_engine import NUMPY_ENGINE_RTOL
+
+SWEEP_URL = "/api/v1/user-profile/pension/retirement-sweep"
+PREVIEW_URL = "/api/v1/user-profile/pension/preview"
+PAYLOAD = {"current_age": 35, "years_of_experience": 10, "current_monthly_salary": 8000, "alpha": 1.2, "beta": 0.1}
+AGES = range(60, 71)
+POINT_KEYS = (
+    "total_capital_nominal",
+    "total_capital_real",
+    "monthly_pension_nominal",
+    "monthly_pension_real",
+    "replacement_rate_percent_nominal",
+    "replacement_rate_percent_real",
+)
+
+WHOLE_YEARS = [NonFunctionalEvent(reason="1/2 etatu", start_age=40, end_age=44, contrib_multiplier=0.5)]
+SUB_YEAR = [NonFunctionalEvent(reason="L4", start_age=40, start_month=3, end_age=41, end_month=8, basis_zero=True)]
+
+
+def _model(**kw) -> PensionModel:
+    return PensionModel(
+        current_age=35, years_of_experience=10, current_salary=Decimal("8000"), alpha=1.2, beta=0.1,
+        current_year=2025, **kw,
+    )
+
+
+@pytest.mark.parametrize("engine, resolution, events, rel", [
+    ("numpy", "year", WHOLE_YEARS, NUMPY_ENGINE_RTOL),
+    ("decimal", "year", WHOLE_YEARS, 1e-12),
+    ("fixed", "year", WHOLE_YEARS, 0),
+    ("numpy", "month", SUB_YEAR, 0),
+])
+def test_sweep_matches_evaluate_per_age(engine, resolution, events, rel):
+    kw = dict(engine=engine, resolution=resolution, non_functional_events=events)
+    points = model_retirement_age_sweep(_model(**kw), AGES)
+    assert [p["retirement_age"] for p in points] == list(AGES)
+    for point in points:
+        breakdown = _model(retirement_age=point["retirement_age"], **kw).evaluate().breakdown
+        assert point["years_to_retirement"] == breakdown["years_to_retirement"]
+        for key in POINT_KEYS:
+            assert point[key] == pytest.approx(float(breakdown[key]), rel=rel), key
+
+
+@pytest.mark.parametrize("options", [{}, {"engine": "decimal"}, {"resolution": "month"}])
+def test_sweep_route_matches_preview(options):
+    client = TestClient(app)
+    response = client.post(SWEEP_URL, json={**PAYLOAD, **options, "retirement_age_from": 63, "retirement_age_to": 67})
+    assert response.status_code == 200
+    points = response.json()["points"]
+    assert len(points) == 5
+    for point in points:
+        preview = client.post(PREVIEW_URL, json={**PAYLOAD, **options, "retirement_age": point["retirement_age"]})
+        for key in POINT_KEYS:
+            assert point[key] == pytest.approx(preview.json()[key], abs=0.011), key
+
+
+def test_sweep_honours_month_bounds():
+    # ten sam event w przeglądzie i w pojedynczej ewaluacji (wcześniej miesiące były pomijane)
+    with_months = model_retirement_age_sweep(_model(resolution="month", non_functional_events=SUB_YEAR), [65])[0]
+    without = model_retirement_age_sweep(_model(resolution="month"), [65])[0]
+    assert with_months["monthly_pension_real"] < without["monthly_pension_real"]
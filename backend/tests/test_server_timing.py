@@ -0,0 +1,82 @@
+import contextvars
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.main import server_timing
+from backend.api.routes import router
+from backend.api.services import preview_cache
+from backend.benchmarks.stubs import stub_llm
+from backend.utils.timing import PhaseTimings, current_timings, phase, start_timings
+
+PREVIEW_URL = "/api/v1/user-profile/pension/preview"
+SALARY_URL = "/api/v1/salary/calculate"
+PAYLOAD = {"current_age": 40, "years_of_experience": 15, "current_monthly_salary": 9000, "alpha": 1.2, "beta": 0.1}
+
+
+@pytest.fixture
+def client():
+    # aplikacja z tym samym routerem i middleware, jak main przy timing_enabled=true
+    app = FastAPI()
+    app.include_router(router)
+    app.middleware("http")(server_timing)
+    preview_cache.clear()
+    with stub_llm():
+        yield TestClient(app)
+    preview_cache.clear()
+
+
+def _phases(response) -> dict[str, float]:
+    entries = [entry.split(";dur=") for entry in response.headers["Server-Timing"].split(", ")]
+    return {name: float(duration) for name, duration in entries}
+
+
+def test_preview_reports_evaluation_and_response_phases(client, caplog):
+    with caplog.at_level(logging.INFO, logger="backend.api.timing"):
+        response = client.post(PREVIEW_URL, json={**PAYLOAD, "simulation_mode": True})
+    assert response.status_code == 200
+    phases = _phases(response)
+    assert {"llm_events", "pension_evaluate", "response_build", "total"} <= set(phases)
+    assert all(duration >= 0 for duration in phases.values())
+    assert phases["total"] >= phases["pension_evaluate"]
+
+    line = json.loads(caplog.records[-1].getMessage())
+    assert line["event"] == "request_timing" and line["path"] == PREVIEW_URL and line["status"] == 200
+    assert set(line["phases_ms"]) == set(phases) - {"total"}
+
+
+def test_cached_preview_reports_cache_lookup(client):
+    client.post(PREVIEW_URL, json=PAYLOAD)
+    response = client.post(PREVIEW_URL, json=PAYLOAD)
+    assert response.headers["X-Cache"] == "HIT"
+    assert set(_phases(response)) == {"cache_lookup", "total"}
+
+
+def test_salary_reports_llm_phases(client):
+    payload = {"sex": "male", "industry": "IT", "city": "Warszawa", "age": 35, "career_end": 65}
+    response = client.post(SALARY_URL, json=payload)
+    assert response.status_code == 200
+    assert {"classify_job", "estimated_salary", "total"} <= set(_phases(response))
+
+
+def _two_phases() -> PhaseTimings:
+    timings = start_timings()
+    with phase("a"):
+        pass
+    with phase("a"):
+        pass
+    return timings
+
+
+def test_phase_is_noop_without_collector():
+    with phase("unbound"):
+        pass
+    assert current_timings() is None
+    # osobny kontekst — kolektor nie przecieka do kolejnych testów
+    timings = contextvars.copy_context().run(_two_phases)
+    assert list(timings.phases) == ["a"]
+    assert current_timings() is None
+    assert PhaseTimings().server_timing_header(1.5) == "total;dur=1.50"
@@ -0,0 +1,139 @@
+import importlib
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.main import app
+from backend.api.services import WhatIfSessionStore, whatif_sessions
+from backend.llm.random_nonfunctional_periods import NonFunctionalEvent
+from backend.models.PensionModel import PensionModel
+from backend.models.calculate_pension.incremental import IncrementalProjection
+from backend.models.calculate_pension.vectorized_engine import NUMPY_ENGINE_RTOL
+
+SESSIONS_URL = "/api/v1/user-profile/pension/sessions"
+PREVIEW_URL = "/api/v1/user-profile/pension/preview"
+PAYLOAD = {"current_age": 40, "years_of_experience": 15, "current_monthly_salary": 9000, "alpha": 1.2, "beta": 0.1}
+# moduł, nie obiekt store o tej samej nazwie eksportowany z pakietu
+store_module = importlib.import_module("backend.api.services.whatif_sessions")
+COLUMNS = ("i_pillar_nominal", "ii_pillar_nominal", "total_nominal", "annual_salary_nominal", "total_real")
+
+
+def _model(**kw) -> PensionModel:
+    inputs = dict(current_age=40, years_of_experience=15, current_salary=Decimal("9000"), alpha=1.2, beta=0.1)
+    return PensionModel(**{**inputs, **kw}, current_year=2025, engine="numpy")
+
+
+def _splice(timeline: dict, diff: dict) -> dict:
+    """Oś czasu klienta po zastosowaniu fragmentu z `apply` (rok → wartości)."""
+    kept = {year: row for year, row in timeline.items() if year <= diff["last_year"]}
+    if diff["from_year"] is not None:
+        kept = {year: row for year, row in kept.items() if year < diff["from_year"]}
+        columns = diff["columns"]
+        for i, year in enumerate(columns["year"].tolist()):
+            kept[year] = {key: float(columns[key][i]) for key in COLUMNS}
+    return kept
+
+
+def _rows(columns) -> dict:
+    return {year: {key: float(columns[key][i]) for key in COLUMNS} for i, year in enumerate(columns["year"].tolist())}
+
+
+def _assert_matches_evaluate(timeline: dict, breakdown: dict, model: PensionModel) -> None:
+    evaluation = model.evaluate()
+    reference = _rows(evaluation.timeline_columns())
+    assert sorted(timeline) == sorted(reference)
+    for year, row in reference.items():
+        assert timeline[year] == pytest.approx(row, rel=NUMPY_ENGINE_RTOL), year
+    assert breakdown == pytest.approx(dict(evaluation.breakdown), rel=NUMPY_ENGINE_RTOL)
+
+
+def test_spliced_timeline_matches_full_evaluate():
+    part_time = NonFunctionalEvent(reason="1/2 etatu", start_age=45, end_age=50, contrib_multiplier=0.5)
+    gap = NonFunctionalEvent(reason="przerwa", start_age=55, end_age=57, basis_zero=True)
+    projection = IncrementalProjection(_model().kernel)
+    timeline = _rows(projection.timeline_columns())
+
+    edits = [
+        ({"current_salary": Decimal("11000")}, {"current_salary": Decimal("11000")}),
+        ({"add_events": [part_time]}, {"non_functional_events": [part_time]}),
+        ({"retirement_age": 68}, {"retirement_age": 68}),
+        ({"add_events": [gap]}, {"non_functional_events": [part_time, gap]}),
+        ({"retirement_age": 62}, {"retirement_age": 62}),
+        ({"remove_events": [0]}, {"non_functional_events": [gap]}),
+        ({"retirement_age": 85}, {"retirement_age": 85}),  # poza horyzontem — przebudowa stanu
+    ]
+    inputs = {}
+    for delta, update in edits:
+        diff = projection.apply(**delta)
+        inputs.update(update)
+        timeline = _splice(timeline, diff)
+        _assert_matches_evaluate(timeline, diff["breakdown"], _model(**inputs))
+
+
+def test_edit_recomputes_only_from_the_first_affected_year():
+    projection = IncrementalProjection(_model().kernel)
+    event = NonFunctionalEvent(reason="przerwa", start_age=50, end_age=52, basis_zero=True)
+    diff = projection.apply(add_events=[event])
+    assert diff["from_year"] == 2025 + (51 - 40)
+    assert diff["columns"]["year"][0] == diff["from_year"]
+    assert projection.apply(current_salary=projection.kernel.current_salary)["from_year"] is None
+
+
+def test_store_purges_expired_sessions(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(store_module.time, "monotonic", lambda: clock[0])
+    store = WhatIfSessionStore(max_entries=10, ttl_seconds=60.0)
+    projection = IncrementalProjection(_model().kernel)
+    old_ids = [store.create(projection)[0] for _ in range(3)]
+    clock[0] += 30.0
+    fresh_id, _ = store.create(projection)
+
+    clock[0] += 45.0  # trzy pierwsze wygasły, czwarta jeszcze nie
+    store.create(projection)
+    assert store.stats()["size"] == 2 and store.stats()["expired"] == 3
+    assert all(store.get(session_id) is None for session_id in old_ids)
+    assert store.get(fresh_id) is not None
+
+    clock[0] += 61.0
+    assert store.get("unknown") is None
+    assert store.stats()["size"] == 0 and store.stats()["expired"] == 5
+
+
+def _write_life_table(path: Path, version: str, scale: float) -> None:
+    lines = [f"# version: {version}", "publication_year,age," + ",".join(map(str, range(12)))]
+    for year in range(2024, 2061):
+        for age in range(55, 71):
+            months = 300.0 - (age - 55) * 12
+            lines.append(f"{year},{age}," + ",".join(f"{scale * (months - m):.1f}" for m in range(12)))
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_session_is_rebuilt_after_data_reload(restore_data_registry, tmp_path):
+    client = TestClient(app)
+    table = tmp_path / "life.csv"
+    _write_life_table(table, "v1", scale=2.0)
+    restore_data_registry.configure(life_expectancy_path=table)
+
+    session = client.post(SESSIONS_URL, json=PAYLOAD).json()
+    session_id = session["session_id"]
+    assert whatif_sessions.get(session_id).data_version == restore_data_registry.current().version
+
+    _write_life_table(table, "v2", scale=1.0)
+    assert restore_data_registry.reload(force=True)
+
+    response = client.patch(f"{SESSIONS_URL}/{session_id}", json={"current_monthly_salary": 10000})
+    assert response.status_code == 200
+    body = response.json()
+    preview = client.post(PREVIEW_URL, json={**PAYLOAD, "current_monthly_salary": 10000, "engine": "numpy"}).json()
+    assert body["summary"]["monthly_pension_real"] == pytest.approx(preview["monthly_pension_real"], abs=0.011)
+    # cała oś czasu — wartości sprzed przeładowania są nieaktualne
+    assert body["timeline"]["from_year"] == session["preview"]["timeline"]["years"][0]
+    np.testing.assert_allclose(body["timeline"]["columns"]["total"], [p["total"] for p in preview["timeline"]], atol=0.011)
+    assert whatif_sessions.get(session_id).data_version == restore_data_registry.current().version
+
+    # kolejna edycja na tej samej wersji danych znów jest przyrostowa
+    response = client.patch(f"{SESSIONS_URL}/{session_id}", json={"retirement_age": 67})
+    assert response.json()["timeline"]["from_year"] > body["timeline"]["from_year"]
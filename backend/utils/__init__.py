@@ -1,3 +1,4 @@
 from .use_cwd import use_cwd
+from .timing import PhaseTimings, current_timings, phase, start_timings
 
-__all__ = ["use_cwd"]
+__all__ = ["use_cwd", "PhaseTimings", "current_timings", "phase", "start_timings"]
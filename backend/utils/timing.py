@@ -0,0 +1,56 @@
+"""
+Lightweight per-request phase timers.
+
+A PhaseTimings collector is bound to the current request through a context variable
+(propagated into run_in_threadpool workers). `phase(name)` is a no-op unless a
+collector is bound, so instrumented code costs one context-variable lookup when
+timing is disabled.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class PhaseTimings:
+    """Accumulated wall-clock duration (ms) per phase name, in first-seen order."""
+
+    __slots__ = ("phases",)
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+
+    def add(self, name: str, duration_ms: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + duration_ms
+
+    def server_timing_header(self, total_ms: Optional[float] = None) -> str:
+        entries = [f"{name};dur={ms:.2f}" for name, ms in self.phases.items()]
+        if total_ms is not None:
+            entries.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[Optional[PhaseTimings]] = ContextVar("phase_timings", default=None)
+
+
+def start_timings() -> PhaseTimings:
+    timings = PhaseTimings()
+    _current.set(timings)
+    return timings
+
+
+def current_timings() -> Optional[PhaseTimings]:
+    return _current.get()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, (time.perf_counter() - start) * 1000.0)